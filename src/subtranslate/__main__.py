@@ -18,7 +18,8 @@ from . import __version__
 def main() -> int:
     """Entry point for the application."""
     parser = argparse.ArgumentParser(
-        description=f"SubtranSlate v{__version__} - A tool for translating subtitle files."
+        prog="subtranslate",
+        description=f"SubtranSlate v{__version__} - A tool for translating subtitle files.",
     )
     parser.add_argument("--version", action="store_true", help="Print version and exit")
     parser.add_argument(
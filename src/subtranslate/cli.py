@@ -4,23 +4,23 @@ Command-line interface for SubtranSlate.
 """
 
 import argparse
-import glob
+import functools
 import logging
 import os
 import sys
 import traceback
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
-from .core.main import SubtitleTranslator
-from .core.subtitle import SubtitleError
-from .core.translation import TranslationError
+from .core.subtitle import SubtitleError, find_subtitle_files
 from .utilities.encoding_converter import (
     COMMON_ENCODINGS,
     convert_subtitle_encoding,
     convert_to_multiple_encodings,
     detect_encoding,
     get_recommended_encodings,
+    strip_encoding_suffix,
 )
 
 # Configure logging
@@ -29,41 +29,42 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+_COMMANDS = frozenset({"translate", "encode"})
 
-def parse_args(args: List[str]) -> argparse.Namespace:
-    """
-    Parse command-line arguments.
+# Target languages that separate words with spaces
+_SPACE_LANGS = frozenset({"fr", "en", "de", "es", "it", "pt", "ru"})
 
-    Args:
-        args: Command-line arguments
 
-    Returns:
-        Parsed arguments
-    """
-    parser = argparse.ArgumentParser(
-        description="SubtranSlate - Translate subtitle files from one language to another."
+def _add_batch_arguments(parser: argparse.ArgumentParser) -> None:
+    """Add the batch processing options shared by both commands."""
+    parser.add_argument(
+        "--batch",
+        action="store_true",
+        default=False,
+        help="Process input as directory containing multiple subtitle files",
     )
-
-    subparsers = parser.add_subparsers(dest="command", help="Commands")
-
-    # Translate command
-    translate_parser = subparsers.add_parser(
-        "translate", help="Translate subtitle files"
+    parser.add_argument(
+        "--pattern",
+        default="*.srt",
+        help="File pattern for batch processing (default: *.srt)",
     )
 
+
+def _add_translate_arguments(parser: argparse.ArgumentParser) -> None:
+    """Add the translate command's arguments."""
     # Input/Output options
-    translate_parser.add_argument(
+    parser.add_argument(
         "input", help="Input subtitle file or directory containing subtitle files"
     )
-    translate_parser.add_argument(
+    parser.add_argument(
         "output", help="Output subtitle file or directory to save translated files"
     )
 
     # Language options
-    translate_parser.add_argument(
+    parser.add_argument(
         "--src-lang", "-s", default="en", help="Source language code (default: en)"
     )
-    translate_parser.add_argument(
+    parser.add_argument(
         "--target-lang",
         "-t",
         default="zh-CN",
@@ -71,26 +72,26 @@ def parse_args(args: List[str]) -> argparse.Namespace:
     )
 
     # Translation options
-    translate_parser.add_argument(
+    parser.add_argument(
         "--mode",
         choices=["naive", "split"],
         default="split",
         help="Translation mode: naive for simple translation, "
         "split for more context-aware translation (default: split)",
     )
-    translate_parser.add_argument(
+    parser.add_argument(
         "--both",
         action="store_true",
         default=True,
         help="Include both original and translated text (default: True)",
     )
-    translate_parser.add_argument(
+    parser.add_argument(
         "--only-translation",
         dest="both",
         action="store_false",
         help="Include only translated text",
     )
-    translate_parser.add_argument(
+    parser.add_argument(
         "--space",
         action="store_true",
         default=False,
@@ -98,93 +99,79 @@ def parse_args(args: List[str]) -> argparse.Namespace:
     )
 
     # File options
-    translate_parser.add_argument(
+    parser.add_argument(
         "--encoding", default="UTF-8", help="Input file encoding (default: UTF-8)"
     )
-    translate_parser.add_argument(
-        "--batch",
-        action="store_true",
-        default=False,
-        help="Process input as directory containing multiple subtitle files",
-    )
-    translate_parser.add_argument(
-        "--pattern",
-        default="*.srt",
-        help="File pattern for batch processing (default: *.srt)",
-    )
+    _add_batch_arguments(parser)
 
     # API options
-    translate_parser.add_argument(
-        "--api-key", help="API key for translation service (optional)"
-    )
-    translate_parser.add_argument(
+    parser.add_argument("--api-key", help="API key for translation service (optional)")
+    parser.add_argument(
         "--service",
         default="google",
         help="Translation service to use (default: google)",
     )
 
     # Misc options
-    translate_parser.add_argument(
+    parser.add_argument(
         "--verbose", "-v", action="store_true", help="Enable verbose logging"
     )
 
     # New option
-    translate_parser.add_argument(
+    parser.add_argument(
         "--no-resume",
         action="store_true",
         default=False,
         help="Do not attempt to resume from previous translations",
     )
 
-    # Encoding conversion command
-    encode_parser = subparsers.add_parser(
-        "encode", help="Convert subtitle file encodings"
-    )
 
+def _add_encode_arguments(parser: argparse.ArgumentParser) -> None:
+    """Add the encode command's arguments."""
     # Create a mutually exclusive group for non-file operations
-    encode_non_file_group = encode_parser.add_argument_group("Non-file operations")
-    encode_non_file_group.add_argument(
+    non_file_group = parser.add_argument_group("Non-file operations")
+    non_file_group.add_argument(
         "--list-encodings",
         action="store_true",
         help="List all supported encodings and exit",
     )
 
     # Input/Output options
-    encode_parser.add_argument(
+    parser.add_argument(
         "input",
         nargs="?",
         help="Input subtitle file or directory containing subtitle files",
     )
-    encode_parser.add_argument(
+    parser.add_argument(
         "--output-dir",
         "-o",
         help="Output directory to save converted files (defaults to input directory)",
     )
 
     # Encoding options
-    encode_parser.add_argument(
+    parser.add_argument(
         "--from-encoding",
         "-f",
         help="Source encoding of the input file (auto-detect if not specified)",
     )
-    encode_parser.add_argument(
+    parser.add_argument(
         "--to-encoding",
         "-t",
         help="Target encoding to convert to (can specify multiple with comma separation)",
     )
-    encode_parser.add_argument(
+    parser.add_argument(
         "--all",
         "-a",
         action="store_true",
         help="Convert to all common subtitle encodings",
     )
-    encode_parser.add_argument(
+    parser.add_argument(
         "--recommended",
         "-r",
         action="store_true",
         help="Convert to recommended encodings based on language",
     )
-    encode_parser.add_argument(
+    parser.add_argument(
         "--language",
         "-l",
         default="en",
@@ -192,31 +179,88 @@ def parse_args(args: List[str]) -> argparse.Namespace:
     )
 
     # File options
-    encode_parser.add_argument(
-        "--batch",
-        action="store_true",
-        help="Process input as directory containing multiple subtitle files",
-    )
-    encode_parser.add_argument(
-        "--pattern",
-        default="*.srt",
-        help="File pattern for batch processing (default: *.srt)",
+    _add_batch_arguments(parser)
+    parser.add_argument(
+        "--jobs",
+        "-j",
+        type=int,
+        default=1,
+        help="Number of files to convert in parallel in batch mode (default: 1)",
     )
 
     # Misc options
-    encode_parser.add_argument(
+    parser.add_argument(
         "--verbose", "-v", action="store_true", help="Enable verbose logging"
     )
 
+
+# One parser per command; only the command being run gets its arguments
+@functools.lru_cache(maxsize=None)
+def _build_parser(
+    command: Optional[str],
+) -> Tuple[argparse.ArgumentParser, argparse.ArgumentParser]:
+    """
+    Build the command-line parser for a command once and reuse it.
+
+    Both subcommands are always registered so top-level help lists them,
+    but only the one named by command gets its arguments added.
+
+    Args:
+        command: Subcommand about to be parsed, or None for neither
+
+    Returns:
+        Tuple of (top-level parser, encode subcommand parser)
+    """
+    parser = argparse.ArgumentParser(
+        prog="subtranslate",
+        description="SubtranSlate - Translate subtitle files from one language to another.",
+    )
+
+    subparsers = parser.add_subparsers(dest="command", help="Commands")
+
+    # Translate command
+    translate_parser = subparsers.add_parser(
+        "translate", help="Translate subtitle files"
+    )
+
+    # Encoding conversion command
+    encode_parser = subparsers.add_parser(
+        "encode", help="Convert subtitle file encodings"
+    )
+
+    if command == "translate":
+        _add_translate_arguments(translate_parser)
+    elif command == "encode":
+        _add_encode_arguments(encode_parser)
+
+    return parser, encode_parser
+
+
+def parse_args(args: List[str]) -> argparse.Namespace:
+    """
+    Parse command-line arguments.
+
+    Args:
+        args: Command-line arguments
+
+    Returns:
+        Parsed arguments
+    """
     # For backwards compatibility, if no command is specified, default to 'translate'
-    if len(args) > 0 and args[0] not in ["translate", "encode"]:
+    if len(args) > 0 and args[0] not in _COMMANDS:
         args = ["translate"] + args
 
+    parser, encode_parser = _build_parser(args[0] if args else None)
+
     # Custom parsing for special cases
     parsed_args = parser.parse_args(args)
 
     # Validate arguments based on command
-    if parsed_args.command == "encode":
+    if parsed_args.command == "translate":
+        # Language codes are compared repeatedly downstream
+        parsed_args.src_lang = sys.intern(parsed_args.src_lang)
+        parsed_args.target_lang = sys.intern(parsed_args.target_lang)
+    elif parsed_args.command == "encode":
         # If listing encodings, input is not required
         if parsed_args.list_encodings:
             return parsed_args
@@ -285,6 +329,13 @@ def _get_target_encodings(args: argparse.Namespace) -> List[str]:
     return target_encodings
 
 
+def _detection_language(args: argparse.Namespace) -> Optional[str]:
+    """Return the language to narrow source detection with, if one was chosen."""
+    # --language defaults to "en", so it only says something about the
+    # source when the user asked for recommended encodings
+    return str(args.language) if args.recommended else None
+
+
 def _process_encoding_input(
     args: argparse.Namespace, target_encodings: List[str]
 ) -> int:
@@ -311,8 +362,7 @@ def _process_batch_encoding(
         os.makedirs(output_dir)
 
     # Find all subtitle files
-    pattern = os.path.join(input_dir, args.pattern)
-    subtitle_files = glob.glob(pattern)
+    subtitle_files = find_subtitle_files(input_dir, args.pattern)
 
     if not subtitle_files:
         logger.error(
@@ -322,8 +372,8 @@ def _process_batch_encoding(
 
     logger.info("Found %d subtitle files to process", len(subtitle_files))
 
-    # Process each file
-    results = {}
+    # Work out where each file's conversions go
+    file_jobs = []
     for file_path in subtitle_files:
         rel_path = os.path.relpath(file_path, input_dir)
         file_output_dir = os.path.join(output_dir, os.path.dirname(rel_path))
@@ -332,11 +382,34 @@ def _process_batch_encoding(
         if not os.path.exists(file_output_dir):
             os.makedirs(file_output_dir)
 
-        # Convert the file
-        file_results = convert_to_multiple_encodings(
-            file_path, file_output_dir, target_encodings=target_encodings
-        )
-        results[rel_path] = file_results
+        file_jobs.append((rel_path, file_path, file_output_dir))
+
+    # Convert the files, several at once if requested
+    results = {}
+    language = _detection_language(args)
+    jobs = getattr(args, "jobs", 1)
+    if jobs <= 1 or len(file_jobs) <= 1:
+        for rel_path, file_path, file_output_dir in file_jobs:
+            results[rel_path] = convert_to_multiple_encodings(
+                file_path,
+                file_output_dir,
+                target_encodings=target_encodings,
+                language=language,
+            )
+    else:
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            futures = [
+                executor.submit(
+                    convert_to_multiple_encodings,
+                    file_path,
+                    file_output_dir,
+                    target_encodings=target_encodings,
+                    language=language,
+                )
+                for _, file_path, file_output_dir in file_jobs
+            ]
+            for (rel_path, _, _), future in zip(file_jobs, futures):
+                results[rel_path] = future.result()
 
     # Print summary
     print("\nConversion summary:")
@@ -380,7 +453,7 @@ def _process_single_file_encoding(
     # Check source encoding
     source_encoding = args.from_encoding
     if not source_encoding:
-        detected = detect_encoding(args.input)
+        detected = detect_encoding(args.input, language=_detection_language(args))
         if detected:
             source_encoding = detected
             logger.info("Detected source encoding: %s", source_encoding)
@@ -388,18 +461,13 @@ def _process_single_file_encoding(
             logger.error("Could not detect encoding of %s", args.input)
             return 1
 
+    # Output names share the input's stem, without any existing encoding suffix
+    input_path = Path(args.input)
+    stem = strip_encoding_suffix(input_path.stem)
+
     # Convert to each target encoding
     results = {}
     for encoding in target_encodings:
-        # Create output path
-        input_path = Path(args.input)
-        stem = input_path.stem
-        # Remove any existing encoding suffix
-        for enc in COMMON_ENCODINGS:
-            suffix = f"-{enc}"
-            if stem.lower().endswith(suffix.lower()):
-                stem = stem[: -len(suffix)]
-
         output_file = os.path.join(output_dir, f"{stem}-{encoding}{input_path.suffix}")
 
         # Convert the file
@@ -436,14 +504,19 @@ def handle_translate_command(args: argparse.Namespace) -> int:
     if getattr(args, "verbose", False):
         logging.getLogger().setLevel(logging.DEBUG)
 
-    # Create translator
+    # The translation stack pulls in the HTTP client, so load it only when needed
+    from .core.main import (  # pylint: disable=import-outside-toplevel
+        SubtitleTranslator,
+    )
+
+    # Create translator; its connection is warmed up while input is parsed
     translator = SubtitleTranslator(
-        translation_service=args.service, api_key=args.api_key
+        translation_service=args.service, api_key=args.api_key, warmup=True
     )
 
     # Check if space should be used based on target language
     space = args.space
-    if args.target_lang in ["fr", "en", "de", "es", "it", "pt", "ru"]:
+    if args.target_lang in _SPACE_LANGS:
         logger.info("Language %s uses spaces, setting space=True", args.target_lang)
         space = True
 
@@ -519,6 +592,19 @@ def _handle_error(
     return error_code
 
 
+def _describe_error(error: Exception) -> str:
+    """Pick the log message prefix for an error that ended the command."""
+    if isinstance(error, SubtitleError):
+        return "Subtitle processing error"
+    # A TranslationError can only have been raised once its module was loaded
+    translation = sys.modules.get(f"{__package__}.core.translation")
+    if translation is not None and isinstance(error, translation.TranslationError):
+        return "Translation error"
+    if isinstance(error, OSError):
+        return "File system error"
+    return "Unexpected error"
+
+
 def main(args: Optional[List[str]] = None) -> int:
     """
     Main entry point for the command-line interface.
@@ -550,37 +636,13 @@ def main(args: Optional[List[str]] = None) -> int:
     except KeyboardInterrupt:
         logger.info("Operation cancelled by user.")
         exit_code = 130
-    except (
-        SubtitleError,
-        TranslationError,
-        OSError,
-        IOError,
-        ValueError,
-        RuntimeError,
-    ) as e:
-        verbose = (
-            parsed_args is not None
-            and hasattr(parsed_args, "verbose")
-            and parsed_args.verbose
-        )
-        # Determine error message based on exception type
-        if isinstance(e, SubtitleError):
-            message = "Subtitle processing error"
-        elif isinstance(e, TranslationError):
-            message = "Translation error"
-        elif isinstance(e, (OSError, IOError)):
-            message = "File system error"
-        else:
-            message = "Unexpected error"
-        exit_code = _handle_error(e, message, 1, verbose)
     except Exception as e:  # pylint: disable=broad-exception-caught
-        # Catch-all for any other unexpected errors
         verbose = (
             parsed_args is not None
             and hasattr(parsed_args, "verbose")
             and parsed_args.verbose
         )
-        exit_code = _handle_error(e, "Unexpected error", 1, verbose)
+        exit_code = _handle_error(e, _describe_error(e), 1, verbose)
 
     return exit_code
 
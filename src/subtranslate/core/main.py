@@ -7,20 +7,26 @@ import logging
 import os
 import time
 from datetime import timedelta
-from pathlib import Path
-from typing import Dict, List, Optional, Union
-
-from .subtitle import SubtitleError, SubtitleLike, SubtitleProcessor
+from typing import Dict, List, Optional, Tuple, Union
+
+from .subtitle import (
+    SerializedSubtitles,
+    SubtitleError,
+    SubtitleLike,
+    SubtitleProcessor,
+    find_subtitle_files,
+)
 from .translation import RateLimitError, TranslationError, get_translator
 
 # Type aliases
-CheckpointData = Dict[
-    str, Union[str, int, float, bool, List[Dict[str, Union[str, int, timedelta, None]]]]
-]
+CheckpointData = Dict[str, Union[str, int, float, bool, SerializedSubtitles]]
 SubtitleList = List[SubtitleLike]
 BatchResult = Dict[str, str]
 BatchResults = Dict[str, BatchResult]
 
+# Seconds to back off before each whole-text retry after rate limiting
+_RATE_LIMIT_BACKOFF = (60, 120)
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
@@ -32,7 +38,10 @@ class SubtitleTranslator:
     """Main class for translating subtitles."""
 
     def __init__(
-        self, translation_service: str = "google", api_key: Optional[str] = None
+        self,
+        translation_service: str = "google",
+        api_key: Optional[str] = None,
+        warmup: bool = False,
     ):
         """
         Initialize the subtitle translator.
@@ -40,8 +49,10 @@ class SubtitleTranslator:
         Args:
             translation_service: Translation service to use
             api_key: API key for the translation service
+            warmup: Connect to the service in the background while the
+                input file is parsed
         """
-        self.translator = get_translator(translation_service, api_key)
+        self.translator = get_translator(translation_service, api_key, warmup=warmup)
         self.subtitle_processor = SubtitleProcessor()
 
     def translate_file(
@@ -124,9 +135,17 @@ class SubtitleTranslator:
                 )
                 subtitles = None
 
+        flattened = None
         if subtitles is None:
             try:
-                subtitles = self.subtitle_processor.parse_file(input_file, encoding)
+                if mode == "naive":
+                    subtitles = self.subtitle_processor.parse_file(input_file, encoding)
+                else:
+                    # Build the plain text while parsing to skip a second pass
+                    subtitles, plain_text, dialog_idx = (
+                        self.subtitle_processor.parse_and_flatten(input_file, encoding)
+                    )
+                    flattened = (plain_text, dialog_idx)
                 logger.info("Parsed %d subtitle entries", len(subtitles))
             except SubtitleError as e:
                 logger.error("Failed to parse subtitle file: %s", e)
@@ -187,6 +206,7 @@ class SubtitleTranslator:
                         both=both,
                         space=space,
                         checkpoint_file=checkpoint_file if resume else None,
+                        flattened=flattened,
                     )
             except (SubtitleError, TranslationError, RateLimitError) as e:
                 logger.error("Translation failed: %s", e)
@@ -261,14 +281,15 @@ class SubtitleTranslator:
         """
         logger.info("Using naive translation mode")
 
-        # Extract text content from subtitles
-        content_list = [sub.content.replace("\n", "") for sub in subtitles]
+        # Extract text content from subtitles, one line each; line breaks
+        # become spaces so words on either side aren't glued together
+        content_list = self.subtitle_processor.flatten_contents(subtitles)
 
         try:
             # Translate the content with progress reporting
             translated_text = None
 
-            for retry_count in range(3):  # Allow a few retries for the entire batch
+            for retry_count in range(len(_RATE_LIMIT_BACKOFF) + 1):
                 try:
                     # Translate with progress tracking
                     translated_text = self._translate_with_progress(
@@ -280,12 +301,13 @@ class SubtitleTranslator:
                     )
                     break
                 except RateLimitError:
-                    if retry_count < 2:  # Only retry twice
-                        backoff_time = 60 * (retry_count + 1)  # 60s, 120s
+                    if retry_count < len(_RATE_LIMIT_BACKOFF):
+                        backoff_time = _RATE_LIMIT_BACKOFF[retry_count]
                         logger.warning(
-                            "Rate limit detected. Backing off for %ds before retry %d/3",
+                            "Rate limit detected. Backing off for %ds before retry %d/%d",
                             backoff_time,
                             retry_count + 1,
+                            len(_RATE_LIMIT_BACKOFF),
                         )
                         time.sleep(backoff_time)
                     else:
@@ -314,7 +336,7 @@ class SubtitleTranslator:
 
             # Apply translations to subtitle objects
             result = self.subtitle_processor.simple_translate_subtitles(
-                subtitles, translated_list, both
+                subtitles, translated_list, both, flat_contents=content_list
             )
 
             # Save full completion to checkpoint
@@ -410,6 +432,7 @@ class SubtitleTranslator:
         both: bool = True,
         space: bool = False,
         checkpoint_file: Optional[str] = None,
+        flattened: Optional[Tuple[str, List[int]]] = None,
     ) -> SubtitleList:
         """
         Translate subtitles in 'split' mode (more advanced, context-aware translation).
@@ -421,14 +444,19 @@ class SubtitleTranslator:
             both: Whether to keep original text
             space: Whether the target language uses spaces
             checkpoint_file: Path to checkpoint file for resuming
+            flattened: Plain text and dialogue indices already built while parsing
 
         Returns:
             List of translated subtitle objects
         """
         logger.info("Using split translation mode")
 
-        # Process subtitles
-        plain_text, dialog_idx = self.subtitle_processor.triple_r(subtitles)
+        # Process subtitles (reuse the plain text from parsing when available)
+        flat_contents = None
+        if flattened is None:
+            flat_contents = self.subtitle_processor.flatten_contents(subtitles)
+            flattened = self.subtitle_processor.triple_r(subtitles, flat_contents)
+        plain_text, dialog_idx = flattened
         sen_list, sen_idx = self.subtitle_processor.split_and_record(plain_text)
 
         logger.info("Split into %d sentences", len(sen_list))
@@ -437,7 +465,7 @@ class SubtitleTranslator:
             # Translate the sentences with progress reporting
             translated_sen = None
 
-            for retry_count in range(3):  # Allow a few retries for the entire batch
+            for retry_count in range(len(_RATE_LIMIT_BACKOFF) + 1):
                 try:
                     # Translate with progress tracking
                     translated_sen = self._translate_with_progress(
@@ -449,12 +477,13 @@ class SubtitleTranslator:
                     )
                     break
                 except RateLimitError:
-                    if retry_count < 2:  # Only retry twice
-                        backoff_time = 60 * (retry_count + 1)  # 60s, 120s
+                    if retry_count < len(_RATE_LIMIT_BACKOFF):
+                        backoff_time = _RATE_LIMIT_BACKOFF[retry_count]
                         logger.warning(
-                            "Rate limit detected. Backing off for %ds before retry %d/3",
+                            "Rate limit detected. Backing off for %ds before retry %d/%d",
                             backoff_time,
                             retry_count + 1,
+                            len(_RATE_LIMIT_BACKOFF),
                         )
                         time.sleep(backoff_time)
                     else:
@@ -492,7 +521,7 @@ class SubtitleTranslator:
 
             # Apply translations to subtitle objects
             result = self.subtitle_processor.advanced_translate_subtitles(
-                subtitles, dialog_list, both
+                subtitles, dialog_list, both, flat_contents=flat_contents
             )
 
             # Save full completion to checkpoint
@@ -551,7 +580,7 @@ class SubtitleTranslator:
         os.makedirs(output_dir, exist_ok=True)
 
         # Find all SRT files in the input directory
-        input_files = list(Path(input_dir).glob(file_pattern))
+        input_files = find_subtitle_files(input_dir, file_pattern)
         logger.info("Found %d subtitle files to translate", len(input_files))
 
         # Check for batch state file
@@ -570,8 +599,7 @@ class SubtitleTranslator:
                 batch_state = {}
 
         results = {}
-        for input_file in input_files:
-            input_path = str(input_file)
+        for input_path in input_files:
             file_name = os.path.basename(input_path)
 
             # Generate output file name
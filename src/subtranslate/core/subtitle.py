@@ -2,11 +2,31 @@
 SRT subtitle utilities module for parsing, manipulating, and saving subtitle files.
 """
 
+import fnmatch
+import functools
+import glob
+import importlib.util
 import logging
 import os
 import re
+import sys
+from bisect import bisect_left
 from datetime import timedelta
-from typing import Dict, List, Protocol, Tuple, Union
+from itertools import accumulate
+from typing import (
+    Iterable,
+    Iterator,
+    List,
+    Literal,
+    Optional,
+    Pattern,
+    Protocol,
+    TextIO,
+    Tuple,
+    TypedDict,
+    Union,
+    overload,
+)
 
 import srt
 
@@ -24,24 +44,206 @@ class SubtitleLike(Protocol):
 # Type alias for better clarity
 SubtitleList = List[SubtitleLike]
 
+
+class SerializedSubtitles(TypedDict):
+    """Columnar checkpoint form of a subtitle list (see to_serialized)."""
+
+    index: List[int]
+    start_ns: List[int]
+    end_ns: List[int]
+    content: List[str]
+    translated: List[Optional[str]]
+
+
+# Fields that determine srt.compose output, one tuple per subtitle
+_ComposeKey = Tuple[Tuple[int, timedelta, timedelta, str, str], ...]
+
+_MICROSECOND = timedelta(microseconds=1)
+
+# Subtitle contents shorter than this are interned while parsing
+_INTERN_MAX_LEN = 64
+
+# Translation table used to put multi-line subtitle content on one line
+_NL_TO_SPACE = str.maketrans({"\n": " ", "\r": ""})
+
+# Characters read at a time when parsing; chunks are cut on blank lines
+_PARSE_CHUNK_SIZE = 1 << 24
+
+
+def _to_ns(value: timedelta) -> int:
+    """Convert a timedelta to integer nanoseconds."""
+    return (value // _MICROSECOND) * 1000
+
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
 )
 logger = logging.getLogger(__name__)
 
-# Try importing jieba for Chinese segmentation, but don't fail if not available
-try:
-    import jieba
-
-    JIEBA_AVAILABLE = True
-except ImportError:
-    JIEBA_AVAILABLE = False
+# jieba is used for Chinese segmentation but takes long to import, so only
+# check that it's installed here and import it on first use
+JIEBA_AVAILABLE = importlib.util.find_spec("jieba") is not None
+if not JIEBA_AVAILABLE:
     logger.warning(
         "Jieba library not found. Chinese segmentation may not work correctly."
     )
 
 
+# Sentence boundary: whitespace after . ? or ! that doesn't follow an abbreviation.
+# Splitter implements this rule with _split_sentences rather than the regex.
+SENTENCE_BOUNDARY_PATTERN = (
+    r"(?<!\w\.\w.)(?<![A-Z][a-z]\.)(?<!\b[A-Za-z]\.)(?<=\.|\?|\!)\s"
+)
+
+
+def _iter_srt_chunks(srt_file: TextIO) -> Iterator[str]:
+    """
+    Read SRT text in chunks that each end on a blank line.
+
+    A blank line always ends a cue, so every chunk holds whole cues and can
+    be parsed on its own without reading the file into one string. Chunks
+    are only cut after a whole run of newlines, since srt.parse keeps some
+    of a longer run in the cue's content.
+
+    Args:
+        srt_file: Open text file to read
+
+    Yields:
+        Consecutive pieces of the file, cut after a blank line
+    """
+    carry = ""
+    while True:
+        data = srt_file.read(_PARSE_CHUNK_SIZE)
+        if not data:
+            break
+        data = carry + data
+        # Last blank line that is followed by text read so far
+        cut = data.rfind("\n\n")
+        while cut >= 0 and (cut + 2 >= len(data) or data[cut + 2] == "\n"):
+            cut = data.rfind("\n\n", 0, cut + 1)
+        if cut < 0:
+            # No complete cue yet; keep reading until the next one starts
+            carry = data
+            continue
+        yield data[: cut + 2]
+        carry = data[cut + 2 :]
+    if carry:
+        yield carry
+
+
+# Candidate boundaries for _split_sentences: terminal punctuation then whitespace
+_TERMINATOR_SPACE = re.compile(r"[.?!]\s")
+
+
+def _is_word_char(char: str) -> bool:
+    """Return True if char matches the regex class \\w."""
+    return char.isalnum() or char == "_"
+
+
+def _is_abbreviation_end(text: str, period: int) -> bool:
+    """
+    Check whether the period at text[period] ends an abbreviation.
+
+    Mirrors the lookbehinds of SENTENCE_BOUNDARY_PATTERN: "U.S." style
+    initialisms, "Mr." style titles and single letters such as "a.".
+
+    Args:
+        text: Text being split
+        period: Index of the terminating character
+
+    Returns:
+        True if no sentence boundary should follow this character
+    """
+    # Word char, period, word char, any character (e.g. "U.S.A." or "a.m.")
+    if (
+        period >= 3
+        and text[period] != "\n"
+        and text[period - 2] == "."
+        and _is_word_char(text[period - 3])
+        and _is_word_char(text[period - 1])
+    ):
+        return True
+
+    if text[period] != ".":
+        return False
+
+    letter = text[period - 1] if period >= 1 else ""
+    # Capitalized two-letter title such as "Mr." or "Dr."
+    if period >= 2 and "a" <= letter <= "z" and "A" <= text[period - 2] <= "Z":
+        return True
+    # Single letter at the start of a word such as "D." or "a."
+    return ("a" <= letter <= "z" or "A" <= letter <= "Z") and (
+        period < 2 or not _is_word_char(text[period - 2])
+    )
+
+
+def _split_sentences(text: str) -> List[str]:
+    """
+    Split text into sentences without a lookbehind regex.
+
+    Each whitespace character after ".", "?" or "!" is a boundary unless
+    the punctuation ends an abbreviation. Runs in linear time.
+
+    Args:
+        text: Text to split
+
+    Returns:
+        List of sentences, including empty pieces between adjacent boundaries
+    """
+    sentences = []
+    start = 0
+    for match in _TERMINATOR_SPACE.finditer(text):
+        period = match.start()
+        if _is_abbreviation_end(text, period):
+            continue
+        sentences.append(text[start : period + 1])
+        start = period + 2
+    sentences.append(text[start:])
+    return sentences
+
+
+@functools.lru_cache(maxsize=32)
+def _compile_name_pattern(pattern: str) -> Pattern[str]:
+    """Compile a shell-style file name pattern once per pattern."""
+    return re.compile(fnmatch.translate(os.path.normcase(pattern)))
+
+
+def find_subtitle_files(directory: str, pattern: str) -> List[str]:
+    """
+    Find the files in a directory whose names match a shell-style pattern.
+
+    Plain name patterns are matched against a single os.scandir listing, using
+    the file type cached in each directory entry instead of a stat per name.
+    Patterns that reach into subdirectories are handed to glob.
+
+    Args:
+        directory: Directory to search
+        pattern: Pattern such as '*.srt', relative to the directory
+
+    Returns:
+        Paths of the matching files, joined onto the directory
+    """
+    if os.sep in pattern or (os.altsep and os.altsep in pattern):
+        return [
+            path
+            for path in glob.glob(os.path.join(directory, pattern), recursive=True)
+            if os.path.isfile(path)
+        ]
+
+    match = _compile_name_pattern(pattern).match
+    # Like glob, hidden files only match patterns that start with a dot
+    include_hidden = pattern.startswith(".")
+    with os.scandir(directory) as entries:
+        return [
+            os.path.join(directory, entry.name)
+            for entry in entries
+            if (include_hidden or not entry.name.startswith("."))
+            and match(os.path.normcase(entry.name))
+            and entry.is_file()
+        ]
+
+
 class SubtitleError(Exception):
     """Exception raised for subtitle processing errors."""
 
@@ -49,12 +251,6 @@ class SubtitleError(Exception):
 class Splitter:
     """Sentence splitter for text processing."""
 
-    def __init__(self) -> None:
-        # Improved regex pattern for sentence splitting
-        self.pattern = re.compile(
-            r"(?<!\w\.\w.)(?<![A-Z][a-z]\.)(?<!\b[A-Za-z]\.)(?<=\.|\?|\!)\s"
-        )
-
     def split(self, text: str) -> List[str]:
         """
         Split text into sentences.
@@ -68,8 +264,9 @@ class Splitter:
         if not text:
             return []
 
-        # Use regex to split on sentence boundaries
-        sentences = self.pattern.split(text)
+        # Scan for sentence boundaries; splitting on SENTENCE_BOUNDARY_PATTERN
+        # gives the same result but its lookbehinds are slow on long text
+        sentences = _split_sentences(text)
 
         # Filter out empty strings
         return [s for s in sentences if s.strip()]
@@ -80,29 +277,94 @@ class SubtitleProcessor:
 
     def __init__(self) -> None:
         self.splitter = Splitter()
+        # Last srt.compose input and output, reused when saving unchanged lists
+        self._composed: Optional[Tuple[_ComposeKey, str]] = None
+        # Last sentence segmented by jieba and its word end offsets
+        self._cn_segmentation: Optional[Tuple[str, List[int]]] = None
 
-    def parse_file(self, file_path: str, encoding: str = "UTF-8") -> SubtitleList:
+    @overload
+    def parse_file(
+        self,
+        file_path: str,
+        encoding: str = ...,
+        *,
+        stream: Literal[False] = ...,
+    ) -> SubtitleList: ...
+
+    @overload
+    def parse_file(
+        self, file_path: str, encoding: str = ..., *, stream: Literal[True]
+    ) -> Iterator[SubtitleLike]: ...
+
+    def parse_file(
+        self, file_path: str, encoding: str = "UTF-8", *, stream: bool = False
+    ) -> Union[SubtitleList, Iterator[SubtitleLike]]:
         """
         Parse an SRT file into subtitle objects.
 
         Args:
             file_path: Path to the SRT file
             encoding: File encoding
+            stream: Return a generator instead of building a list. Errors are
+                then raised while iterating rather than by this call.
 
         Returns:
-            List of srt.Subtitle objects
+            List of srt.Subtitle objects, or a generator of them if stream
 
         Raises:
             SubtitleError: If file can't be parsed
         """
+        subtitles = self._read_subtitles(file_path, encoding)
+        if stream:
+            return subtitles
+        return list(subtitles)
+
+    def parse_and_flatten(
+        self, file_path: str, encoding: str = "UTF-8"
+    ) -> Tuple[SubtitleList, str, List[int]]:
+        """
+        Parse an SRT file and build its plain text in the same pass.
+
+        This fuses parse_file and triple_r so the subtitle content is only
+        walked once on the split translation path.
+
+        Args:
+            file_path: Path to the SRT file
+            encoding: File encoding
+
+        Returns:
+            Tuple of (subtitle objects, plain text, dialogue indices)
+
+        Raises:
+            SubtitleError: If file can't be parsed
+        """
+        subtitles: SubtitleList = []
+        pieces: List[str] = []
+        dialog_idx: List[int] = []
+        current_idx = 0
+
+        for sub in self._read_subtitles(file_path, encoding):
+            content = sub.content.translate(_NL_TO_SPACE) + " "
+            current_idx += len(content)
+            dialog_idx.append(current_idx)
+            pieces.append(content)
+            subtitles.append(sub)
+
+        return subtitles, "".join(pieces).rstrip(), dialog_idx
+
+    def _read_subtitles(self, file_path: str, encoding: str) -> Iterator[SubtitleLike]:
+        """Read an SRT file and yield its subtitles, wrapping errors."""
         if not os.path.exists(file_path):
             raise SubtitleError(f"Subtitle file not found: {file_path}")
 
         try:
             with open(file_path, encoding=encoding) as srt_file:
-                content = srt_file.read()
-                subtitle_generator = srt.parse(content)
-                return list(subtitle_generator)
+                for chunk in _iter_srt_chunks(srt_file):
+                    for sub in srt.parse(chunk):
+                        # Short lines ("[music]", speaker labels) repeat a lot
+                        if len(sub.content) < _INTERN_MAX_LEN:
+                            sub.content = sys.intern(sub.content)
+                        yield sub
         except UnicodeDecodeError as exc:
             logger.error(
                 "Failed to decode file with encoding %s. Try another encoding.",
@@ -134,11 +396,17 @@ class SubtitleProcessor:
             SubtitleError: If file can't be saved
         """
         try:
-
-            # Ensure subtitles are proper srt.Subtitle objects
-            valid_subtitles = []
-            for sub in subtitles:
-                if not isinstance(sub, srt.Subtitle):
+            # Ensure subtitles are proper srt.Subtitle objects. Parsed input is
+            # almost always srt.Subtitle already, so check exact types first
+            # and only walk the conversion path when something else is mixed in.
+            if all(type(sub) is srt.Subtitle for sub in subtitles):
+                valid_subtitles = subtitles
+            else:
+                valid_subtitles = []
+                for sub in subtitles:
+                    if isinstance(sub, srt.Subtitle):
+                        valid_subtitles.append(sub)
+                        continue
                     # Try to convert to srt.Subtitle if it's a dict or similar
                     try:
                         valid_sub = srt.Subtitle(
@@ -150,39 +418,72 @@ class SubtitleProcessor:
                         valid_subtitles.append(valid_sub)
                     except (AttributeError, TypeError, ValueError) as exc:
                         logger.warning("Failed to convert subtitle: %s", exc)
-                else:
-                    valid_subtitles.append(sub)
 
             with open(file_path, "w", encoding=encoding) as f:
-                f.write(srt.compose(valid_subtitles))
+                f.write(self._compose(valid_subtitles))
             logger.info("Saved subtitles to %s", file_path)
         except Exception as e:
             logger.error("Failed to save subtitles: %s", e)
             raise SubtitleError(f"Failed to save subtitles: {e}") from e
 
-    def triple_r(self, subtitle_list: SubtitleList) -> Tuple[str, List[int]]:
+    def flatten_contents(self, subtitle_list: Iterable[SubtitleLike]) -> List[str]:
+        """
+        Normalize each subtitle's content onto a single line.
+
+        The result can be passed to triple_r and the translate functions so
+        the line-break replacement is only done once per subtitle.
+
+        Args:
+            subtitle_list: Subtitle objects, iterated once
+
+        Returns:
+            Subtitle contents with line breaks replaced by spaces and
+            carriage returns dropped
+        """
+        return [sub.content.translate(_NL_TO_SPACE) for sub in subtitle_list]
+
+    def _compose(self, subtitles: SubtitleList) -> str:
+        """
+        Compose subtitles into SRT text, reusing the last result if unchanged.
+
+        Args:
+            subtitles: List of srt.Subtitle objects
+
+        Returns:
+            SRT formatted text
+        """
+        key = tuple(
+            (sub.index, sub.start, sub.end, sub.proprietary, sub.content)
+            for sub in subtitles
+        )
+        if self._composed is not None and self._composed[0] == key:
+            return self._composed[1]
+
+        composed: str = srt.compose(subtitles)
+        self._composed = (key, composed)
+        return composed
+
+    def triple_r(
+        self,
+        subtitle_list: Iterable[SubtitleLike],
+        flat_contents: Optional[List[str]] = None,
+    ) -> Tuple[str, List[int]]:
         """
         Remove line breaks, reconstruct plain text, and record dialogue indices.
 
         Args:
-            subtitle_list: List of subtitle objects
+            subtitle_list: Subtitle objects, iterated once
+            flat_contents: Contents already normalized by flatten_contents
 
         Returns:
             Tuple of (plain text, dialogue indices)
         """
-        dialog_idx = []
-        current_idx = 0
-        plain_text = ""
+        if flat_contents is None:
+            flat_contents = self.flatten_contents(subtitle_list)
 
-        for sub in subtitle_list:
-            # Normalize content by replacing line breaks with spaces
-            content = sub.content.replace("\n", " ") + " "
-            current_idx += len(content)
-            dialog_idx.append(current_idx)
-            plain_text += content
-
-        # Remove trailing space
-        return plain_text.rstrip(), dialog_idx
+        # Each dialogue ends after its content and the joining space
+        dialog_idx = list(accumulate(len(flat) + 1 for flat in flat_contents))
+        return " ".join(flat_contents).rstrip(), dialog_idx
 
     def split_and_record(self, plain_text: str) -> Tuple[List[str], List[int]]:
         """
@@ -218,23 +519,19 @@ class SubtitleProcessor:
         Returns:
             List of sentence-dialogue relationships
         """
-        i = 0
-        j = 1
-        mass_list = []
-        one_sentence: list[tuple[int, int]] = []
-
-        while i < len(dialog_idx):
-            if dialog_idx[i] > sen_idx[j]:
-                mass_list.append(one_sentence)
-                one_sentence = []
-                j += 1
-            else:
-                one_sentence.append((i + 1, dialog_idx[i] - sen_idx[j - 1]))
-                i += 1
+        mass_list: List[List[Tuple[int, int]]] = []
+        last_sentence = len(sen_idx) - 1
+        if last_sentence < 1:
+            return mass_list
 
-        # Add the last sentence
-        if one_sentence:
-            mass_list.append(one_sentence)
+        j = 1
+        for i, dialog_end in enumerate(dialog_idx):
+            # Sentence whose end is the first at or after this dialogue's end.
+            # Both index lists are sorted, so the search can start at j.
+            j = min(bisect_left(sen_idx, dialog_end, j), last_sentence)
+            while len(mass_list) < j:
+                mass_list.append([])
+            mass_list[j - 1].append((i + 1, dialog_end - sen_idx[j - 1]))
 
         return mass_list
 
@@ -252,8 +549,9 @@ class SubtitleProcessor:
         if not sentence:
             return 0
 
-        left_idx = sentence[:current_idx].rfind(" ")
-        right_idx = sentence[current_idx:].find(" ")
+        # Search in place rather than slicing copies of each side
+        left_idx = sentence.rfind(" ", 0, current_idx)
+        right_idx = sentence.find(" ", current_idx)
 
         # If no space found, return current position
         if left_idx == -1 and right_idx == -1:
@@ -261,15 +559,15 @@ class SubtitleProcessor:
 
         # If no space on left, use right
         if left_idx == -1:
-            return right_idx + current_idx + 1
+            return right_idx + 1
 
         # If no space on right, use left
         if right_idx == -1:
             return left_idx + 1
 
         # Choose the nearest
-        if current_idx - left_idx > right_idx:
-            return right_idx + current_idx + 1
+        if current_idx - left_idx > right_idx - current_idx:
+            return right_idx + 1
 
         return left_idx + 1
 
@@ -279,11 +577,14 @@ class SubtitleProcessor:
         """
         Find the nearest word boundary in Chinese text using jieba.
 
+        The whole sentence is segmented once and reused while it is split
+        at several positions.
+
         Args:
             sentence: Chinese text
             current_idx: Target position
             last_idx: Last split position
-            scope: Scope to consider for segmentation
+            scope: Maximum distance the split may move past current_idx
 
         Returns:
             Index for splitting
@@ -295,31 +596,37 @@ class SubtitleProcessor:
         if not sentence:
             return 0
 
-        # Adjust boundaries
-        last_idx = max(last_idx, current_idx - scope)
-        next_idx = min(current_idx + scope, len(sentence))
-
         try:
-            words = list(jieba.cut(sentence[last_idx:next_idx]))
+            word_ends = self._segment_cn(sentence)
+        except (AttributeError, RuntimeError) as e:
+            logger.error("Error in Chinese segmentation: %s", e)
+            return current_idx
 
-            total_len = 0
-            word_idx = 0
-            target_idx = current_idx - last_idx
+        # First word ending at or after the target, past the last split
+        word_idx = bisect_left(word_ends, max(current_idx, last_idx + 1))
+        if word_idx == len(word_ends):
+            return max(last_idx, min(len(sentence), current_idx + scope))
+        split_idx = word_ends[word_idx]
 
-            for word in words:
-                total_len += len(word)
-                word_idx += 1
-                if total_len >= target_idx:
-                    break
+        # If the next word is a Chinese comma, include it
+        if (
+            word_idx + 1 < len(word_ends)
+            and sentence[split_idx : word_ends[word_idx + 1]] == "\uff0c"
+        ):
+            split_idx = word_ends[word_idx + 1]
 
-            # If we found a word and it's a Chinese comma, include it
-            if word_idx < len(words) and words[word_idx] == "\uff0c":
-                total_len += len(words[word_idx])
+        return max(last_idx, min(split_idx, current_idx + scope))
 
-            return total_len + last_idx
-        except (AttributeError, RuntimeError) as e:
-            logger.error("Error in Chinese segmentation: %s", e)
-            return current_idx
+    def _segment_cn(self, sentence: str) -> List[int]:
+        """Return the end offset of each jieba word in sentence, caching the last."""
+        if self._cn_segmentation is not None and self._cn_segmentation[0] == sentence:
+            return self._cn_segmentation[1]
+
+        import jieba  # pylint: disable=import-outside-toplevel
+
+        word_ends = list(accumulate(len(word) for word in jieba.cut(sentence)))
+        self._cn_segmentation = (sentence, word_ends)
+        return word_ends
 
     def sen_list2dialog_list(
         self,
@@ -349,7 +656,8 @@ class SubtitleProcessor:
             logger.warning("No dialogues found in mass_list")
             return []
 
-        dialog_list = [""] * dialog_num
+        # Collect pieces per dialogue and join once at the end
+        dialog_parts: List[List[str]] = [[] for _ in range(dialog_num)]
 
         for sen_idx, sentence in enumerate(sen_list):
             if sen_idx >= len(mass_list):
@@ -368,13 +676,11 @@ class SubtitleProcessor:
 
             if total_dialog_of_sentence == 1:
                 # Simple case: one sentence, one dialogue
-                dialog_list[record[0][0] - 1] += sentence[0 : record[0][1]]
+                dialog_parts[record[0][0] - 1].append(sentence[0 : record[0][1]])
             else:
-                # Complex case: one sentence spans multiple dialogues
-                if not record:
-                    logger.warning("Empty record for sentence %d", sen_idx)
-                    continue
-
+                # Complex case: one sentence spans multiple dialogues. Each cut
+                # is found without rescanning the sentence (find/rfind bounds,
+                # or one cached jieba segmentation) and each piece sliced once.
                 origin_len = record[-1][1]
                 translated_len = len(sentence)
 
@@ -395,20 +701,24 @@ class SubtitleProcessor:
                         )
 
                     # Add segment to dialogue
-                    if record[record_idx][0] - 1 < len(dialog_list):
-                        dialog_list[record[record_idx][0] - 1] += sentence[
-                            last_idx:current_idx
-                        ]
+                    if record[record_idx][0] - 1 < dialog_num:
+                        dialog_parts[record[record_idx][0] - 1].append(
+                            sentence[last_idx:current_idx]
+                        )
                     last_idx = current_idx
 
                 # Add last segment
-                if record[-1][0] - 1 < len(dialog_list):
-                    dialog_list[record[-1][0] - 1] += sentence[last_idx:]
+                if record[-1][0] - 1 < dialog_num:
+                    dialog_parts[record[-1][0] - 1].append(sentence[last_idx:])
 
-        return dialog_list
+        return ["".join(parts) for parts in dialog_parts]
 
     def simple_translate_subtitles(
-        self, subtitles: SubtitleList, translated_texts: List[str], both: bool = True
+        self,
+        subtitles: SubtitleList,
+        translated_texts: List[str],
+        both: bool = True,
+        flat_contents: Optional[List[str]] = None,
     ) -> SubtitleList:
         """
         Apply translated texts to subtitles (simple mode).
@@ -417,6 +727,7 @@ class SubtitleProcessor:
             subtitles: Original subtitle objects
             translated_texts: Translated texts for each subtitle
             both: Whether to keep original text
+            flat_contents: Contents already normalized by flatten_contents
 
         Returns:
             Updated subtitle objects
@@ -426,25 +737,16 @@ class SubtitleProcessor:
                 f"Subtitle count mismatch: {len(subtitles)} vs {len(translated_texts)}"
             )
 
-        result = []
-        for i, sub in enumerate(subtitles):
-            content = translated_texts[i]
-            if both:
-                content += "\n" + sub.content.replace("\n", " ")
-
-            new_sub = srt.Subtitle(
-                index=sub.index,
-                start=sub.start,
-                end=sub.end,
-                content=content,
-                proprietary=sub.proprietary,
-            )
-            result.append(new_sub)
-
-        return result
+        return self._apply_translations(
+            subtitles, translated_texts, both, flat_contents
+        )
 
     def advanced_translate_subtitles(
-        self, subtitles: SubtitleList, translated_dialogs: List[str], both: bool = True
+        self,
+        subtitles: SubtitleList,
+        translated_dialogs: List[str],
+        both: bool = True,
+        flat_contents: Optional[List[str]] = None,
     ) -> SubtitleList:
         """
         Apply translated dialogues to subtitles (advanced mode).
@@ -453,6 +755,7 @@ class SubtitleProcessor:
             subtitles: Original subtitle objects
             translated_dialogs: Translated dialogues
             both: Whether to keep original text
+            flat_contents: Contents already normalized by flatten_contents
 
         Returns:
             Updated subtitle objects
@@ -462,71 +765,94 @@ class SubtitleProcessor:
                 f"Subtitle count mismatch: {len(subtitles)} vs {len(translated_dialogs)}"
             )
 
-        result = []
-        for i, sub in enumerate(subtitles):
-            content = translated_dialogs[i]
-            if both:
-                content += "\n" + sub.content.replace("\n", " ")
+        return self._apply_translations(
+            subtitles, translated_dialogs, both, flat_contents
+        )
 
-            new_sub = srt.Subtitle(
+    def _apply_translations(
+        self,
+        subtitles: SubtitleList,
+        translations: List[str],
+        both: bool,
+        flat_contents: Optional[List[str]],
+    ) -> SubtitleList:
+        """Build new subtitles carrying the translations, plus originals if both."""
+        if both:
+            if flat_contents is None:
+                flat_contents = self.flatten_contents(subtitles)
+            # One formatted string per cue instead of concatenating in steps
+            contents = [
+                f"{translated}\n{original}"
+                for translated, original in zip(translations, flat_contents)
+            ]
+        else:
+            contents = translations
+
+        return [
+            srt.Subtitle(
                 index=sub.index,
                 start=sub.start,
                 end=sub.end,
                 content=content,
                 proprietary=sub.proprietary,
             )
-            result.append(new_sub)
-
-        return result
+            for sub, content in zip(subtitles, contents)
+        ]
 
-    def to_serialized(
-        self, subtitles: SubtitleList
-    ) -> List[Dict[str, Union[str, timedelta, int, None]]]:
+    def to_serialized(self, subtitles: Iterable[SubtitleLike]) -> SerializedSubtitles:
         """
         Convert subtitle objects to a serializable format for checkpointing.
 
+        The result is columnar: one list per field instead of one dict per
+        subtitle, with timestamps stored as integer nanoseconds. The
+        subtitles are only iterated once, so a generator can be passed.
+
         Args:
-            subtitles: List of subtitle objects
+            subtitles: Subtitle objects
 
         Returns:
-            List of serialized subtitle dictionaries
+            Dictionary mapping each field name to its column of values
         """
-        serialized = []
+        serialized: SerializedSubtitles = {
+            "index": [],
+            "start_ns": [],
+            "end_ns": [],
+            "content": [],
+            "translated": [],
+        }
         for sub in subtitles:
-            serialized.append(
-                {
-                    "index": sub.index,
-                    "start_time": sub.start,
-                    "end_time": sub.end,
-                    "content": sub.content,
-                    "translated_content": getattr(sub, "translated_content", None),
-                }
-            )
+            serialized["index"].append(sub.index)
+            serialized["start_ns"].append(_to_ns(sub.start))
+            serialized["end_ns"].append(_to_ns(sub.end))
+            serialized["content"].append(sub.content)
+            serialized["translated"].append(getattr(sub, "translated_content", None))
         return serialized
 
-    def from_serialized(
-        self, serialized: List[Dict[str, Union[str, None]]]
-    ) -> SubtitleList:
+    def from_serialized(self, serialized: SerializedSubtitles) -> SubtitleList:
         """
         Reconstruct subtitle objects from serialized format.
 
         Args:
-            serialized: List of serialized subtitle dictionaries
+            serialized: Columnar subtitle data produced by to_serialized
 
         Returns:
             List of subtitle objects
         """
-        # srt module already imported at module level
-
         subtitles = []
-        for data in serialized:
+        for index, start_ns, end_ns, content, translated in zip(
+            serialized["index"],
+            serialized["start_ns"],
+            serialized["end_ns"],
+            serialized["content"],
+            serialized["translated"],
+        ):
             sub = srt.Subtitle(
-                index=data["index"],
-                start=data["start_time"],
-                end=data["end_time"],
-                content=data["content"],
+                index=index,
+                start=timedelta(microseconds=start_ns // 1000),
+                end=timedelta(microseconds=end_ns // 1000),
+                content=content,
             )
-            if data.get("translated_content") is not None:
-                sub.translated_content = data["translated_content"]
+            if translated is not None:
+                sub.translated_content = translated
             subtitles.append(sub)
         return subtitles
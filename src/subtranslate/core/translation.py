@@ -3,19 +3,22 @@ Translation module for subtitle translation services.
 Supports Google Translate and other translation services.
 """
 
+import functools
 import json
 import logging
-import random
-import re
+import threading
 import time
-import urllib.error
-import urllib.parse
-import urllib.request
 from abc import ABC, abstractmethod
-from typing import Callable, List, Optional
+from bisect import bisect_right
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from itertools import accumulate
+from typing import Callable, List, Optional, Tuple, Type
+from urllib.parse import quote_from_bytes
 
-import execjs
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
 
 # Configure logging
 logging.basicConfig(
@@ -23,6 +26,26 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# orjson parses the nested translate responses noticeably faster; it's optional
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+    _JSON_DECODE_ERRORS: Tuple[Type[Exception], ...] = (
+        json.JSONDecodeError,
+        orjson.JSONDecodeError,
+    )
+except ImportError:
+    ORJSON_AVAILABLE = False
+    _JSON_DECODE_ERRORS = (json.JSONDecodeError,)
+
+
+def _loads(data: str) -> object:
+    """Parse JSON with orjson when available, else the json module."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
 
 class TranslationError(Exception):
     """Exception raised for translation errors."""
@@ -32,6 +55,60 @@ class RateLimitError(TranslationError):
     """Exception raised specifically for rate limiting errors."""
 
 
+class TokenBucket:
+    """Thread-safe token bucket limiting how often requests are sent."""
+
+    def __init__(self, rate: float, capacity: float) -> None:
+        """
+        Initialize the bucket full.
+
+        Args:
+            rate: Tokens added per second
+            capacity: Maximum number of tokens, i.e. the allowed burst
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._last = time.monotonic()
+        self._blocked_until = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Take one token, sleeping until one is available."""
+        with self._lock:
+            now = time.monotonic()
+            if now < self._blocked_until:
+                time.sleep(self._blocked_until - now)
+                now = time.monotonic()
+
+            self._tokens = min(
+                self.capacity, self._tokens + (now - self._last) * self.rate
+            )
+            self._last = now
+            if self._tokens < 1:
+                time.sleep((1 - self._tokens) / self.rate)
+                self._tokens = 1
+                self._last = time.monotonic()
+            self._tokens -= 1
+
+    def pause(self, seconds: float) -> None:
+        """Empty the bucket and hold back all requests for the given time."""
+        with self._lock:
+            self._tokens = 0
+            self._blocked_until = max(self._blocked_until, time.monotonic() + seconds)
+
+
+def _retry_after_seconds(response: Optional[requests.Response]) -> float:
+    """Return the Retry-After delay of a response in seconds, or 0 if absent."""
+    if response is None:
+        return 0.0
+    try:
+        return max(float(response.headers.get("Retry-After", 0)), 0.0)
+    except (TypeError, ValueError):
+        # HTTP-date values are rare for this service; fall back to backoff
+        return 0.0
+
+
 class Translator(ABC):
     """Abstract base class for translation services."""
 
@@ -53,166 +130,146 @@ class Translator(ABC):
 class GoogleTranslator(Translator):
     """Google Translate implementation."""
 
-    def __init__(self, api_key: Optional[str] = None) -> None:
+    # Free endpoint URL; only the domain, languages and token vary per request
+    _URL_TEMPLATE = (
+        "http://{domain}/translate_a/single?client=t&sl={sl}&tl={tl}"
+        "&dt=at&dt=bd&dt=ex&dt=ld&dt=md&dt=qca&dt=rw&dt=rm&dt=ss&dt=t"
+        "&ie=UTF-8&oe=UTF-8&clearbtn=1&otf=1&pc=1&srcrom=0&ssel=0&tsel=0&kc=1"
+        "&tk={tk}"
+    )
+    _DOMAINS = ("translate.google.com", "translate.google.cn")
+    # Keep-alive connections kept per host; batch workers are capped to this
+    _POOL_MAXSIZE = 8
+    # Statuses the session adapter retries with exponential backoff
+    _RETRY_CODES = frozenset({429, *range(500, 600)})
+
+    def __init__(self, api_key: Optional[str] = None, warmup: bool = False) -> None:
+        """
+        Initialize the translator.
+
+        Args:
+            api_key: Google Cloud Translation API key; the free endpoint is
+                used when omitted
+            warmup: Open a connection to the service in the background so
+                the first batch doesn't pay for the handshake
+        """
         self.api_key = api_key
         self.headers = {
             "User-Agent": (
                 "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
                 "(KHTML, like Gecko) Chrome/96.0.4664.110 Safari/537.36"
-            )
+            ),
+            # Responses are verbose JSON; requests decompresses these for us
+            "Accept-Encoding": "gzip, deflate",
         }
-        self.tk_gen = TkGenerator()
-        self.pattern = re.compile(r'\["(.*?)(?:\\n)')
+        self.tk_gen = _get_tk_generator()
         self.max_limited = 3500
+        # Number of batches translate_lines may have in flight at once
+        self.concurrency = 4
+        # Request pacing shared by all threads using this translator
+        self.rate_limiter = TokenBucket(rate=2.0, capacity=4)
 
-        # Retry configuration
+        # Memory of recent translations keyed by (text, src_lang, target_lang)
+        self.cache_size = 2048
+        self._cache: OrderedDict[Tuple[str, str, str], str] = OrderedDict()
+        self._cache_lock = threading.Lock()
+
+        # Retry configuration, applied by the session's transport adapter
         self.max_retries = 5  # Maximum number of retry attempts
-        self.initial_backoff = 2  # Initial backoff time in seconds
+        self.initial_backoff = 2  # Backoff factor in seconds, doubled per retry
         self.max_backoff = 60  # Maximum backoff time in seconds
-        self.jitter = 0.1  # Random jitter factor for backoff
+        self.jitter = 1.0  # Up to this many seconds of random jitter per backoff
+
+        # Pooled session so consecutive batches reuse keep-alive connections.
+        # The adapter owns the single retry policy for 429/5xx responses and
+        # network errors, honouring Retry-After when the service sends it.
+        self._session = requests.Session()
+        self._session.headers.update(self.headers)
+        self._session.headers["Content-Type"] = "application/x-www-form-urlencoded"
+        retry = Retry(
+            total=self.max_retries,
+            backoff_factor=self.initial_backoff,
+            backoff_max=self.max_backoff,
+            backoff_jitter=self.jitter,
+            status_forcelist=self._RETRY_CODES,
+            allowed_methods=["POST"],
+            respect_retry_after_header=True,
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(
+            pool_connections=4, pool_maxsize=self._POOL_MAXSIZE, max_retries=retry
+        )
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
 
-        # Alternative user agents to rotate
-        self.user_agents = [
-            (
-                "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
-                "(KHTML, like Gecko) Chrome/96.0.4664.110 Safari/537.36"
-            ),
-            (
-                "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15 "
-                "(KHTML, like Gecko) Version/15.1 Safari/605.1.15"
-            ),
-            (
-                "Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:94.0) "
-                "Gecko/20100101 Firefox/94.0"
-            ),
-            (
-                "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 "
-                "(KHTML, like Gecko) Chrome/96.0.4664.45 Safari/537.36"
-            ),
-        ]
+        if warmup:
+            threading.Thread(target=self._warm_up, daemon=True).start()
 
-    def _rotate_user_agent(self) -> None:
-        """Rotate the user agent to avoid detection of automated requests."""
-        self.headers["User-Agent"] = random.choice(self.user_agents)
+    def _warm_up(self) -> None:
+        """Send a HEAD request so a pooled connection is ready for translating."""
+        if self.api_key:
+            url = "https://translation.googleapis.com/"
+        else:
+            url = f"http://{self._DOMAINS[0]}/"
+        try:
+            self._session.head(url, timeout=3)
+        except requests.RequestException as e:
+            # Only an optimisation; the first real request connects anyway
+            logger.debug("Connection warmup failed: %s", e)
 
-    def _calculate_backoff(self, retry_count: int) -> float:
+    def _check_status(self, response: requests.Response) -> None:
         """
-        Calculate exponential backoff time with jitter.
+        Raise the matching translation error for a failed response.
+
+        Retries have already been spent by the session adapter, so any
+        remaining 429 or 5xx status is final.
 
         Args:
-            retry_count: Current retry attempt number
+            response: Response returned by the session
 
-        Returns:
-            Backoff time in seconds
+        Raises:
+            RateLimitError: If the service is still rate limiting
+            TranslationError: For any other unsuccessful status
         """
-        # Calculate exponential backoff: initial_backoff * 2^retry_count
-        backoff = min(self.initial_backoff * (2**retry_count), self.max_backoff)
-
-        # Add random jitter to avoid thundering herd problem
-        jitter_amount = backoff * self.jitter
-        backoff = backoff + random.uniform(-jitter_amount, jitter_amount)
-
-        return max(float(backoff), 0.1)  # Ensure minimum delay of 0.1 seconds
+        status_code = response.status_code
+        if status_code == 429:
+            retry_after = _retry_after_seconds(response)
+            if retry_after:
+                # Hold back every thread, not just this request
+                self.rate_limiter.pause(retry_after)
+            logger.error("Max retries reached after rate limit (HTTP 429)")
+            raise RateLimitError(
+                "Translation service rate limited (HTTP 429). Try again later."
+            )
+        if status_code in self._RETRY_CODES:
+            logger.error(
+                "Max retries reached after server error (HTTP %d)", status_code
+            )
+            raise TranslationError(
+                f"Translation service server error (HTTP {status_code}): "
+                f"{response.text}"
+            )
+        if status_code >= 400:
+            logger.error("HTTP Error %d: %s", status_code, response.text)
+            raise TranslationError(
+                f"Translation service returned HTTP error {status_code}: "
+                f"{response.text}"
+            )
 
     def __post(self, url: str, text: str) -> str:
-        """Post a request to the translation service with retry mechanism."""
-        retry_count = 0
-        last_error: Optional[Exception] = None
-
-        while retry_count <= self.max_retries:
-            try:
-                # Rotate user agent before request
-                if retry_count > 0:
-                    self._rotate_user_agent()
-
-                post_data = {"q": text}
-                data = urllib.parse.urlencode(post_data).encode(encoding="utf-8")
-                request = urllib.request.Request(
-                    url=url, data=data, headers=self.headers
-                )
-
-                with urllib.request.urlopen(request, timeout=10) as response:
-                    raw_data = response.read()
-                    decoded_text: str = raw_data.decode("utf-8")
-                    return decoded_text
+        """Post a request to the free translation endpoint."""
+        # Form-encode the body once, straight from the UTF-8 bytes
+        body = b"q=" + quote_from_bytes(text.encode("utf-8"), safe="").encode("ascii")
 
-            except urllib.error.HTTPError as e:
-                last_error = e
-                # Check if this is a rate limit error (HTTP 429) or other server error (5xx)
-                if e.code == 429 or (e.code >= 500 and e.code < 600):
-                    retry_count += 1
-                    if retry_count <= self.max_retries:
-                        backoff_time = self._calculate_backoff(retry_count)
-                        logger.warning(
-                            "Rate limit or server error detected (HTTP %d). "
-                            "Retry %d/%d after %.2fs backoff.",
-                            e.code,
-                            retry_count,
-                            self.max_retries,
-                            backoff_time,
-                        )
-                        time.sleep(backoff_time)
-                        continue
-                    logger.error(
-                        "Max retries reached after rate limit (HTTP %d)", e.code
-                    )
-                    raise RateLimitError(
-                        f"Translation service rate limited (HTTP {e.code}). Try again later."
-                    ) from e
-                # For other HTTP errors, fail immediately
-                logger.error("HTTP Error: %s", e)
-                raise TranslationError(
-                    f"Translation service returned HTTP error: {e}"
-                ) from e
-
-            except urllib.error.URLError as e:
-                last_error = e
-                # Network errors could be temporary, retry with backoff
-                retry_count += 1
-                if retry_count <= self.max_retries:
-                    backoff_time = self._calculate_backoff(retry_count)
-                    logger.warning(
-                        "Network error: %s. Retry %d/%d after %.2fs backoff.",
-                        e,
-                        retry_count,
-                        self.max_retries,
-                        backoff_time,
-                    )
-                    time.sleep(backoff_time)
-                    continue
-
-                logger.error("Max retries reached after network error: %s", e)
-                raise TranslationError(
-                    f"Failed to connect to translation service after "
-                    f"{self.max_retries} attempts: {e}"
-                ) from e
-
-            except Exception as e:
-                last_error = e
-                # For other unexpected errors, retry with some backoff
-                retry_count += 1
-                if retry_count <= self.max_retries:
-                    backoff_time = self._calculate_backoff(retry_count)
-                    logger.warning(
-                        "Unexpected error: %s. Retry %d/%d after %.2fs backoff.",
-                        e,
-                        retry_count,
-                        self.max_retries,
-                        backoff_time,
-                    )
-                    time.sleep(backoff_time)
-                    continue
-
-                logger.error("Max retries reached after unexpected error: %s", e)
-                raise TranslationError(f"Unexpected translation error: {e}") from e
-
-        # If we reach this point, all retries have failed
-        if last_error:
-            raise TranslationError(
-                f"All translation attempts failed: {last_error}"
-            ) from last_error
+        try:
+            response = self._session.post(url, data=body, timeout=10)
+        except requests.RequestException as e:
+            logger.error("Request to translation service failed: %s", e)
+            raise TranslationError(f"Translation service request failed: {e}") from e
 
-        raise TranslationError("All translation attempts failed for unknown reasons")
+        self._check_status(response)
+        decoded_text: str = response.content.decode("utf-8")
+        return decoded_text
 
     def __translate(self, text: str, src_lang: str, target_lang: str) -> str:
         """Internal translation method."""
@@ -223,157 +280,42 @@ class GoogleTranslator(Translator):
 
     def __translate_with_api(self, text: str, src_lang: str, target_lang: str) -> str:
         """Translate using the official Google Cloud Translation API."""
-        retry_count = 0
-        last_error: Optional[Exception] = None
-
-        while retry_count <= self.max_retries:
-            try:
-                url = f"https://translation.googleapis.com/language/translate/v2?key={self.api_key}"
-                payload = {
-                    "q": text,
-                    "source": src_lang,
-                    "target": target_lang,
-                    "format": "text",
-                }
-                response = requests.post(url, data=payload, timeout=30)
-
-                if response.status_code == 429:  # Rate limit error
-                    retry_count += 1
-                    if retry_count <= self.max_retries:
-                        backoff_time = self._calculate_backoff(retry_count)
-                        logger.warning(
-                            "API rate limit detected. Retry %d/%d after %.2fs backoff.",
-                            retry_count,
-                            self.max_retries,
-                            backoff_time,
-                        )
-                        time.sleep(backoff_time)
-                        continue
-
-                    logger.error("Max retries reached after API rate limit")
-                    raise RateLimitError(
-                        "Translation API rate limited. Try again later."
-                    )
-                if response.status_code >= 500:  # Server error
-                    retry_count += 1
-                    if retry_count <= self.max_retries:
-                        backoff_time = self._calculate_backoff(retry_count)
-                        logger.warning(
-                            "API server error (%d). Retry %d/%d after %.2fs backoff.",
-                            response.status_code,
-                            retry_count,
-                            self.max_retries,
-                            backoff_time,
-                        )
-                        time.sleep(backoff_time)
-                        continue
-
-                    logger.error(
-                        "Max retries reached after API server error: %d",
-                        response.status_code,
-                    )
-                    raise TranslationError(
-                        f"Translation API server error: {response.text}"
-                    )
-                if response.status_code != 200:  # Other errors
-                    logger.error("API Error: %s", response.text)
-                    raise TranslationError(f"Translation API error: {response.text}")
-
-                result_data = response.json()
-                if isinstance(result_data, dict) and "data" in result_data:
-                    translations = result_data["data"].get("translations", [])
-                    if translations and len(translations) > 0:
-                        return str(translations[0].get("translatedText", ""))
-                raise TranslationError("Unexpected API response format")
-
-            except requests.RequestException as e:
-                last_error = e
-                # Network errors could be temporary, retry with backoff
-                retry_count += 1
-                if retry_count <= self.max_retries:
-                    backoff_time = self._calculate_backoff(retry_count)
-                    logger.warning(
-                        "API request error: %s. Retry %d/%d after %.2fs backoff.",
-                        e,
-                        retry_count,
-                        self.max_retries,
-                        backoff_time,
-                    )
-                    time.sleep(backoff_time)
-                    continue
-
-                logger.error("Max retries reached after API request error: %s", e)
-                raise TranslationError(
-                    f"Failed to connect to Google Translation API after "
-                    f"{self.max_retries} attempts: {e}"
-                ) from e
-
-            except KeyError as e:
-                last_error = e
-                # Response parsing errors, could be due to API changes
-                retry_count += 1
-                if retry_count <= self.max_retries:
-                    backoff_time = self._calculate_backoff(retry_count)
-                    logger.warning(
-                        "API response parsing error: %s. Retry %d/%d after %.2fs backoff.",
-                        e,
-                        retry_count,
-                        self.max_retries,
-                        backoff_time,
-                    )
-                    time.sleep(backoff_time)
-                    continue
-
-                logger.error(
-                    "Max retries reached after API response parsing error: %s", e
-                )
-                raise TranslationError(f"Failed to parse API response: {e}") from e
+        url = f"https://translation.googleapis.com/language/translate/v2?key={self.api_key}"
+        payload = {
+            "q": text,
+            "source": src_lang,
+            "target": target_lang,
+            "format": "text",
+        }
+        try:
+            response = self._session.post(url, data=payload, timeout=30)
+        except requests.RequestException as e:
+            logger.error("API request error: %s", e)
+            raise TranslationError(f"Google Translation API request failed: {e}") from e
 
-            except Exception as e:
-                last_error = e
-                # Other unexpected errors
-                retry_count += 1
-                if retry_count <= self.max_retries:
-                    backoff_time = self._calculate_backoff(retry_count)
-                    logger.warning(
-                        "Unexpected API error: %s. Retry %d/%d after %.2fs backoff.",
-                        e,
-                        retry_count,
-                        self.max_retries,
-                        backoff_time,
-                    )
-                    time.sleep(backoff_time)
-                    continue
-
-                logger.error("Max retries reached after unexpected API error: %s", e)
-                raise TranslationError(f"Unexpected translation API error: {e}") from e
-
-        # If we reach this point, all retries have failed
-        if last_error:
-            raise TranslationError(
-                f"All API translation attempts failed: {last_error}"
-            ) from last_error
+        self._check_status(response)
+        try:
+            result_data = response.json()
+        except ValueError as e:
+            raise TranslationError(f"Failed to parse API response: {e}") from e
 
-        raise TranslationError(
-            "All API translation attempts failed for unknown reasons"
-        )
+        if isinstance(result_data, dict) and "data" in result_data:
+            translations = result_data["data"].get("translations", [])
+            if translations and len(translations) > 0:
+                return str(translations[0].get("translatedText", ""))
+        raise TranslationError("Unexpected API response format")
 
     def __translate_without_api(
         self, text: str, src_lang: str, target_lang: str
     ) -> str:
         """Translate using the free Google Translate service."""
         token_key = self.tk_gen.get_tk(text)
-        # Try different Google Translate domains if one fails
-        domains = ["translate.google.com", "translate.google.cn"]
 
-        # Try each domain
+        # Try different Google Translate domains if one fails
         last_error: Optional[Exception] = None
-        for domain in domains:
-            url = (
-                f"http://{domain}/translate_a/single?client=t"
-                f"&sl={src_lang}&tl={target_lang}&dt=at&dt=bd&dt=ex&dt=ld&dt=md&dt=qca"
-                f"&dt=rw&dt=rm&dt=ss&dt=t&ie=UTF-8&oe=UTF-8&clearbtn=1&otf=1&pc=1"
-                f"&srcrom=0&ssel=0&tsel=0&kc=1&tk={token_key}"
+        for domain in self._DOMAINS:
+            url = self._URL_TEMPLATE.format(
+                domain=domain, sl=src_lang, tl=target_lang, tk=token_key
             )
 
             try:
@@ -429,25 +371,43 @@ class GoogleTranslator(Translator):
         if not text.strip():
             return ""
 
+        key = (text, src_lang, target_lang)
+        with self._cache_lock:
+            cached = self._cache.get(key)
+            if cached is not None:
+                self._cache.move_to_end(key)
+                return cached
+
+        self.rate_limiter.acquire()
         try:
             result = self.__translate(text, src_lang, target_lang)
 
             if self.api_key:
-                return result
-
-            obj_result = json.loads(result)
-            list_sentence = [x[0] for x in obj_result[0][:-1]]
-            return "".join(list_sentence)
-        except json.JSONDecodeError as exc:
+                translated = result
+            else:
+                obj_result = _loads(result)
+                translated = "".join(
+                    x[0] for x in obj_result[0][:-1]  # type: ignore[index]
+                )
+        except _JSON_DECODE_ERRORS as exc:
             logger.error("Failed to decode translation response")
             raise TranslationError("Failed to decode translation response") from exc
         except (IndexError, KeyError) as exc:
             logger.error("Failed to parse translation response")
             raise TranslationError("Failed to parse translation response") from exc
+        except RateLimitError:
+            # Left unwrapped so callers can back off and retry the whole text
+            raise
         except Exception as e:
             logger.error("Translation error: %s", e)
             raise TranslationError(f"Translation error: {e}") from e
 
+        with self._cache_lock:
+            self._cache[key] = translated
+            if len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        return translated
+
     def translate_lines(
         self,
         text_list: List[str],
@@ -485,6 +445,9 @@ class GoogleTranslator(Translator):
                 progress_callback=progress_callback,
                 progress=progress,
             )
+        except RateLimitError:
+            logger.error("Translation rate limited after %d batches", len(progress))
+            raise
         except Exception as e:
             # Find the last successful batch from progress
             successful_batches = [idx for idx, success in progress if success]
@@ -505,6 +468,36 @@ class GoogleTranslator(Translator):
             logger.error("Failed to translate lines: %s", e)
             raise TranslationError(f"Failed to translate lines: {e}") from e
 
+    def _build_batches(self, text_list: List[str]) -> List[Tuple[Tuple[int, int], str]]:
+        """
+        Group lines into batches that stay under the request size limit.
+
+        Args:
+            text_list: List of texts to translate
+
+        Returns:
+            List of ((start index, end index), batch text) tuples in order,
+            skipping batches that are only whitespace
+        """
+        # prefix[i] is the joined length of text_list[:i] plus one newline each
+        prefix = [0, *accumulate(len(text_item) + 1 for text_item in text_list)]
+        bounds = []
+        start = 0
+
+        while start < len(text_list):
+            # Furthest end whose joined text fits; a longer line goes alone
+            end = bisect_right(prefix, prefix[start] + self.max_limited + 1, start + 1)
+            end = max(end - 1, start + 1)
+            bounds.append((start, end))
+            start = end
+
+        batches = []
+        for start, end in bounds:
+            batch = "\n".join(text_list[start:end])
+            if batch.strip():
+                batches.append(((start, end), batch))
+        return batches
+
     def _process_translation_batches(
         self,
         text_list: List[str],
@@ -514,217 +507,165 @@ class GoogleTranslator(Translator):
         progress_callback: Optional[Callable[[int, int, str], None]],
         progress: List[tuple[tuple[int, int], bool]],
     ) -> str:
-        """Process translation batches to reduce nesting complexity."""
-        translated = ""
-        last_idx = 0
-        total_length = 0
-
-        for i, text_item in enumerate(text_list):
-            total_length += len(text_item)
-            if total_length > self.max_limited:
-                translated = self._process_batch(
-                    text_list,
-                    last_idx,
-                    i,
-                    src_lang=src_lang,
-                    target_lang=target_lang,
-                    translated=translated,
-                    progress=progress,
-                    progress_callback=progress_callback,
-                )
-                last_idx = i
-                total_length = 0
-
-        # Translate the last batch
-        translated = self._process_final_batch(
-            text_list,
-            last_idx,
-            src_lang=src_lang,
-            target_lang=target_lang,
-            translated=translated,
-            progress=progress,
-            progress_callback=progress_callback,
-        )
-        return translated
+        """Translate all batches, concurrently when more than one is allowed."""
+        batches = self._build_batches(text_list)
+        if self.concurrency <= 1 or len(batches) <= 1:
+            return self._process_batches_sequentially(
+                batches,
+                src_lang,
+                target_lang,
+                total_items=len(text_list),
+                progress_callback=progress_callback,
+                progress=progress,
+            )
 
-    def _process_batch(
+        parts: List[str] = []
+        with ThreadPoolExecutor(
+            # Beyond the pool size, connections would be closed after each
+            # request and every batch would pay a fresh handshake
+            max_workers=min(self.concurrency, len(batches), self._POOL_MAXSIZE)
+        ) as executor:
+            futures = [
+                executor.submit(self._translate_batch, batch, src_lang, target_lang)
+                for _, batch in batches
+            ]
+            # Collect in submission order so output and progress stay ordered
+            for (checkpoint, _), future in zip(batches, futures):
+                try:
+                    batch_translation = future.result()
+                except TranslationError:
+                    progress.append((checkpoint, False))
+                    for pending in futures:
+                        pending.cancel()
+                    raise
+
+                parts.append(batch_translation + "\n")
+                progress.append((checkpoint, True))
+                if progress_callback:
+                    progress_callback(checkpoint[1], len(text_list), "".join(parts))
+
+        return "".join(parts)
+
+    def _process_batches_sequentially(
         self,
-        text_list: List[str],
-        last_idx: int,
-        current_idx: int,
-        *,
+        batches: List[Tuple[Tuple[int, int], str]],
         src_lang: str,
         target_lang: str,
-        translated: str,
-        progress: List[tuple[tuple[int, int], bool]],
-        progress_callback: Optional[Callable[[int, int, str], None]],
-    ) -> str:
-        """Process a single batch of translation."""
-        batch = "\n".join(text_list[last_idx:current_idx])
-        if not batch.strip():
-            return translated
-
-        checkpoint = (last_idx, current_idx)
-        translated = self._translate_batch_with_retry(
-            batch,
-            src_lang,
-            target_lang,
-            translated=translated,
-            checkpoint=checkpoint,
-            progress=progress,
-            current_idx=current_idx,
-            total_items=len(text_list),
-            progress_callback=progress_callback,
-        )
-
-        # Adaptive delay based on batch size
-        delay = 1 + (len(batch) / 2000)
-        logger.info(
-            "Pausing for %.2fs between translation batches to avoid rate limiting",
-            delay,
-        )
-        time.sleep(delay)
-        return translated
-
-    def _process_final_batch(
-        self,
-        text_list: List[str],
-        last_idx: int,
         *,
-        src_lang: str,
-        target_lang: str,
-        translated: str,
-        progress: List[tuple[tuple[int, int], bool]],
+        total_items: int,
         progress_callback: Optional[Callable[[int, int, str], None]],
+        progress: List[tuple[tuple[int, int], bool]],
     ) -> str:
-        """Process the final batch of translation."""
-        last_batch = "\n".join(text_list[last_idx:])
-        if not last_batch.strip():
-            return translated
-
-        final_checkpoint = (last_idx, len(text_list))
-        return self._translate_batch_with_retry(
-            last_batch,
-            src_lang,
-            target_lang,
-            translated=translated,
-            checkpoint=final_checkpoint,
-            progress=progress,
-            current_idx=len(text_list),
-            total_items=len(text_list),
-            progress_callback=progress_callback,
-        )
+        """Translate batches one at a time."""
+        parts: List[str] = []
+        for checkpoint, batch in batches:
+            self._translate_and_record(
+                batch,
+                src_lang,
+                target_lang,
+                parts=parts,
+                checkpoint=checkpoint,
+                progress=progress,
+                current_idx=checkpoint[1],
+                total_items=total_items,
+                progress_callback=progress_callback,
+            )
+        return "".join(parts)
 
-    def _translate_batch_with_retry(
+    def _translate_batch(self, batch: str, src_lang: str, target_lang: str) -> str:
+        """Translate one batch; retries happen once, in the session adapter."""
+        return self.translate(batch, src_lang, target_lang)
+
+    def _translate_and_record(
         self,
         batch: str,
         src_lang: str,
         target_lang: str,
         *,
-        translated: str,
+        parts: List[str],
         checkpoint: tuple[int, int],
         progress: List[tuple[tuple[int, int], bool]],
         current_idx: int,
         total_items: int,
         progress_callback: Optional[Callable[[int, int, str], None]],
-    ) -> str:
-        """Translate a batch with retry logic for rate limits."""
+    ) -> None:
+        """
+        Translate a batch once, appending its text to parts and recording progress.
+
+        Retries are left to the session adapter, so a TranslationError here is
+        final and the batch is recorded as failed.
+        """
         try:
-            batch_translation = self.translate(batch, src_lang, target_lang)
-            translated += batch_translation + "\n"
-            progress.append((checkpoint, True))
+            batch_translation = self._translate_batch(batch, src_lang, target_lang)
+        except TranslationError as e:
+            progress.append((checkpoint, False))
+            raise e
 
-            if progress_callback:
-                progress_callback(current_idx, total_items, translated)
+        parts.append(batch_translation + "\n")
+        progress.append((checkpoint, True))
 
-        except RateLimitError:
-            logger.warning(
-                "Rate limit detected during batch translation. "
-                "Backing off for 30 seconds."
-            )
-            time.sleep(30)
+        if progress_callback:
+            progress_callback(current_idx, total_items, "".join(parts))
 
-            # Retry after backoff
-            batch_translation = self.translate(batch, src_lang, target_lang)
-            translated += batch_translation + "\n"
-            progress.append((checkpoint, True))
 
-            if progress_callback:
-                progress_callback(current_idx, total_items, translated)
+def _to_int32(value: int) -> int:
+    """Wrap an integer to a signed 32-bit value, like JavaScript bit operators."""
+    value &= 0xFFFFFFFF
+    return value - 0x100000000 if value & 0x80000000 else value
 
-        except TranslationError as e:
-            progress.append((checkpoint, False))
-            raise e
 
-        return translated
+def _rl(a: int, ops: str) -> int:
+    """Apply a Google Translate token mixing sequence such as "+-a^+6"."""
+    for c in range(0, len(ops) - 2, 3):
+        shift_char = ops[c + 2]
+        shift = ord(shift_char) - 87 if shift_char >= "a" else int(shift_char)
+        if ops[c + 1] == "+":
+            mixed = (a & 0xFFFFFFFF) >> shift
+        else:
+            mixed = _to_int32(a << shift)
+        a = _to_int32(a + mixed) if ops[c] == "+" else _to_int32(a ^ mixed)
+    return a
+
+
+@functools.lru_cache(maxsize=1024)
+def _compute_tk(text: str) -> str:
+    """Compute the TK parameter for text (port of Google's TL function)."""
+    seed = 406644
+    key = 3293161072
+
+    # JavaScript encodes UTF-16 code units; surrogatepass matches it for
+    # unpaired surrogates, and pairs come out as the usual 4-byte sequences
+    a = seed
+    for byte in text.encode("utf-8", "surrogatepass"):
+        a = _rl(a + byte, "+-a^+6")
+    a = _rl(a, "+-3^+b+-f")
+    a = _to_int32(a ^ key)
+    if a < 0:
+        a = (a & 0x7FFFFFFF) + 0x80000000
+    a %= 1_000_000
+    return f"{a}.{a ^ seed}"
 
 
 class TkGenerator:
     """Generate TK parameter for Google Translate requests."""
 
-    def __init__(self) -> None:
-        try:
-            self.ctx = execjs.compile(
-                """
-            function TL(a) {
-            var k = "";
-            var b = 406644;
-            var b1 = 3293161072;
-            var jd = ".";
-            var $b = "+-a^+6";
-            var Zb = "+-3^+b+-f";
-            for (var e = [], f = 0, g = 0; g < a.length; g++) {
-                var m = a.charCodeAt(g);
-                128 > m ? e[f++] = m : (
-                    2048 > m ? e[f++] = m >> 6 | 192 : (
-                        55296 == (m & 64512) && g + 1 < a.length && 
-                        56320 == (a.charCodeAt(g + 1) & 64512) ? (
-                            m = 65536 + ((m & 1023) << 10) + (a.charCodeAt(++g) & 1023),
-                e[f++] = m >> 18 | 240,
-                e[f++] = m >> 12 & 63 | 128) : e[f++] = m >> 12 | 224,
-                e[f++] = m >> 6 & 63 | 128),
-                e[f++] = m & 63 | 128)
-            }
-            a = b;
-            for (f = 0; f < e.length; f++) a += e[f],
-            a = RL(a, $b);
-            a = RL(a, Zb);
-            a ^= b1 || 0;
-            0 > a && (a = (a & 2147483647) + 2147483648);
-            a %= 1E6;
-            return a.toString() + jd + (a ^ b)
-        };
-        function RL(a, b) {
-            var t = "a";
-            var Yb = "+";
-            for (var c = 0; c < b.length - 2; c += 3) {
-                var d = b.charAt(c + 2),
-                d = d >= t ? d.charCodeAt(0) - 87 : Number(d),
-                d = b.charAt(c + 1) == Yb ? a >>> d: a << d;
-                a = b.charAt(c) == Yb ? a + d & 4294967295 : a ^ d
-            }
-            return a
-        }
-        """
-            )
-        except Exception as e:
-            logger.error("Failed to initialize TkGenerator: %s", e)
-            raise TranslationError(
-                f"Failed to initialize JavaScript context for translation: {e}"
-            ) from e
-
     def get_tk(self, text: str) -> str:
         """Generate the TK parameter for a given text."""
         try:
-            result = self.ctx.call("TL", text)
-            return str(result) if result is not None else ""
-        except Exception as e:
+            return _compute_tk(text)
+        except (AttributeError, TypeError, UnicodeError) as e:
             logger.error("Failed to generate TK: %s", e)
             raise TranslationError(f"Failed to generate translation key: {e}") from e
 
 
+@functools.lru_cache(maxsize=1)
+def _get_tk_generator() -> TkGenerator:
+    """Return the TkGenerator shared by all translator instances."""
+    return TkGenerator()
+
+
 def get_translator(
-    service: str = "google", api_key: Optional[str] = None
+    service: str = "google", api_key: Optional[str] = None, warmup: bool = False
 ) -> Translator:
     """
     Factory function to get a translator instance.
@@ -732,6 +673,7 @@ def get_translator(
     Args:
         service: Translation service to use ('google' is currently the only supported option)
         api_key: API key for the translation service (optional)
+        warmup: Open a connection to the service in the background
 
     Returns:
         Translator instance
@@ -740,6 +682,6 @@ def get_translator(
         ValueError: If service is not supported
     """
     if service.lower() == "google":
-        return GoogleTranslator(api_key)
+        return GoogleTranslator(api_key, warmup=warmup)
 
     raise ValueError(f"Unsupported translation service: {service}")
@@ -1,11 +1,37 @@
 """
 Utilities package for SubtranSlate.
+
+Names are loaded from their submodule on first access, so importing the
+package doesn't pull in the encoding converter until it is used.
 """
 
-from .encoding_converter import (
-    COMMON_ENCODINGS,
-    convert_subtitle_encoding,
-    convert_to_multiple_encodings,
-    detect_encoding,
-    get_recommended_encodings,
-)
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .encoding_converter import (
+        COMMON_ENCODINGS,
+        convert_subtitle_encoding,
+        convert_to_multiple_encodings,
+        detect_encoding,
+        get_recommended_encodings,
+        strip_encoding_suffix,
+    )
+
+__all__ = [
+    "COMMON_ENCODINGS",
+    "convert_subtitle_encoding",
+    "convert_to_multiple_encodings",
+    "detect_encoding",
+    "get_recommended_encodings",
+    "strip_encoding_suffix",
+]
+
+
+def __getattr__(name: str) -> object:
+    """Import exported names lazily from the encoding converter."""
+    if name in __all__:
+        value: object = getattr(import_module(".encoding_converter", __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -5,10 +5,15 @@ This module provides functionality to convert subtitle files between different e
 commonly used for subtitles in various languages and regions.
 """
 
+import codecs
+import functools
 import logging
 import os
+import re
+import shutil
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Sequence, Tuple
 
 # Configure logging
 logging.basicConfig(
@@ -16,6 +21,33 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# charset-normalizer scores the raw bytes statistically in a single pass; it
+# ships with requests, but detection falls back to trial decoding without it
+try:
+    import charset_normalizer
+
+    CHARSET_NORMALIZER_AVAILABLE = True
+except ImportError:
+    CHARSET_NORMALIZER_AVAILABLE = False
+
+# Number of leading bytes the statistical detector looks at
+_DETECT_SAMPLE_SIZE = 65536
+
+# Byte order marks settle the encoding outright; UTF-32 LE comes before
+# UTF-16 LE because its mark starts with the same two bytes
+_BOMS = (
+    (codecs.BOM_UTF8, "utf-8-sig"),
+    (codecs.BOM_UTF32_LE, "utf-32"),
+    (codecs.BOM_UTF32_BE, "utf-32"),
+    (codecs.BOM_UTF16_LE, "utf-16"),
+    (codecs.BOM_UTF16_BE, "utf-16"),
+)
+
+# Characters converted at a time by convert_subtitle_encoding; big enough that
+# a typical subtitle file is read and written in one go, while still bounding
+# memory for unusually large ones
+_CONVERT_CHUNK_SIZE = 1 << 20
+
 # Common encodings for subtitles
 COMMON_ENCODINGS = [
     "utf-8",
@@ -57,28 +89,288 @@ COMMON_ENCODINGS = [
     "iso8859-16",  # South-Eastern European
 ]
 
+# Recommended encodings per language code (most preferred first)
+_RECOMMENDED_ENCODINGS: Dict[str, Tuple[str, ...]] = {
+    "th": ("utf-8", "tis-620", "cp874", "iso8859-11"),  # Thai
+    "zh-CN": ("utf-8", "gb2312", "cp936"),  # Simplified Chinese
+    "zh-TW": ("utf-8", "big5", "cp950"),  # Traditional Chinese
+    "ja": ("utf-8", "shift_jis", "euc-jp", "cp932"),  # Japanese
+    "ko": ("utf-8", "euc-kr", "cp949"),  # Korean
+    "ru": ("utf-8", "cp1251", "koi8-r", "iso8859-5"),  # Russian
+    "ar": ("utf-8", "cp1256", "iso8859-6"),  # Arabic
+    "he": ("utf-8", "cp1255", "iso8859-8"),  # Hebrew
+    "tr": ("utf-8", "cp1254", "iso8859-9"),  # Turkish
+    "el": ("utf-8", "cp1253", "iso8859-7"),  # Greek
+    "vi": ("utf-8", "cp1258"),  # Vietnamese
+}
+
+# UTF-8 and common Western encodings, for languages not listed above
+_DEFAULT_RECOMMENDED_ENCODINGS = (
+    "utf-8",
+    "utf-8-sig",
+    "cp1252",
+    "iso8859-1",
+    "iso8859-15",
+)
+
+# ASCII stand-ins for characters a narrow target encoding can't represent,
+# used ahead of the "?" that errors="replace" would give
+_ASCII_FALLBACKS = {
+    0x00A0: " ",  # no-break space
+    0x2009: " ",  # thin space
+    0x200B: "",  # zero width space
+    0x2010: "-",  # hyphen
+    0x2013: "-",  # en dash
+    0x2014: "-",  # em dash
+    0x2015: "-",  # horizontal bar
+    0x2018: "'",  # left single quotation mark
+    0x2019: "'",  # right single quotation mark
+    0x201A: "'",  # single low-9 quotation mark
+    0x201C: '"',  # left double quotation mark
+    0x201D: '"',  # right double quotation mark
+    0x201E: '"',  # double low-9 quotation mark
+    0x2022: "*",  # bullet
+    0x2026: "...",  # horizontal ellipsis
+    0x266A: "#",  # eighth note, marks song lyrics
+    0x266B: "#",  # beamed eighth notes
+    0x3000: " ",  # ideographic space
+    0x3001: ",",  # ideographic comma
+    0x3002: ".",  # ideographic full stop
+    0x300C: '"',  # left corner bracket
+    0x300D: '"',  # right corner bracket
+    0x300E: '"',  # left white corner bracket
+    0x300F: '"',  # right white corner bracket
+}
+# Fullwidth forms of ASCII punctuation, letters and digits
+_ASCII_FALLBACKS.update({code: chr(code - 0xFEE0) for code in range(0xFF01, 0xFF5F)})
+_ASCII_FALLBACK_TABLE = str.maketrans(_ASCII_FALLBACKS)
+
+
+def _replace_unencodable(error: UnicodeError) -> Tuple[str, int]:
+    """
+    Codec error handler substituting ASCII look-alikes for unencodable text.
+
+    Only the characters the target encoding can't represent reach this, so
+    e.g. curly quotes survive in cp1252 but become straight ones in latin-1.
+    Anything without a stand-in becomes "?" as with errors="replace".
+    """
+    if not isinstance(error, UnicodeEncodeError):
+        raise error
+    unencodable = error.object[error.start : error.end]
+    replacement = unencodable.translate(_ASCII_FALLBACK_TABLE)
+    return replacement.encode("ascii", "replace").decode("ascii"), error.end
+
+
+_REPLACE_ERRORS = "subtitle_replace"
+codecs.register_error(_REPLACE_ERRORS, _replace_unencodable)
+
+# Matches encoding suffixes such as "-utf-8" left on file stems by earlier
+# conversions, including several stacked ones
+_ENCODING_SUFFIX_RE = re.compile(
+    "(?:-(?:"
+    + "|".join(re.escape(e) for e in sorted(COMMON_ENCODINGS, key=len, reverse=True))
+    + "))+$",
+    re.IGNORECASE,
+)
+
+
+def strip_encoding_suffix(stem: str) -> str:
+    """
+    Remove encoding suffixes such as "-utf-8" from a file stem.
+
+    Args:
+        stem: File name without its extension
+
+    Returns:
+        The stem without any trailing encoding suffixes
+    """
+    return _ENCODING_SUFFIX_RE.sub("", stem)
+
 
 def detect_encoding(
-    file_path: str, encodings_to_try: Optional[List[str]] = None
+    file_path: str,
+    encodings_to_try: Optional[List[str]] = None,
+    language: Optional[str] = None,
 ) -> Optional[str]:
     """
-    Attempt to detect the encoding of a subtitle file by trying multiple encodings.
+    Attempt to detect the encoding of a subtitle file.
+
+    A byte order mark decides the encoding on its own. Otherwise
+    charset-normalizer scores a sample of the file when it is installed, or
+    each candidate is tried in turn to decode the file.
 
     Args:
         file_path: Path to the subtitle file
-        encodings_to_try: List of encodings to try, defaults to COMMON_ENCODINGS
+        encodings_to_try: List of encodings to try, defaults to the recommended
+            encodings for language, or COMMON_ENCODINGS without one
+        language: Language code of the subtitles, if known
 
     Returns:
         Detected encoding or None if detection fails
     """
     if encodings_to_try is None:
-        encodings_to_try = COMMON_ENCODINGS
+        if language:
+            encodings_to_try = get_recommended_encodings(language)
+        else:
+            encodings_to_try = COMMON_ENCODINGS
 
-    if not os.path.exists(file_path):
+    try:
+        stat = os.stat(file_path)
+    except OSError:
         logger.error("File not found: %s", file_path)
         return None
 
+    # The file's identity and version form the key, so an edited file is
+    # sniffed again while repeat lookups on an unchanged one are free
+    return _detect_encoding_cached(
+        os.path.realpath(file_path),
+        stat.st_mtime_ns,
+        stat.st_size,
+        tuple(encodings_to_try),
+    )
+
+
+@functools.lru_cache(maxsize=1024)
+def _detect_encoding_cached(
+    real_path: str, mtime_ns: int, size: int, encodings_to_try: Tuple[str, ...]
+) -> Optional[str]:
+    """Detect the encoding of one version of a file; cached by detect_encoding."""
+    del mtime_ns, size  # Only part of the cache key
+    # Aliases such as "iso8859-11"/"iso-8859-11" would only be tried twice
+    encodings_to_try = tuple(_canonical_candidates(encodings_to_try).values())
+
+    bom_encoding = _sniff_bom(real_path)
+    if bom_encoding is not None:
+        logger.debug("Detected encoding from byte order mark: %s", bom_encoding)
+        return bom_encoding
+
+    # UTF-8 is by far the most common case and is cheap to confirm
+    utf8_name = _canonical_candidates(encodings_to_try).get("utf-8")
+    if utf8_name is not None and _is_valid_utf8(real_path):
+        logger.debug("Detected encoding: %s", utf8_name)
+        return utf8_name
+
+    if CHARSET_NORMALIZER_AVAILABLE:
+        return _detect_statistically(real_path, encodings_to_try)
+    return _detect_by_decoding(real_path, encodings_to_try)
+
+
+def _canonical_candidates(encodings_to_try: Sequence[str]) -> Dict[str, str]:
+    """Map canonical codec names to the caller's spelling, first one winning."""
+    candidates: Dict[str, str] = {}
     for encoding_name in encodings_to_try:
+        try:
+            candidates.setdefault(codecs.lookup(encoding_name).name, encoding_name)
+        except LookupError:
+            logger.debug("Skipping unknown encoding %s", encoding_name)
+    return candidates
+
+
+def _is_valid_utf8(file_path: str) -> bool:
+    """
+    Check whether a file is entirely valid UTF-8 without keeping its text.
+
+    Args:
+        file_path: Path to the subtitle file
+
+    Returns:
+        True if every byte of the file decodes as UTF-8
+    """
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    try:
+        with open(file_path, "rb") as f:
+            while True:
+                chunk = f.read(_DETECT_SAMPLE_SIZE)
+                if not chunk:
+                    break
+                # ASCII is a subset of UTF-8 and far cheaper to confirm,
+                # unless the previous chunk ended mid-character
+                if decoder.getstate()[0] or not chunk.isascii():
+                    decoder.decode(chunk)
+            decoder.decode(b"", final=True)
+    except (OSError, UnicodeDecodeError):
+        return False
+    return True
+
+
+def _sniff_bom(file_path: str) -> Optional[str]:
+    """
+    Return the encoding announced by a byte order mark, if the file has one.
+
+    Args:
+        file_path: Path to the subtitle file
+
+    Returns:
+        Encoding that strips the mark when decoding, or None without a mark
+    """
+    try:
+        with open(file_path, "rb") as f:
+            head = f.read(4)
+    except OSError:
+        return None
+
+    for bom, encoding_name in _BOMS:
+        if head.startswith(bom):
+            return encoding_name
+    return None
+
+
+def _detect_statistically(
+    file_path: str, encodings_to_try: Sequence[str]
+) -> Optional[str]:
+    """
+    Detect an encoding with charset-normalizer, restricted to the candidates.
+
+    Args:
+        file_path: Path to the subtitle file
+        encodings_to_try: Encodings the result may be chosen from
+
+    Returns:
+        The matching name from encodings_to_try, or None if none fits
+    """
+    try:
+        with open(file_path, "rb") as f:
+            raw = f.read(_DETECT_SAMPLE_SIZE)
+    except OSError as e:
+        logger.error("Error reading %s: %s", file_path, e)
+        return None
+
+    if len(raw) == _DETECT_SAMPLE_SIZE:
+        # Don't leave a multi-byte character cut in half at the end
+        last_newline = raw.rfind(b"\n")
+        if last_newline > 0:
+            raw = raw[: last_newline + 1]
+
+    candidates = _canonical_candidates(encodings_to_try)
+    best = charset_normalizer.from_bytes(
+        raw, cp_isolation=list(encodings_to_try)
+    ).best()
+    if raw and best is not None:
+        detected = codecs.lookup(best.encoding).name
+        if detected in candidates:
+            logger.debug("Detected encoding: %s", candidates[detected])
+            return candidates[detected]
+
+    logger.error("Could not detect encoding for %s", file_path)
+    return None
+
+
+def _detect_by_decoding(
+    file_path: str, encodings_to_try: Sequence[str]
+) -> Optional[str]:
+    """
+    Detect an encoding by decoding the whole file with each candidate in turn.
+
+    Args:
+        file_path: Path to the subtitle file
+        encodings_to_try: Encodings to try, in order of preference
+
+    Returns:
+        The first encoding that decodes the file, or None if none does
+    """
+    # Codecs that decode any byte sequence can't rule anything out, so
+    # they only get a turn once every stricter codec has failed
+    for encoding_name in sorted(encodings_to_try, key=_decodes_any_bytes):
         try:
             with open(file_path, "r", encoding=encoding_name) as f:
                 content = f.read()
@@ -97,20 +389,91 @@ def detect_encoding(
     return None
 
 
+@functools.lru_cache(maxsize=None)
+def _decodes_any_bytes(encoding_name: str) -> bool:
+    """Return True if the codec maps every possible byte to a character."""
+    try:
+        bytes(range(256)).decode(encoding_name)
+    except UnicodeDecodeError:
+        return False
+    return True
+
+
+def _codec_name(encoding_name: str) -> Optional[str]:
+    """Return the canonical codec name for an encoding, or None if unknown."""
+    try:
+        return codecs.lookup(encoding_name).name
+    except LookupError:
+        return None
+
+
+def _copy_unchanged(input_file: str, output_file: str) -> bool:
+    """
+    Copy a file that is already in the target encoding byte for byte.
+
+    Args:
+        input_file: Path to the subtitle file
+        output_file: Path to save the copy
+
+    Returns:
+        True if the file was copied, False otherwise
+    """
+    try:
+        shutil.copyfile(input_file, output_file)
+    except OSError as e:
+        logger.error("Error copying %s to %s: %s", input_file, output_file, e)
+        return False
+    return True
+
+
+def _encode_and_write(content: str, output_file: str, target_encoding: str) -> bool:
+    """
+    Encode text and write it to a file, adding a BOM for utf-8-sig.
+
+    Kept at module level so it can run in a worker process.
+
+    Args:
+        content: Decoded subtitle text
+        output_file: Path to save the encoded text
+        target_encoding: Encoding to write
+
+    Returns:
+        True if the file was written, False otherwise
+    """
+    try:
+        with open(output_file, "wb") as f:
+            # Add BOM if target is UTF-8 with BOM
+            if target_encoding.lower() == "utf-8-sig":
+                f.write(b"\xef\xbb\xbf")  # UTF-8 BOM
+                f.write(content.encode("utf-8", errors=_REPLACE_ERRORS))
+            else:
+                f.write(content.encode(target_encoding, errors=_REPLACE_ERRORS))
+    except (OSError, UnicodeError, LookupError) as e:
+        logger.error("Error writing %s as %s: %s", output_file, target_encoding, e)
+        return False
+    return True
+
+
 def convert_subtitle_encoding(
     input_file: str,
     output_file: str,
     target_encoding: str,
     source_encoding: Optional[str] = None,
+    language: Optional[str] = None,
 ) -> bool:
     """
     Convert subtitle file from source encoding to target encoding.
 
+    A file already in the target encoding is copied byte for byte, so its
+    line endings are kept. Re-encoded files are read in text mode and
+    written with LF line endings.
+
     Args:
         input_file: Path to the input subtitle file
         output_file: Path to save the converted subtitle file
         target_encoding: Target encoding to convert to
         source_encoding: Source encoding of input file (auto-detect if None)
+        language: Language code of the subtitles, used to narrow auto-detection
 
     Returns:
         True if conversion was successful, False otherwise
@@ -118,48 +481,92 @@ def convert_subtitle_encoding(
     try:
         # Determine source encoding if not provided
         if source_encoding is None:
-            source_encoding = detect_encoding(input_file)
+            source_encoding = detect_encoding(input_file, language=language)
             if source_encoding is None:
                 return False
 
-        # Read the source file
-        with open(input_file, "r", encoding=source_encoding) as f:
-            content = f.read()
+        # Already in the target encoding, so there is nothing to re-encode
+        source_codec = _codec_name(source_encoding)
+        if source_codec is not None and source_codec == _codec_name(target_encoding):
+            if os.path.realpath(output_file) == os.path.realpath(input_file):
+                logger.info(
+                    "Skipping conversion to %s as it matches source encoding",
+                    target_encoding,
+                )
+                return True
+            if not _copy_unchanged(input_file, output_file):
+                return False
+            logger.info(
+                "Copied %s unchanged, already %s -> %s",
+                input_file,
+                target_encoding,
+                output_file,
+            )
+            return True
 
-        # Write with target encoding
-        with open(output_file, "wb") as f:
-            # Add BOM if target is UTF-8 with BOM
-            if target_encoding.lower() == "utf-8-sig":
-                f.write(b"\xef\xbb\xbf")  # UTF-8 BOM
-                f.write(content.encode("utf-8", errors="replace"))
-            else:
-                f.write(content.encode(target_encoding, errors="replace"))
-
-        logger.info(
-            "Converted %s from %s to %s -> %s",
-            input_file,
-            source_encoding,
-            target_encoding,
-            output_file,
+        # A BOM is written up front for utf-8-sig, then it's plain UTF-8
+        bom = target_encoding.lower() == "utf-8-sig"
+        encoder = codecs.getincrementalencoder("utf-8" if bom else target_encoding)(
+            _REPLACE_ERRORS
         )
-        return True
-    except (OSError, IOError, UnicodeError, LookupError) as e:
+    except (OSError, UnicodeError, LookupError) as e:
         logger.error("Error converting %s to %s: %s", input_file, target_encoding, e)
         return False
 
+    output_opened = False
+    try:
+        # Stream through in chunks so neither the whole text nor its
+        # re-encoded bytes are held in memory at once
+        with open(input_file, "r", encoding=source_encoding) as src:
+            with open(output_file, "wb") as dst:
+                output_opened = True
+                if bom:
+                    dst.write(b"\xef\xbb\xbf")  # UTF-8 BOM
+                while True:
+                    chunk = src.read(_CONVERT_CHUNK_SIZE)
+                    if not chunk:
+                        break
+                    dst.write(encoder.encode(chunk))
+                dst.write(encoder.encode("", final=True))
+    except (OSError, UnicodeError, LookupError) as e:
+        logger.error("Error converting %s to %s: %s", input_file, target_encoding, e)
+        if output_opened:
+            # Don't leave a half-written file behind
+            try:
+                os.remove(output_file)
+            except OSError:
+                pass
+        return False
+
+    logger.info(
+        "Converted %s from %s to %s -> %s",
+        input_file,
+        source_encoding,
+        target_encoding,
+        output_file,
+    )
+    return True
+
 
 def convert_to_multiple_encodings(
     input_file: str,
     output_dir: Optional[str] = None,
     target_encodings: Optional[List[str]] = None,
+    max_workers: Optional[int] = 1,
+    language: Optional[str] = None,
 ) -> Dict[str, bool]:
     """
     Convert a subtitle file to multiple encodings.
 
+    The source is read and decoded once and the text re-encoded per target.
+
     Args:
         input_file: Path to the input subtitle file
         output_dir: Directory to save converted files (defaults to input file directory)
         target_encodings: List of target encodings (defaults to a common subset)
+        max_workers: Worker processes for encoding the targets; 1 encodes them
+            in this process and None uses one per CPU
+        language: Language code of the subtitles, used to narrow detection
 
     Returns:
         Dictionary mapping target encodings to conversion success status
@@ -179,42 +586,81 @@ def convert_to_multiple_encodings(
 
     # Determine source file details
     source_path = Path(input_file)
-    source_encoding = detect_encoding(input_file)
+    source_encoding = detect_encoding(input_file, language=language)
     if source_encoding is None:
         return {encoding: False for encoding in target_encodings}
 
-    results = {}
+    try:
+        with open(input_file, "r", encoding=source_encoding) as f:
+            content = f.read()
+    except (OSError, UnicodeError, LookupError) as e:
+        logger.error("Error reading %s as %s: %s", input_file, source_encoding, e)
+        return {encoding: False for encoding in target_encodings}
+
+    # Remove any existing encoding suffix
+    stem = strip_encoding_suffix(source_path.stem)
+
+    source_codec = _codec_name(source_encoding)
+    input_realpath = os.path.realpath(input_file)
+
+    results: Dict[str, bool] = {}
+    output_files: Dict[str, str] = {}
     for target_encoding in target_encodings:
         # Create output filename with encoding as suffix
-        stem = source_path.stem
-        # Remove any existing encoding suffix
-        for common_enc in COMMON_ENCODINGS:
-            suffix = f"-{common_enc}"
-            if stem.lower().endswith(suffix.lower()):
-                stem = stem[: -len(suffix)]
-
         output_file = os.path.join(
             output_dir, f"{stem}-{target_encoding}{source_path.suffix}"
         )
 
-        # Skip if the target encoding matches the source
-        if target_encoding.lower() == source_encoding.lower() and os.path.samefile(
-            input_file, output_file
-        ):
+        if _codec_name(target_encoding) == source_codec:
+            # Skip if the target is the source file itself
+            if os.path.realpath(output_file) == input_realpath:
+                logger.info(
+                    "Skipping conversion to %s as it matches source encoding",
+                    target_encoding,
+                )
+                results[target_encoding] = True
+            # Otherwise the source bytes are already what the target needs
+            elif _copy_unchanged(input_file, output_file):
+                logger.info(
+                    "Copied %s unchanged, already %s -> %s",
+                    input_file,
+                    target_encoding,
+                    output_file,
+                )
+                results[target_encoding] = True
+            else:
+                results[target_encoding] = False
+            continue
+
+        output_files[target_encoding] = output_file
+
+    if max_workers == 1 or len(output_files) <= 1:
+        for target_encoding, output_file in output_files.items():
+            results[target_encoding] = _encode_and_write(
+                content, output_file, target_encoding
+            )
+    else:
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(
+                    _encode_and_write, content, output_file, target_encoding
+                ): target_encoding
+                for target_encoding, output_file in output_files.items()
+            }
+            for future in as_completed(futures):
+                results[futures[future]] = future.result()
+
+    for target_encoding, output_file in output_files.items():
+        if results[target_encoding]:
             logger.info(
-                "Skipping conversion to %s as it matches source encoding",
+                "Converted %s from %s to %s -> %s",
+                input_file,
+                source_encoding,
                 target_encoding,
+                output_file,
             )
-            results[target_encoding] = True
-            continue
 
-        # Convert the file
-        conversion_success = convert_subtitle_encoding(
-            input_file, output_file, target_encoding, source_encoding
-        )
-        results[target_encoding] = conversion_success
-
-    return results
+    return {encoding: results[encoding] for encoding in target_encodings}
 
 
 def get_recommended_encodings(language_code: str) -> List[str]:
@@ -227,31 +673,16 @@ def get_recommended_encodings(language_code: str) -> List[str]:
     Returns:
         List of recommended encodings for the language
     """
-    # Map of language codes to recommended encodings (most preferred first)
-    language_encodings = {
-        "th": ["utf-8", "tis-620", "cp874", "iso8859-11"],  # Thai
-        "zh-CN": ["utf-8", "gb2312", "cp936"],  # Simplified Chinese
-        "zh-TW": ["utf-8", "big5", "cp950"],  # Traditional Chinese
-        "ja": ["utf-8", "shift_jis", "euc-jp", "cp932"],  # Japanese
-        "ko": ["utf-8", "euc-kr", "cp949"],  # Korean
-        "ru": ["utf-8", "cp1251", "koi8-r", "iso8859-5"],  # Russian
-        "ar": ["utf-8", "cp1256", "iso8859-6"],  # Arabic
-        "he": ["utf-8", "cp1255", "iso8859-8"],  # Hebrew
-        "tr": ["utf-8", "cp1254", "iso8859-9"],  # Turkish
-        "el": ["utf-8", "cp1253", "iso8859-7"],  # Greek
-        "vi": ["utf-8", "cp1258"],  # Vietnamese
-    }
-
-    # Default to UTF-8 and common Western encodings
-    default_encodings = ["utf-8", "utf-8-sig", "cp1252", "iso8859-1", "iso8859-15"]
-
-    # Get language code without region
-    base_lang = language_code.split("-")[0]
-
-    # Return recommended encodings or default
-    return language_encodings.get(
-        language_code, language_encodings.get(base_lang, default_encodings)
-    )
+    encodings = _RECOMMENDED_ENCODINGS.get(language_code)
+    if encodings is None:
+        # Fall back to the language code without region, then the default
+        base_lang = language_code.split("-")[0]
+        encodings = _RECOMMENDED_ENCODINGS.get(
+            base_lang, _DEFAULT_RECOMMENDED_ENCODINGS
+        )
+
+    # Callers get their own list to modify
+    return list(encodings)
 
 
 if __name__ == "__main__":
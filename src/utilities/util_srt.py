@@ -1,7 +1,7 @@
 """Subtitle utilities module."""
 
 import re
-from typing import Protocol
+from typing import Protocol, Sequence
 
 
 class SubtitleLike(Protocol):
@@ -11,7 +11,7 @@ class SubtitleLike(Protocol):
 
 
 # Type alias for better clarity
-SubtitleList = list[SubtitleLike]
+SubtitleList = Sequence[SubtitleLike]
 
 try:
     import jieba
@@ -1,8 +1,7 @@
 """Utilities module for subtitle processing."""
 
-from typing import Protocol
-
-import srt
+from operator import attrgetter
+from typing import Iterable, Iterator, Protocol, Sequence
 
 from .util_srt import (
     compute_mass_list,
@@ -20,7 +19,37 @@ class SubtitleLike(Protocol):
 
 
 # Type alias for better clarity
-SubtitleList = list[SubtitleLike]
+SubtitleList = Sequence[SubtitleLike]
+
+
+class _SrtBlock:
+    """An srt block whose index and timing lines are kept as raw text."""
+
+    __slots__ = ("header", "content")
+
+    def __init__(self, header: str, content: str) -> None:
+        self.header = header
+        self.content = content
+
+
+def _iter_srt_blocks(lines: Iterable[str]) -> Iterator[_SrtBlock]:
+    """
+    Split srt lines into blocks without parsing indices or timestamps
+    :param lines: srt file lines, e.g. an open text file; consumed lazily
+    :return: iterator of _SrtBlock, header being the index and timing lines
+    """
+    block: list[str] = []
+    for line in lines:
+        line = line.rstrip("\n")
+        if line.strip(" \t"):
+            # A byte order mark can only precede the first block
+            block.append(line if block else line.lstrip("\ufeff"))
+        elif block:
+            # One or more blank lines end a block
+            yield _SrtBlock("\n".join(block[:2]), "\n".join(block[2:]))
+            block = []
+    if block:
+        yield _SrtBlock("\n".join(block[:2]), "\n".join(block[2:]))
 
 
 def simple_translate_srt(
@@ -36,7 +65,10 @@ def simple_translate_srt(
     # Initialize a translator
     translator = Translator()
 
-    sen_list = [sub.content.replace("\n", "") for sub in origin_sub]
+    # Line breaks become spaces so words on either side aren't glued together
+    sen_list = [
+        content.replace("\n", " ") for content in map(attrgetter("content"), origin_sub)
+    ]
 
     # Translate the subtitle and split into list
     translated_sen: str = translator.translate_lines(sen_list, src_lang, target_lang)
@@ -138,8 +170,9 @@ def translate_and_compose(
     :param space: is the vocabulary of target language split by space
     :return: None
     """
+    # Blocks are built line by line so the whole file is never held as one string
     with open(input_file, encoding=encoding) as srt_file:
-        subtitle = list(srt.parse(srt_file.read()))
+        subtitle = list(_iter_srt_blocks(srt_file))
 
     if mode == "naive":
         translated_list = simple_translate_srt(subtitle, src_lang, target_lang)
@@ -157,5 +190,6 @@ def translate_and_compose(
         print("Error")
         return
 
+    # Headers go back out untouched; only the content was rewritten
     with open(output_file, "w", encoding="UTF-8") as f:
-        f.write(srt.compose(subtitle))
+        f.writelines(f"{sub.header}\n{sub.content}\n\n" for sub in subtitle)
@@ -3,10 +3,12 @@ Tests for the CLI functionality.
 """
 
 import argparse
+import os
 import sys
 import tempfile
 import unittest
 from pathlib import Path
+from typing import Dict, List
 from unittest.mock import Mock, patch
 
 # Add the parent directory to sys.path
@@ -14,6 +16,7 @@ sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
 # Imports must happen after sys.path modification  # pylint: disable=wrong-import-position
 from src.subtranslate.cli import (
+    _build_parser,
     handle_encoding_command,
     handle_translate_command,
     main,
@@ -23,6 +26,48 @@ from src.subtranslate.core.subtitle import SubtitleError
 from src.subtranslate.core.translation import TranslationError
 
 
+def _encode_args(**overrides: object) -> argparse.Namespace:
+    """Build encode command arguments, defaulting to what parse_args would give."""
+    defaults: Dict[str, object] = {
+        "list_encodings": False,
+        "input": None,
+        "output_dir": None,
+        "from_encoding": None,
+        "to_encoding": None,
+        "all": False,
+        "recommended": False,
+        "language": "en",
+        "batch": False,
+        "pattern": "*.srt",
+        "jobs": 1,
+        "verbose": False,
+    }
+    defaults.update(overrides)
+    return argparse.Namespace(**defaults)
+
+
+def _translate_args(**overrides: object) -> argparse.Namespace:
+    """Build translate command arguments for a single file into Spanish."""
+    defaults: Dict[str, object] = {
+        "input": "input.srt",
+        "output": "output.srt",
+        "src_lang": "en",
+        "target_lang": "es",
+        "mode": "split",
+        "both": True,
+        "space": False,
+        "encoding": "UTF-8",
+        "batch": False,
+        "pattern": "*.srt",
+        "api_key": None,
+        "service": "google",
+        "verbose": False,
+        "no_resume": False,
+    }
+    defaults.update(overrides)
+    return argparse.Namespace(**defaults)
+
+
 class TestParseArgs(unittest.TestCase):
     """Tests for argument parsing."""
 
@@ -48,6 +93,25 @@ class TestParseArgs(unittest.TestCase):
         self.assertEqual(args.src_lang, "fr")
         self.assertEqual(args.target_lang, "de")
 
+    def test_parse_args_reuses_parser_and_interns_languages(self) -> None:
+        """Test that the parser is built once and language codes are interned."""
+        first = parse_args(["input.srt", "output.srt", "-t", "de"])
+        second = parse_args(["translate", "a.srt", "b.srt", "-t", "".join("de")])
+
+        self.assertIs(_build_parser("translate"), _build_parser("translate"))
+        self.assertIs(first.target_lang, second.target_lang)
+
+    def test_parse_args_builds_only_requested_command(self) -> None:
+        """Test that only the command being parsed gets its arguments."""
+        parser, encode_parser = _build_parser("translate")
+
+        self.assertIn("encode", parser.format_help())
+        self.assertTrue(parser.format_usage().startswith("usage: subtranslate "))
+        self.assertNotIn("--to-encoding", encode_parser.format_help())
+        self.assertEqual(
+            parse_args(["encode", "in.srt", "-t", "cp874"]).input, "in.srt"
+        )
+
     def test_parse_args_translate_options(self) -> None:
         """Test parsing translate command with all options."""
         args = parse_args(
@@ -123,6 +187,8 @@ class TestParseArgs(unittest.TestCase):
                 "--batch",
                 "--pattern",
                 "*.srt",
+                "--jobs",
+                "3",
                 "--verbose",
             ]
         )
@@ -137,6 +203,7 @@ class TestParseArgs(unittest.TestCase):
         self.assertEqual(args.language, "th")
         self.assertTrue(args.batch)
         self.assertEqual(args.pattern, "*.srt")
+        self.assertEqual(args.jobs, 3)
         self.assertTrue(args.verbose)
 
     def test_parse_args_encode_missing_input(self) -> None:
@@ -157,18 +224,38 @@ class TestParseArgs(unittest.TestCase):
 class TestHandleEncodingCommand(unittest.TestCase):
     """Tests for handle_encoding_command function."""
 
+    temp_dir: "tempfile.TemporaryDirectory[str]"
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        """Set up a temporary directory shared by the tests in this class."""
+        cls.temp_dir = tempfile.TemporaryDirectory()
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        """Clean up the shared temporary directory."""
+        cls.temp_dir.cleanup()
+
     def setUp(self) -> None:
-        """Set up test fixtures."""
-        self.temp_dir = tempfile.TemporaryDirectory()
+        """Stub out detection and conversion for the single-file tests."""
+        self.mock_detect = self._start_patch(
+            "src.subtranslate.cli.detect_encoding", return_value="utf-8"
+        )
+        self.mock_convert = self._start_patch(
+            "src.subtranslate.cli.convert_subtitle_encoding", return_value=True
+        )
 
-    def tearDown(self) -> None:
-        """Clean up test fixtures."""
-        self.temp_dir.cleanup()
+    def _start_patch(self, target: str, return_value: object) -> Mock:
+        """Patch target with a mock for the duration of the current test."""
+        patcher = patch(target, return_value=return_value)
+        mock: Mock = patcher.start()
+        self.addCleanup(patcher.stop)
+        return mock
 
     @patch("src.subtranslate.cli.COMMON_ENCODINGS", ["utf-8", "tis-620", "cp874"])
     def test_handle_encoding_list_encodings(self) -> None:
         """Test listing encodings."""
-        args = argparse.Namespace(list_encodings=True, verbose=False)
+        args = _encode_args(list_encodings=True)
 
         with patch("builtins.print") as mock_print:
             result = handle_encoding_command(args)
@@ -180,161 +267,89 @@ class TestHandleEncodingCommand(unittest.TestCase):
         mock_print.assert_any_call("  tis-620")
         mock_print.assert_any_call("  cp874")
 
-    @patch("src.subtranslate.cli.convert_subtitle_encoding")
-    @patch("src.subtranslate.cli.detect_encoding")
-    @patch("os.path.isfile")
-    def test_handle_encoding_single_file(
-        self, mock_isfile: Mock, mock_detect: Mock, mock_convert: Mock
-    ) -> None:
+    @patch("os.path.isfile", return_value=True)
+    def test_handle_encoding_single_file(self, _mock_isfile: Mock) -> None:
         """Test encoding conversion for single file."""
-        mock_isfile.return_value = True
-        mock_detect.return_value = "utf-8"
-        mock_convert.return_value = True
-
-        args = argparse.Namespace(
-            list_encodings=False,
-            input="test.srt",
-            output_dir=None,
-            from_encoding=None,
-            to_encoding="tis-620",
-            all=False,
-            recommended=False,
-            language="en",
-            batch=False,
-            pattern="*.srt",
-            verbose=False,
-        )
+        args = _encode_args(input="test.srt", to_encoding="tis-620")
 
         result = handle_encoding_command(args)
 
         self.assertEqual(result, 0)
-        mock_detect.assert_called_once_with("test.srt")
-        mock_convert.assert_called_once()
+        self.mock_detect.assert_called_once_with("test.srt", language=None)
+        self.mock_convert.assert_called_once()
 
-    @patch("src.subtranslate.cli.convert_subtitle_encoding")
-    @patch("src.subtranslate.cli.detect_encoding")
-    @patch("os.path.isfile")
+    @patch("os.path.isfile", return_value=True)
     def test_handle_encoding_single_file_multiple_encodings(
-        self, mock_isfile: Mock, mock_detect: Mock, mock_convert: Mock
+        self, _mock_isfile: Mock
     ) -> None:
         """Test encoding conversion for single file to multiple encodings."""
-        mock_isfile.return_value = True
-        mock_detect.return_value = "utf-8"
-        mock_convert.return_value = True
-
-        args = argparse.Namespace(
-            list_encodings=False,
-            input="test.srt",
-            output_dir=None,
-            from_encoding=None,
-            to_encoding="tis-620,cp874",
-            all=False,
-            recommended=False,
-            language="en",
-            batch=False,
-            pattern="*.srt",
-            verbose=False,
-        )
+        args = _encode_args(input="test.srt", to_encoding="tis-620,cp874")
 
         result = handle_encoding_command(args)
 
         self.assertEqual(result, 0)
         # Should convert to both encodings
-        self.assertEqual(mock_convert.call_count, 2)
+        self.assertEqual(self.mock_convert.call_count, 2)
+
+    @patch("os.path.isfile", return_value=True)
+    def test_handle_encoding_single_file_strips_old_suffixes(
+        self, _mock_isfile: Mock
+    ) -> None:
+        """Test that stacked encoding suffixes aren't repeated in output names."""
+        args = _encode_args(input="movie-UTF-8-tis-620.srt", to_encoding="cp874")
+
+        handle_encoding_command(args)
+
+        self.mock_convert.assert_called_once_with(
+            "movie-UTF-8-tis-620.srt",
+            os.path.join(".", "movie-cp874.srt"),
+            "cp874",
+            "utf-8",
+        )
 
     @patch("src.subtranslate.cli.get_recommended_encodings")
-    @patch("src.subtranslate.cli.convert_subtitle_encoding")
-    @patch("src.subtranslate.cli.detect_encoding")
-    @patch("os.path.isfile")
+    @patch("os.path.isfile", return_value=True)
     def test_handle_encoding_recommended(
-        self,
-        mock_isfile: Mock,
-        mock_detect: Mock,
-        mock_convert: Mock,
-        mock_recommended: Mock,
+        self, _mock_isfile: Mock, mock_recommended: Mock
     ) -> None:
         """Test encoding conversion with recommended encodings."""
-        mock_isfile.return_value = True
-        mock_detect.return_value = "utf-8"
-        mock_convert.return_value = True
         mock_recommended.return_value = ["tis-620", "cp874"]
 
-        args = argparse.Namespace(
-            list_encodings=False,
-            input="test.srt",
-            output_dir=None,
-            from_encoding=None,
-            to_encoding=None,
-            all=False,
-            recommended=True,
-            language="th",
-            batch=False,
-            pattern="*.srt",
-            verbose=False,
-        )
+        args = _encode_args(input="test.srt", recommended=True, language="th")
 
         result = handle_encoding_command(args)
 
         self.assertEqual(result, 0)
         mock_recommended.assert_called_once_with("th")
-        self.assertEqual(mock_convert.call_count, 2)
+        self.mock_detect.assert_called_once_with("test.srt", language="th")
+        self.assertEqual(self.mock_convert.call_count, 2)
 
     @patch("src.subtranslate.cli.COMMON_ENCODINGS", ["utf-8", "tis-620"])
-    @patch("src.subtranslate.cli.convert_subtitle_encoding")
-    @patch("src.subtranslate.cli.detect_encoding")
-    @patch("os.path.isfile")
-    def test_handle_encoding_all(self, mock_isfile, mock_detect, mock_convert):
+    @patch("os.path.isfile", return_value=True)
+    def test_handle_encoding_all(self, _mock_isfile: Mock) -> None:
         """Test encoding conversion to all encodings."""
-        mock_isfile.return_value = True
-        mock_detect.return_value = "utf-8"
-        mock_convert.return_value = True
-
-        args = argparse.Namespace(
-            list_encodings=False,
-            input="test.srt",
-            output_dir=None,
-            from_encoding=None,
-            to_encoding=None,
-            all=True,
-            recommended=False,
-            language="en",
-            batch=False,
-            pattern="*.srt",
-            verbose=False,
-        )
+        args = _encode_args(input="test.srt", all=True)
 
         result = handle_encoding_command(args)
 
         self.assertEqual(result, 0)
-        self.assertEqual(mock_convert.call_count, 2)
+        self.assertEqual(self.mock_convert.call_count, 2)
 
     @patch("os.path.isfile")
     def test_handle_encoding_file_not_found(self, mock_isfile):
         """Test handling non-existent file."""
         mock_isfile.return_value = False
 
-        args = argparse.Namespace(
-            list_encodings=False,
-            input="nonexistent.srt",
-            output_dir=None,
-            from_encoding=None,
-            to_encoding="tis-620",
-            all=False,
-            recommended=False,
-            language="en",
-            batch=False,
-            pattern="*.srt",
-            verbose=False,
-        )
+        args = _encode_args(input="nonexistent.srt", to_encoding="tis-620")
 
         result = handle_encoding_command(args)
 
         self.assertEqual(result, 1)
 
     @patch("src.subtranslate.cli.convert_to_multiple_encodings")
-    @patch("glob.glob")
+    @patch("src.subtranslate.cli.find_subtitle_files")
     @patch("os.path.isdir")
-    def test_handle_encoding_batch(self, mock_isdir, mock_glob, mock_convert_multiple):
+    def test_handle_encoding_batch(self, mock_isdir, mock_find, mock_convert_multiple):
         """Test batch encoding conversion."""
         mock_isdir.return_value = True
         # Use absolute paths within the temp directory to avoid cross-drive issues
@@ -342,21 +357,11 @@ class TestHandleEncodingCommand(unittest.TestCase):
 
         temp_file1 = os.path.join(self.temp_dir.name, "file1.srt")
         temp_file2 = os.path.join(self.temp_dir.name, "file2.srt")
-        mock_glob.return_value = [temp_file1, temp_file2]
+        mock_find.return_value = [temp_file1, temp_file2]
         mock_convert_multiple.return_value = {"utf-8": True, "tis-620": True}
 
-        args = argparse.Namespace(
-            list_encodings=False,
-            input=self.temp_dir.name,
-            output_dir=None,
-            from_encoding=None,
-            to_encoding="utf-8,tis-620",
-            all=False,
-            recommended=False,
-            language="en",
-            batch=True,
-            pattern="*.srt",
-            verbose=False,
+        args = _encode_args(
+            input=self.temp_dir.name, to_encoding="utf-8,tis-620", batch=True
         )
 
         result = handle_encoding_command(args)
@@ -365,26 +370,47 @@ class TestHandleEncodingCommand(unittest.TestCase):
         # Should convert multiple files
         self.assertEqual(mock_convert_multiple.call_count, 2)
 
-    @patch("glob.glob")
+    def test_handle_encoding_batch_parallel_jobs(self) -> None:
+        """Test batch encoding conversion spread over worker processes."""
+        import os  # pylint: disable=import-outside-toplevel
+
+        # Write into a directory of this test's own within the shared one
+        input_dir = os.path.join(self.temp_dir.name, self._testMethodName)
+        os.mkdir(input_dir)
+        for name in ("file1.srt", "file2.srt"):
+            with open(os.path.join(input_dir, name), "w", encoding="utf-8") as f:
+                f.write("1\n00:00:01,000 --> 00:00:02,000\nHello there\n" * 5)
+        output_dir = os.path.join(input_dir, "out")
+
+        args = _encode_args(
+            input=input_dir,
+            output_dir=output_dir,
+            to_encoding="utf-16,cp1252",
+            batch=True,
+            jobs=2,
+        )
+
+        result = handle_encoding_command(args)
+
+        self.assertEqual(result, 0)
+        self.assertEqual(
+            sorted(os.listdir(output_dir)),
+            [
+                "file1-cp1252.srt",
+                "file1-utf-16.srt",
+                "file2-cp1252.srt",
+                "file2-utf-16.srt",
+            ],
+        )
+
+    @patch("src.subtranslate.cli.find_subtitle_files")
     @patch("os.path.isdir")
-    def test_handle_encoding_batch_no_files(self, mock_isdir, mock_glob):
+    def test_handle_encoding_batch_no_files(self, mock_isdir, mock_find):
         """Test batch encoding with no matching files."""
         mock_isdir.return_value = True
-        mock_glob.return_value = []
-
-        args = argparse.Namespace(
-            list_encodings=False,
-            input=self.temp_dir.name,
-            output_dir=None,
-            from_encoding=None,
-            to_encoding="tis-620",
-            all=False,
-            recommended=False,
-            language="en",
-            batch=True,
-            pattern="*.srt",
-            verbose=False,
-        )
+        mock_find.return_value = []
+
+        args = _encode_args(input=self.temp_dir.name, to_encoding="tis-620", batch=True)
 
         result = handle_encoding_command(args)
 
@@ -395,19 +421,7 @@ class TestHandleEncodingCommand(unittest.TestCase):
         """Test batch encoding with non-directory input."""
         mock_isdir.return_value = False
 
-        args = argparse.Namespace(
-            list_encodings=False,
-            input="notadirectory",
-            output_dir=None,
-            from_encoding=None,
-            to_encoding="tis-620",
-            all=False,
-            recommended=False,
-            language="en",
-            batch=True,
-            pattern="*.srt",
-            verbose=False,
-        )
+        args = _encode_args(input="notadirectory", to_encoding="tis-620", batch=True)
 
         result = handle_encoding_command(args)
 
@@ -417,15 +431,19 @@ class TestHandleEncodingCommand(unittest.TestCase):
 class TestHandleTranslateCommand(unittest.TestCase):
     """Tests for handle_translate_command function."""
 
-    def setUp(self) -> None:
-        """Set up test fixtures."""
-        self.temp_dir = tempfile.TemporaryDirectory()
+    temp_dir: "tempfile.TemporaryDirectory[str]"
 
-    def tearDown(self) -> None:
-        """Clean up test fixtures."""
-        self.temp_dir.cleanup()
+    @classmethod
+    def setUpClass(cls) -> None:
+        """Set up a temporary directory shared by the tests in this class."""
+        cls.temp_dir = tempfile.TemporaryDirectory()
 
-    @patch("src.subtranslate.cli.SubtitleTranslator")
+    @classmethod
+    def tearDownClass(cls) -> None:
+        """Clean up the shared temporary directory."""
+        cls.temp_dir.cleanup()
+
+    @patch("src.subtranslate.core.main.SubtitleTranslator")
     @patch("os.path.isfile")
     def test_handle_translate_single_file(self, mock_isfile, mock_translator_class):
         """Test translating a single file."""
@@ -433,32 +451,17 @@ class TestHandleTranslateCommand(unittest.TestCase):
         mock_translator = Mock()
         mock_translator_class.return_value = mock_translator
 
-        args = argparse.Namespace(
-            input="input.srt",
-            output="output.srt",
-            src_lang="en",
-            target_lang="es",
-            mode="split",
-            both=True,
-            space=False,
-            encoding="UTF-8",
-            batch=False,
-            pattern="*.srt",
-            api_key="test_key",
-            service="google",
-            verbose=False,
-            no_resume=False,
-        )
+        args = _translate_args(api_key="test_key")
 
         result = handle_translate_command(args)
 
         self.assertEqual(result, 0)
         mock_translator_class.assert_called_once_with(
-            translation_service="google", api_key="test_key"
+            translation_service="google", api_key="test_key", warmup=True
         )
         mock_translator.translate_file.assert_called_once()
 
-    @patch("src.subtranslate.cli.SubtitleTranslator")
+    @patch("src.subtranslate.core.main.SubtitleTranslator")
     @patch("os.path.isfile")
     def test_handle_translate_single_file_not_found(
         self, mock_isfile, _mock_translator_class
@@ -466,28 +469,13 @@ class TestHandleTranslateCommand(unittest.TestCase):
         """Test translating non-existent file."""
         mock_isfile.return_value = False
 
-        args = argparse.Namespace(
-            input="nonexistent.srt",
-            output="output.srt",
-            src_lang="en",
-            target_lang="es",
-            mode="split",
-            both=True,
-            space=False,
-            encoding="UTF-8",
-            batch=False,
-            pattern="*.srt",
-            api_key=None,
-            service="google",
-            verbose=False,
-            no_resume=False,
-        )
+        args = _translate_args(input="nonexistent.srt")
 
         result = handle_translate_command(args)
 
         self.assertEqual(result, 1)
 
-    @patch("src.subtranslate.cli.SubtitleTranslator")
+    @patch("src.subtranslate.core.main.SubtitleTranslator")
     @patch("os.path.isdir")
     def test_handle_translate_batch(self, mock_isdir, mock_translator_class):
         """Test batch translation."""
@@ -499,21 +487,8 @@ class TestHandleTranslateCommand(unittest.TestCase):
             "file2.srt": {"status": "success"},
         }
 
-        args = argparse.Namespace(
-            input=self.temp_dir.name,
-            output=self.temp_dir.name + "_out",
-            src_lang="en",
-            target_lang="es",
-            mode="split",
-            both=True,
-            space=False,
-            encoding="UTF-8",
-            batch=True,
-            pattern="*.srt",
-            api_key=None,
-            service="google",
-            verbose=False,
-            no_resume=False,
+        args = _translate_args(
+            input=self.temp_dir.name, output=self.temp_dir.name + "_out", batch=True
         )
 
         result = handle_translate_command(args)
@@ -521,7 +496,7 @@ class TestHandleTranslateCommand(unittest.TestCase):
         self.assertEqual(result, 0)
         mock_translator.batch_translate_directory.assert_called_once()
 
-    @patch("src.subtranslate.cli.SubtitleTranslator")
+    @patch("src.subtranslate.core.main.SubtitleTranslator")
     @patch("os.path.isdir")
     def test_handle_translate_batch_no_success(self, mock_isdir, mock_translator_class):
         """Test batch translation with no successful files."""
@@ -533,21 +508,8 @@ class TestHandleTranslateCommand(unittest.TestCase):
             "file2.srt": {"status": "rate_limited"},
         }
 
-        args = argparse.Namespace(
-            input=self.temp_dir.name,
-            output=self.temp_dir.name + "_out",
-            src_lang="en",
-            target_lang="es",
-            mode="split",
-            both=True,
-            space=False,
-            encoding="UTF-8",
-            batch=True,
-            pattern="*.srt",
-            api_key=None,
-            service="google",
-            verbose=False,
-            no_resume=False,
+        args = _translate_args(
+            input=self.temp_dir.name, output=self.temp_dir.name + "_out", batch=True
         )
 
         result = handle_translate_command(args)
@@ -559,22 +521,7 @@ class TestHandleTranslateCommand(unittest.TestCase):
         """Test batch translation with non-directory input."""
         mock_isdir.return_value = False
 
-        args = argparse.Namespace(
-            input="notadirectory",
-            output="output",
-            src_lang="en",
-            target_lang="es",
-            mode="split",
-            both=True,
-            space=False,
-            encoding="UTF-8",
-            batch=True,
-            pattern="*.srt",
-            api_key=None,
-            service="google",
-            verbose=False,
-            no_resume=False,
-        )
+        args = _translate_args(input="notadirectory", output="output", batch=True)
 
         result = handle_translate_command(args)
 
@@ -584,36 +531,28 @@ class TestHandleTranslateCommand(unittest.TestCase):
         """Test automatic space detection for different target languages."""
         space_languages = ["fr", "en", "de", "es", "it", "pt", "ru"]
 
-        for lang in space_languages:
-            with patch(
-                "src.subtranslate.cli.SubtitleTranslator"
-            ) as mock_translator_class, patch("os.path.isfile", return_value=True):
-
-                mock_translator = Mock()
-                mock_translator_class.return_value = mock_translator
-
-                args = argparse.Namespace(
-                    input="input.srt",
-                    output="output.srt",
-                    src_lang="en",
-                    target_lang=lang,
-                    mode="split",
-                    both=True,
-                    space=False,  # Should be overridden
-                    encoding="UTF-8",
-                    batch=False,
-                    pattern="*.srt",
-                    api_key=None,
-                    service="google",
-                    verbose=False,
-                    no_resume=False,
-                )
-
-                handle_translate_command(args)
-
-                # Check that space=True was passed for this language
-                call_args = mock_translator.translate_file.call_args
-                self.assertTrue(call_args[1]["space"])
+        with (
+            patch(
+                "src.subtranslate.core.main.SubtitleTranslator"
+            ) as mock_translator_class,
+            patch("os.path.isfile", return_value=True),
+        ):
+            # Keyword arguments of each translate_file call, in order
+            captured: List[Dict[str, object]] = []
+            mock_translator_class.return_value.translate_file.side_effect = (
+                lambda *_args, **kwargs: captured.append(kwargs)
+            )
+
+            for lang in space_languages:
+                with self.subTest(lang=lang):
+                    args = _translate_args(
+                        target_lang=lang, space=False  # Should be overridden
+                    )
+
+                    handle_translate_command(args)
+
+                    # Check that space=True was passed for this language
+                    self.assertTrue(captured[-1]["space"])
 
 
 class TestMain(unittest.TestCase):
@@ -667,6 +606,25 @@ class TestMain(unittest.TestCase):
 
         self.assertEqual(result, 1)
 
+    def test_main_error_messages(self) -> None:
+        """Test that errors are logged with a prefix matching their type."""
+        cases = [
+            (SubtitleError("bad"), "Subtitle processing error"),
+            (TranslationError("bad"), "Translation error"),
+            (OSError("bad"), "File system error"),
+            (ValueError("bad"), "Unexpected error"),
+        ]
+        for error, message in cases:
+            with (
+                self.subTest(message=message),
+                patch(
+                    "src.subtranslate.cli.handle_translate_command", side_effect=error
+                ),
+                patch("src.subtranslate.cli.logger") as mock_logger,
+            ):
+                self.assertEqual(main(["input.srt", "output.srt"]), 1)
+                mock_logger.error.assert_called_once_with("%s: %s", message, error)
+
     def test_main_keyboard_interrupt(self) -> None:
         """Test main function handling KeyboardInterrupt."""
         with patch("src.subtranslate.cli.handle_translate_command") as mock_handle:
@@ -700,9 +658,10 @@ class TestMain(unittest.TestCase):
             mock_args.verbose = True
             mock_parse.return_value = mock_args
 
-            with patch(
-                "src.subtranslate.cli.handle_translate_command"
-            ) as mock_handle, patch("traceback.print_exc") as mock_traceback:
+            with (
+                patch("src.subtranslate.cli.handle_translate_command") as mock_handle,
+                patch("traceback.print_exc") as mock_traceback,
+            ):
 
                 mock_handle.side_effect = SubtitleError("Test error")
 
@@ -4,10 +4,16 @@ Tests for the encoding converter utility.
 """
 
 import os
+import shutil
 import tempfile
 import unittest
+from unittest.mock import patch
 
+from src.subtranslate import utilities
+from src.subtranslate.utilities import encoding_converter
 from src.subtranslate.utilities.encoding_converter import (
+    _detect_encoding_cached,
+    _is_valid_utf8,
     convert_subtitle_encoding,
     convert_to_multiple_encodings,
     detect_encoding,
@@ -18,10 +24,14 @@ from src.subtranslate.utilities.encoding_converter import (
 class TestEncodingConverter(unittest.TestCase):
     """Test the encoding converter functionality."""
 
-    def setUp(self) -> None:
-        """Create a temporary file with sample content for testing."""
-        self.temp_dir = tempfile.TemporaryDirectory()
-        self.temp_file = os.path.join(self.temp_dir.name, "sample.srt")
+    sample_dir: "tempfile.TemporaryDirectory[str]"
+    sample_file: str
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        """Write the sample file once; tests must not modify it in place."""
+        cls.sample_dir = tempfile.TemporaryDirectory()
+        cls.sample_file = os.path.join(cls.sample_dir.name, "sample.srt")
 
         # Create a sample subtitle file with UTF-8 encoding
         sample_content = """1
@@ -34,26 +44,161 @@ Some characters: ไทย 中文 日本語 한국어
 More text with special characters:
 áéíóú äëïöü ñ ç
 """
-        with open(self.temp_file, "w", encoding="utf-8") as f:
+        with open(cls.sample_file, "w", encoding="utf-8") as f:
             f.write(sample_content)
 
+    @classmethod
+    def tearDownClass(cls) -> None:
+        """Remove the sample file."""
+        cls.sample_dir.cleanup()
+
+    def setUp(self) -> None:
+        """Create a temporary directory for each test's output files."""
+        _detect_encoding_cached.cache_clear()
+        self.temp_dir = tempfile.TemporaryDirectory()
+
     def tearDown(self) -> None:
         """Clean up temporary files."""
         self.temp_dir.cleanup()
 
+    def _copy_sample(self, name: str = "sample.srt") -> str:
+        """Copy the sample file into this test's directory so it can be changed."""
+        path = os.path.join(self.temp_dir.name, name)
+        shutil.copyfile(self.sample_file, path)
+        return path
+
     def test_detect_encoding(self) -> None:
         """Test that encoding detection works."""
-        detected = detect_encoding(self.temp_file)
+        detected = detect_encoding(self.sample_file)
         self.assertIsNotNone(detected)
         # Should detect UTF-8 or UTF-8-sig
         assert detected is not None
         self.assertTrue(detected.lower() in ["utf-8", "utf-8-sig"])
 
+    def _write_bytes(self, name: str, data: bytes) -> str:
+        """Write raw bytes to a file in the temporary directory."""
+        path = os.path.join(self.temp_dir.name, name)
+        with open(path, "wb") as f:
+            f.write(data)
+        return path
+
+    def test_detect_encoding_legacy_codepage(self) -> None:
+        """Test that a Cyrillic cp1251 file isn't mistaken for another codepage."""
+        text = "Привет, мир! Это проверка кодировки субтитров.\n" * 10
+        path = self._write_bytes("cyrillic.srt", text.encode("cp1251"))
+
+        self.assertEqual(detect_encoding(path), "cp1251")
+
+    def test_detect_encoding_byte_order_marks(self) -> None:
+        """Test that a byte order mark decides the encoding without detection."""
+        text = "Héllo wörld\n" * 20
+        cases = [
+            ("utf-8-sig", "utf-8-sig"),
+            ("utf-16-le", "utf-16"),
+            ("utf-16-be", "utf-16"),
+            ("utf-32-le", "utf-32"),
+            ("utf-32-be", "utf-32"),
+        ]
+        for write_encoding, expected in cases:
+            with self.subTest(encoding=write_encoding):
+                data = text.encode(write_encoding)
+                if write_encoding != "utf-8-sig":
+                    data = "\ufeff".encode(write_encoding) + data
+                path = self._write_bytes(f"bom-{write_encoding}.srt", data)
+
+                with patch(
+                    "src.subtranslate.utilities.encoding_converter."
+                    "_detect_statistically"
+                ) as mock_detect:
+                    detected = detect_encoding(path)
+
+                self.assertEqual(detected, expected)
+                mock_detect.assert_not_called()
+                with open(path, "r", encoding=detected) as f:
+                    self.assertEqual(f.read(), text)
+
+    def test_detect_encoding_large_file_sample(self) -> None:
+        """Test a file larger than the sample, with a character cut at its end."""
+        text = "สวัสดีครับ 中文\n" * 10000
+        path = self._write_bytes("large.srt", text.encode("utf-8"))
+
+        self.assertEqual(detect_encoding(path), "utf-8")
+
+    def test_detect_encoding_cached_until_file_changes(self) -> None:
+        """Test that detection is cached per file version."""
+        with patch(
+            "src.subtranslate.utilities.encoding_converter._is_valid_utf8",
+            return_value=True,
+        ) as mock_detect:
+            sample = self._copy_sample()
+            detect_encoding(sample)
+            detect_encoding(sample)
+            self.assertEqual(mock_detect.call_count, 1)
+
+            with open(sample, "a", encoding="utf-8") as f:
+                f.write("\n3\n00:00:11,000 --> 00:00:12,000\nMore\n")
+            detect_encoding(sample)
+            self.assertEqual(mock_detect.call_count, 2)
+
+    def test_detect_encoding_utf8_fast_path(self) -> None:
+        """Test that valid UTF-8 is confirmed without the statistical detector."""
+        cases = {
+            "ascii.srt": b"Hello world\n" * 10000,
+            "split.srt": b"a" * 65535 + "中文\n".encode("utf-8"),
+        }
+        for name, data in cases.items():
+            with self.subTest(name=name):
+                path = self._write_bytes(name, data)
+
+                with patch(
+                    "src.subtranslate.utilities.encoding_converter."
+                    "_detect_statistically"
+                ) as mock_detect:
+                    self.assertEqual(detect_encoding(path), "utf-8")
+
+                mock_detect.assert_not_called()
+
+    def test_is_valid_utf8_rejects_truncated_character(self) -> None:
+        """Test that a multi-byte character cut off at the end fails validation."""
+        path = self._write_bytes("cut.srt", b"a" * 65536 + "中".encode("utf-8")[:2])
+
+        self.assertFalse(_is_valid_utf8(path))
+
+    def test_detect_encoding_language_narrows_candidates(self) -> None:
+        """Test that a language code picks its recommended encodings."""
+        text = "Привет, мир! Это проверка кодировки субтитров.\n" * 10
+        path = self._write_bytes("koi8.srt", text.encode("koi8-r"))
+
+        self.assertEqual(detect_encoding(path, language="ru"), "koi8-r")
+
+    def test_detect_by_decoding_tries_permissive_codecs_last(self) -> None:
+        """Test that codecs accepting any byte don't win the trial loop early."""
+        text = "Привет, мир! Это проверка кодировки субтитров.\n" * 10
+        path = self._write_bytes("cyrillic.srt", text.encode("cp1251"))
+
+        with patch(
+            "src.subtranslate.utilities.encoding_converter."
+            "CHARSET_NORMALIZER_AVAILABLE",
+            False,
+        ):
+            detected = detect_encoding(path, ["iso8859-1", "cp1251"])
+
+        self.assertEqual(detected, "cp1251")
+
+    def test_detect_encoding_without_charset_normalizer(self) -> None:
+        """Test the trial-decoding fallback."""
+        with patch(
+            "src.subtranslate.utilities.encoding_converter."
+            "CHARSET_NORMALIZER_AVAILABLE",
+            False,
+        ):
+            self.assertEqual(detect_encoding(self.sample_file), "utf-8")
+
     def test_convert_encoding(self) -> None:
         """Test converting a file to a different encoding."""
         output_file = os.path.join(self.temp_dir.name, "converted.srt")
         result = convert_subtitle_encoding(
-            self.temp_file, output_file, "iso8859-1", "utf-8"
+            self.sample_file, output_file, "iso8859-1", "utf-8"
         )
         self.assertTrue(result)
         self.assertTrue(os.path.exists(output_file))
@@ -68,10 +213,88 @@ More text with special characters:
         except Exception as e:  # pylint: disable=broad-exception-caught
             self.fail(f"Failed to read converted file: {e}")
 
+    def test_convert_encoding_streams_large_file(self) -> None:
+        """Test chunked conversion across chunk boundaries matches a one-shot encode."""
+        text = "ไทย 中文 ÿ\n" * 20000
+        source = self._write_bytes("large.srt", text.encode("utf-8"))
+
+        for target in ("utf-16", "utf-8-sig", "cp874"):
+            with (
+                self.subTest(target=target),
+                patch.object(encoding_converter, "_CONVERT_CHUNK_SIZE", 4099),
+            ):
+                output = os.path.join(self.temp_dir.name, f"large-{target}.srt")
+
+                self.assertTrue(
+                    convert_subtitle_encoding(source, output, target, "utf-8")
+                )
+                with open(output, "rb") as f:
+                    self.assertEqual(f.read(), text.encode(target, errors="replace"))
+
+    def test_convert_encoding_decode_error_removes_output(self) -> None:
+        """Test that a failed conversion doesn't leave a partial file behind."""
+        source = self._write_bytes("bad.srt", b"a" * 100000 + b"\xff\xfe")
+        output = os.path.join(self.temp_dir.name, "bad-cp1252.srt")
+
+        self.assertFalse(convert_subtitle_encoding(source, output, "cp1252", "utf-8"))
+        self.assertFalse(os.path.exists(output))
+
+    def test_convert_encoding_ascii_fallbacks(self) -> None:
+        """Test that unencodable punctuation gets an ASCII stand-in, not '?'."""
+        source = self._write_bytes(
+            "quotes.srt", "“Hi” — ♪ ＯＫ… 中。\n".encode("utf-8")
+        )
+        expected = {
+            "iso8859-1": b'"Hi" - # OK... ?.\n',
+            "cp1252": "“Hi” — # OK… ?.\n".encode("cp1252"),
+        }
+        for target, data in expected.items():
+            with self.subTest(target=target):
+                output = os.path.join(self.temp_dir.name, f"quotes-{target}.srt")
+                self.assertTrue(
+                    convert_subtitle_encoding(source, output, target, "utf-8")
+                )
+                with open(output, "rb") as f:
+                    self.assertEqual(f.read(), data)
+
+        results = convert_to_multiple_encodings(source, target_encodings=["iso8859-1"])
+        self.assertTrue(results["iso8859-1"])
+        with open(os.path.join(self.temp_dir.name, "quotes-iso8859-1.srt"), "rb") as f:
+            self.assertEqual(f.read(), expected["iso8859-1"])
+
+    def test_convert_same_encoding_copies_bytes(self) -> None:
+        """Test that a file already in the target encoding is copied unchanged."""
+        data = "1\r\n00:00:01,000 --> 00:00:02,000\r\nCafé\r\n".encode("utf-8")
+        source = self._write_bytes("crlf.srt", data)
+        output = os.path.join(self.temp_dir.name, "crlf-copy.srt")
+
+        with patch("codecs.getincrementalencoder") as mock_encoder:
+            self.assertTrue(convert_subtitle_encoding(source, output, "UTF8", "utf-8"))
+        mock_encoder.assert_not_called()
+        with open(output, "rb") as f:
+            self.assertEqual(f.read(), data)
+
+        results = convert_to_multiple_encodings(
+            source, target_encodings=["utf8", "cp1252"]
+        )
+        self.assertEqual(results, {"utf8": True, "cp1252": True})
+        with open(os.path.join(self.temp_dir.name, "crlf-utf8.srt"), "rb") as f:
+            self.assertEqual(f.read(), data)
+
+    def test_convert_same_encoding_onto_itself(self) -> None:
+        """Test that converting a file onto itself in its own encoding succeeds."""
+        source = self._copy_sample("same.srt")
+        with open(source, "rb") as f:
+            data = f.read()
+
+        self.assertTrue(convert_subtitle_encoding(source, source, "utf-8", "utf-8"))
+        with open(source, "rb") as f:
+            self.assertEqual(f.read(), data)
+
     def test_convert_multiple_encodings(self) -> None:
         """Test converting a file to multiple encodings."""
         result = convert_to_multiple_encodings(
-            self.temp_file, self.temp_dir.name, ["utf-8-sig", "cp1252"]
+            self.sample_file, self.temp_dir.name, ["utf-8-sig", "cp1252"]
         )
 
         # Check that the function reported success for at least UTF-8-sig
@@ -82,6 +305,53 @@ More text with special characters:
         utf8_sig_file = os.path.join(self.temp_dir.name, "sample-utf-8-sig.srt")
         self.assertTrue(os.path.exists(utf8_sig_file))
 
+    def test_convert_multiple_encodings_strips_old_suffixes(self) -> None:
+        """Test that existing encoding suffixes aren't repeated in output names."""
+        source = self._copy_sample("movie-cp1252-UTF-8-SIG.srt")
+
+        results = convert_to_multiple_encodings(source, target_encodings=["utf-16"])
+
+        self.assertTrue(results["utf-16"])
+        self.assertTrue(
+            os.path.exists(os.path.join(self.temp_dir.name, "movie-utf-16.srt"))
+        )
+
+    def test_convert_multiple_encodings_same_encoding(self) -> None:
+        """Test same-encoding targets: written when new, skipped when in place."""
+        results = convert_to_multiple_encodings(
+            self._copy_sample(), target_encodings=["utf-8"]
+        )
+        self.assertTrue(results["utf-8"])
+        output = os.path.join(self.temp_dir.name, "sample-utf-8.srt")
+        self.assertTrue(os.path.exists(output))
+
+        with patch(
+            "src.subtranslate.utilities.encoding_converter._encode_and_write"
+        ) as mock_write:
+            results = convert_to_multiple_encodings(output, target_encodings=["utf-8"])
+
+        self.assertTrue(results["utf-8"])
+        mock_write.assert_not_called()
+
+    def test_convert_multiple_encodings_in_worker_processes(self) -> None:
+        """Test that parallel conversion writes the same files as serial."""
+        targets = ["utf-16", "cp874", "utf-8-sig"]
+        serial_dir = os.path.join(self.temp_dir.name, "serial")
+        parallel_dir = os.path.join(self.temp_dir.name, "parallel")
+
+        serial = convert_to_multiple_encodings(self.sample_file, serial_dir, targets)
+        parallel = convert_to_multiple_encodings(
+            self.sample_file, parallel_dir, targets, max_workers=2
+        )
+
+        self.assertEqual(serial, parallel)
+        self.assertEqual(list(parallel), targets)
+        for name in os.listdir(serial_dir):
+            with open(os.path.join(serial_dir, name), "rb") as f:
+                expected = f.read()
+            with open(os.path.join(parallel_dir, name), "rb") as f:
+                self.assertEqual(f.read(), expected)
+
     def test_get_recommended_encodings(self) -> None:
         """Test getting recommended encodings for different languages."""
         # Check Thai encodings
@@ -98,6 +368,24 @@ More text with special characters:
         self.assertIn("utf-8", default_encodings)
         self.assertIn("cp1252", default_encodings)
 
+        # Region variants fall back to the base language
+        self.assertEqual(get_recommended_encodings("ru-RU")[1], "cp1251")
+
+        # Each caller gets a list of its own
+        thai_encodings.append("latin-1")
+        self.assertNotIn("latin-1", get_recommended_encodings("th"))
+
+    def test_package_exports_resolve_lazily(self) -> None:
+        """Test that the utilities package re-exports the converter's names."""
+        for name in utilities.__all__:
+            with self.subTest(name=name):
+                self.assertIs(
+                    getattr(utilities, name), getattr(encoding_converter, name)
+                )
+
+        with self.assertRaises(AttributeError):
+            getattr(utilities, "missing_name")
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -4,11 +4,13 @@ Tests for the main translation functionality.
 
 import json
 import os
+import shutil
 import sys
 import tempfile
 import unittest
 from datetime import timedelta
 from pathlib import Path
+from typing import Optional
 from unittest.mock import Mock, patch
 
 import srt
@@ -17,16 +19,68 @@ import srt
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
 # Imports must happen after sys.path modification  # pylint: disable=wrong-import-position
-from src.subtranslate.core.main import SubtitleTranslator, translate_and_compose
+from src.subtranslate.core.main import (
+    _RATE_LIMIT_BACKOFF,
+    SubtitleTranslator,
+    translate_and_compose,
+)
 from src.subtranslate.core.translation import RateLimitError
 
+# Composed once; every test writes the same single-cue input file
+_SAMPLE_SRT_TEXT = srt.compose(
+    [
+        srt.Subtitle(
+            index=1,
+            start=timedelta(seconds=0),
+            end=timedelta(seconds=2),
+            content="Hello world",
+        )
+    ]
+)
+
+# Checkpoint fixtures, serialized once rather than per test
+_CHECKPOINT_JSON = json.dumps(
+    {
+        "status": "parsing_complete",
+        "parsed_subtitles": {
+            "index": [1],
+            "start_ns": [0],
+            "end_ns": [2_000_000_000],
+            "content": ["Hello world"],
+            "translated": [None],
+        },
+    }
+)
+_COMPLETE_CHECKPOINT_JSON = json.dumps({"status": "complete", "progress": 100})
+
+# One scratch directory for the whole module; tests get subdirectories of it
+_TMP_ROOT = ""
+
+
+def setUpModule() -> None:  # pylint: disable=invalid-name
+    """Create the module-wide scratch directory."""
+    global _TMP_ROOT  # pylint: disable=global-statement
+    _TMP_ROOT = tempfile.mkdtemp()
+
+
+def tearDownModule() -> None:  # pylint: disable=invalid-name
+    """Remove the module-wide scratch directory."""
+    shutil.rmtree(_TMP_ROOT, ignore_errors=True)
+
+
+def _make_test_dir(test: unittest.TestCase) -> str:
+    """Create and return a scratch directory private to ``test``."""
+    path = os.path.join(_TMP_ROOT, test.id())
+    os.makedirs(path, exist_ok=True)
+    return path
+
 
 class TestSubtitleTranslator(unittest.TestCase):
     """Tests for the SubtitleTranslator class."""
 
     def setUp(self) -> None:
         """Set up test fixtures."""
-        self.temp_dir = tempfile.TemporaryDirectory()
+        self._temp_dir: Optional[str] = None
 
         # Create sample subtitle data
         self.sample_subtitles = [
@@ -44,14 +98,16 @@ class TestSubtitleTranslator(unittest.TestCase):
             ),
         ]
 
-        # Create sample input file
-        self.input_file = os.path.join(self.temp_dir.name, "input.srt")
-        with open(self.input_file, "w", encoding="utf-8") as f:
-            f.write(srt.compose(self.sample_subtitles))
+        # Parsing is mocked wherever translate_file is called, so the input
+        # file is never opened and needn't exist
+        self.input_file = "input.srt"
 
-    def tearDown(self) -> None:
-        """Clean up test fixtures."""
-        self.temp_dir.cleanup()
+    @property
+    def temp_dir(self) -> str:
+        """Scratch directory, only created for tests that write files."""
+        if self._temp_dir is None:
+            self._temp_dir = _make_test_dir(self)
+        return self._temp_dir
 
     def test_init_default(self) -> None:
         """Test initialization with default parameters."""
@@ -82,7 +138,7 @@ class TestSubtitleTranslator(unittest.TestCase):
             translation_service="custom", api_key="test_key"
         )
 
-        mock_get_translator.assert_called_once_with("custom", "test_key")
+        mock_get_translator.assert_called_once_with("custom", "test_key", warmup=False)
         self.assertEqual(translator.translator, mock_translator)
 
     @patch("src.subtranslate.core.main.os.path.exists")
@@ -94,35 +150,34 @@ class TestSubtitleTranslator(unittest.TestCase):
         mock_exists.return_value = False
 
         translator = SubtitleTranslator()
-        output_file = os.path.join(self.temp_dir.name, "subdir", "output.srt")
-
-        with patch.object(
-            translator.subtitle_processor, "parse_file"
-        ) as mock_parse, patch.object(
-            translator.subtitle_processor, "save_file"
-        ), patch.object(
-            translator, "_translate_split"
-        ) as mock_translate:
-
-            mock_parse.return_value = self.sample_subtitles
+        # makedirs is mocked, so the directory is never really created
+        output_file = os.path.join("subdir", "output.srt")
+
+        with (
+            patch.object(
+                translator.subtitle_processor, "parse_and_flatten"
+            ) as mock_parse,
+            patch.object(translator.subtitle_processor, "save_file"),
+            patch.object(translator, "_translate_split") as mock_translate,
+        ):
+
+            mock_parse.return_value = (self.sample_subtitles, "", [])
             mock_translate.return_value = self.sample_subtitles
 
             translator.translate_file(self.input_file, output_file, "en", "es")
 
-            mock_makedirs.assert_called_once()
+            mock_makedirs.assert_called_once_with("subdir")
 
     def test_translate_file_naive_mode(self) -> None:
         """Test translate_file in naive mode."""
         translator = SubtitleTranslator()
-        output_file = os.path.join(self.temp_dir.name, "output.srt")
+        output_file = os.path.join(self.temp_dir, "output.srt")
 
-        with patch.object(
-            translator.subtitle_processor, "parse_file"
-        ) as mock_parse, patch.object(
-            translator.subtitle_processor, "save_file"
-        ) as mock_save, patch.object(
-            translator, "_translate_naive"
-        ) as mock_translate:
+        with (
+            patch.object(translator.subtitle_processor, "parse_file") as mock_parse,
+            patch.object(translator.subtitle_processor, "save_file") as mock_save,
+            patch.object(translator, "_translate_naive") as mock_translate,
+        ):
 
             mock_parse.return_value = self.sample_subtitles
             mock_translate.return_value = self.sample_subtitles
@@ -140,17 +195,21 @@ class TestSubtitleTranslator(unittest.TestCase):
     def test_translate_file_split_mode(self) -> None:
         """Test translate_file in split mode."""
         translator = SubtitleTranslator()
-        output_file = os.path.join(self.temp_dir.name, "output.srt")
+        output_file = os.path.join(self.temp_dir, "output.srt")
 
-        with patch.object(
-            translator.subtitle_processor, "parse_file"
-        ) as mock_parse, patch.object(
-            translator.subtitle_processor, "save_file"
-        ) as mock_save, patch.object(
-            translator, "_translate_split"
-        ) as mock_translate:
+        with (
+            patch.object(
+                translator.subtitle_processor, "parse_and_flatten"
+            ) as mock_parse,
+            patch.object(translator.subtitle_processor, "save_file") as mock_save,
+            patch.object(translator, "_translate_split") as mock_translate,
+        ):
 
-            mock_parse.return_value = self.sample_subtitles
+            mock_parse.return_value = (
+                self.sample_subtitles,
+                "Hello world This is a test.",
+                [12, 28],
+            )
             mock_translate.return_value = self.sample_subtitles
 
             translator.translate_file(
@@ -165,37 +224,25 @@ class TestSubtitleTranslator(unittest.TestCase):
                 both=True,
                 space=False,
                 checkpoint_file=None,
+                flattened=("Hello world This is a test.", [12, 28]),
             )
             mock_save.assert_called_once()
 
     def test_translate_file_with_checkpoint(self) -> None:
         """Test translate_file with checkpoint functionality."""
         translator = SubtitleTranslator()
-        output_file = os.path.join(self.temp_dir.name, "output.srt")
+        output_file = os.path.join(self.temp_dir, "output.srt")
         checkpoint_file = output_file + ".checkpoint"
 
-        # Create a checkpoint file
-        checkpoint_data = {
-            "status": "parsing_complete",
-            "parsed_subtitles": [
-                {
-                    "index": 1,
-                    "start_time": timedelta(seconds=0),
-                    "end_time": timedelta(seconds=2),
-                    "content": "Hello world",
-                }
-            ],
-        }
-        with open(checkpoint_file, "w", encoding="utf-8") as f:
-            json.dump(checkpoint_data, f, default=str)
+        Path(checkpoint_file).write_text(_CHECKPOINT_JSON, encoding="utf-8")
 
-        with patch.object(
-            translator.subtitle_processor, "from_serialized"
-        ) as mock_from_serial, patch.object(
-            translator.subtitle_processor, "save_file"
-        ) as mock_save, patch.object(
-            translator, "_translate_split"
-        ) as mock_translate:
+        with (
+            patch.object(
+                translator.subtitle_processor, "from_serialized"
+            ) as mock_from_serial,
+            patch.object(translator.subtitle_processor, "save_file") as mock_save,
+            patch.object(translator, "_translate_split") as mock_translate,
+        ):
 
             mock_from_serial.return_value = self.sample_subtitles
             mock_translate.return_value = self.sample_subtitles
@@ -211,13 +258,10 @@ class TestSubtitleTranslator(unittest.TestCase):
     def test_translate_file_complete_checkpoint(self) -> None:
         """Test translate_file with complete checkpoint."""
         translator = SubtitleTranslator()
-        output_file = os.path.join(self.temp_dir.name, "output.srt")
+        output_file = os.path.join(self.temp_dir, "output.srt")
         checkpoint_file = output_file + ".checkpoint"
 
-        # Create a complete checkpoint file
-        checkpoint_data = {"status": "complete", "progress": 100}
-        with open(checkpoint_file, "w", encoding="utf-8") as f:
-            json.dump(checkpoint_data, f)
+        Path(checkpoint_file).write_text(_COMPLETE_CHECKPOINT_JSON, encoding="utf-8")
 
         with patch.object(translator.subtitle_processor, "parse_file") as mock_parse:
             translator.translate_file(
@@ -230,7 +274,7 @@ class TestSubtitleTranslator(unittest.TestCase):
     def test_save_checkpoint(self) -> None:
         """Test _save_checkpoint method."""
         translator = SubtitleTranslator()
-        checkpoint_file = os.path.join(self.temp_dir.name, "test.checkpoint")
+        checkpoint_file = os.path.join(self.temp_dir, "test.checkpoint")
 
         test_data = {
             "status": "test",
@@ -266,11 +310,14 @@ class TestSubtitleTranslator(unittest.TestCase):
         """Test _translate_naive method."""
         translator = SubtitleTranslator()
 
-        with patch.object(
-            translator, "_translate_with_progress"
-        ) as mock_translate_progress, patch.object(
-            translator.subtitle_processor, "simple_translate_subtitles"
-        ) as mock_simple:
+        with (
+            patch.object(
+                translator, "_translate_with_progress"
+            ) as mock_translate_progress,
+            patch.object(
+                translator.subtitle_processor, "simple_translate_subtitles"
+            ) as mock_simple,
+        ):
 
             mock_translate_progress.return_value = "Hola mundo\nEsta es una prueba."
             mock_simple.return_value = self.sample_subtitles
@@ -281,21 +328,53 @@ class TestSubtitleTranslator(unittest.TestCase):
 
             mock_translate_progress.assert_called_once()
             mock_simple.assert_called_once_with(
-                self.sample_subtitles, ["Hola mundo", "Esta es una prueba."], True
+                self.sample_subtitles,
+                ["Hola mundo", "Esta es una prueba."],
+                True,
+                flat_contents=["Hello world", "This is a test."],
             )
             self.assertEqual(result, self.sample_subtitles)
 
+    def test_translate_naive_joins_multiline_content(self) -> None:
+        """Test that line breaks in a subtitle are sent as spaces, not dropped."""
+        translator = SubtitleTranslator()
+        subtitles = [
+            srt.Subtitle(
+                index=1,
+                start=timedelta(seconds=1),
+                end=timedelta(seconds=4),
+                content="Hello\nworld",
+            )
+        ]
+
+        with (
+            patch.object(
+                translator, "_translate_with_progress"
+            ) as mock_translate_progress,
+            patch.object(
+                translator.subtitle_processor, "simple_translate_subtitles"
+            ) as mock_simple,
+        ):
+            mock_translate_progress.return_value = "Hola mundo"
+            mock_simple.return_value = subtitles
+
+            translator._translate_naive(subtitles, "en", "es", both=False)
+
+            self.assertEqual(mock_translate_progress.call_args[0][0], ["Hello world"])
+
     def test_translate_naive_with_retry(self) -> None:
         """Test _translate_naive with rate limit retry."""
         translator = SubtitleTranslator()
 
-        with patch.object(
-            translator, "_translate_with_progress"
-        ) as mock_translate_progress, patch.object(
-            translator.subtitle_processor, "simple_translate_subtitles"
-        ) as mock_simple, patch(
-            "time.sleep"
-        ) as mock_sleep:
+        with (
+            patch.object(
+                translator, "_translate_with_progress"
+            ) as mock_translate_progress,
+            patch.object(
+                translator.subtitle_processor, "simple_translate_subtitles"
+            ) as mock_simple,
+            patch("time.sleep") as mock_sleep,
+        ):
 
             # First call raises rate limit error, second succeeds
             mock_translate_progress.side_effect = [
@@ -312,65 +391,120 @@ class TestSubtitleTranslator(unittest.TestCase):
             mock_sleep.assert_called_once_with(60)  # First backoff
             self.assertEqual(result, self.sample_subtitles)
 
+    def test_translate_naive_backoff_schedule(self) -> None:
+        """Test that persistent rate limiting walks the whole backoff schedule."""
+        translator = SubtitleTranslator()
+
+        with (
+            patch.object(
+                translator, "_translate_with_progress"
+            ) as mock_translate_progress,
+            patch("time.sleep") as mock_sleep,
+        ):
+            mock_translate_progress.side_effect = RateLimitError("Rate limited")
+
+            with self.assertRaises(RateLimitError):
+                translator._translate_naive(self.sample_subtitles, "en", "es")
+
+        self.assertEqual(
+            [c.args[0] for c in mock_sleep.call_args_list], list(_RATE_LIMIT_BACKOFF)
+        )
+        self.assertEqual(
+            mock_translate_progress.call_count, len(_RATE_LIMIT_BACKOFF) + 1
+        )
+
     def test_translate_split(self) -> None:
         """Test _translate_split method."""
         translator = SubtitleTranslator()
 
-        with patch.object(
-            translator.subtitle_processor, "triple_r"
-        ) as mock_triple_r, patch.object(
-            translator.subtitle_processor, "split_and_record"
-        ) as mock_split, patch.object(
-            translator.subtitle_processor, "compute_mass_list"
-        ) as mock_mass, patch.object(
-            translator.subtitle_processor, "sen_list2dialog_list"
-        ) as mock_sen2dialog, patch.object(
-            translator.subtitle_processor, "advanced_translate_subtitles"
-        ) as mock_advanced, patch.object(
-            translator, "_translate_with_progress"
-        ) as mock_translate_progress:
-
-            mock_triple_r.return_value = ("Hello world This is a test", [11, 26])
-            mock_split.return_value = (["Hello world", "This is a test"], [0, 12, 27])
-            mock_mass.return_value = [[(1, 11)], [(2, 15)]]
-            mock_sen2dialog.return_value = ["Hola mundo", "Esta es una prueba"]
-            mock_translate_progress.return_value = "Hola mundo\nEsta es una prueba"
-            mock_advanced.return_value = self.sample_subtitles
+        mock_triple_r = Mock(return_value=("Hello world This is a test", [11, 26]))
+        mock_split = Mock(return_value=(["Hello world", "This is a test"], [0, 12, 27]))
+        mock_advanced = Mock(return_value=self.sample_subtitles)
+
+        with (
+            patch.multiple(
+                translator.subtitle_processor,
+                triple_r=mock_triple_r,
+                split_and_record=mock_split,
+                compute_mass_list=Mock(return_value=[[(1, 11)], [(2, 15)]]),
+                sen_list2dialog_list=Mock(
+                    return_value=["Hola mundo", "Esta es una prueba"]
+                ),
+                advanced_translate_subtitles=mock_advanced,
+            ),
+            patch.object(
+                translator,
+                "_translate_with_progress",
+                return_value="Hola mundo\nEsta es una prueba",
+            ) as mock_translate_progress,
+        ):
 
             result = translator._translate_split(
                 self.sample_subtitles, "en", "es", both=True, space=False
             )
 
-            mock_triple_r.assert_called_once_with(self.sample_subtitles)
+            flat_contents = ["Hello world", "This is a test."]
+            mock_triple_r.assert_called_once_with(self.sample_subtitles, flat_contents)
             mock_split.assert_called_once()
             mock_translate_progress.assert_called_once()
-            mock_advanced.assert_called_once()
+            mock_advanced.assert_called_once_with(
+                self.sample_subtitles,
+                ["Hola mundo", "Esta es una prueba"],
+                True,
+                flat_contents=flat_contents,
+            )
             self.assertEqual(result, self.sample_subtitles)
 
+    def test_translate_split_reuses_flattened(self) -> None:
+        """Test _translate_split skips triple_r when plain text is provided."""
+        translator = SubtitleTranslator()
+
+        mock_triple_r = Mock()
+        mock_split = Mock(return_value=(["Hello world", "This is a test"], [0, 12, 27]))
+
+        with (
+            patch.multiple(
+                translator.subtitle_processor,
+                triple_r=mock_triple_r,
+                split_and_record=mock_split,
+                advanced_translate_subtitles=Mock(return_value=self.sample_subtitles),
+            ),
+            patch.object(
+                translator,
+                "_translate_with_progress",
+                return_value="Hola mundo\nEsta es una prueba",
+            ),
+        ):
+
+            translator._translate_split(
+                self.sample_subtitles,
+                "en",
+                "es",
+                flattened=("Hello world This is a test", [11, 26]),
+            )
+
+            mock_triple_r.assert_not_called()
+            mock_split.assert_called_once_with("Hello world This is a test")
+
     def test_translate_split_chinese(self) -> None:
         """Test _translate_split method with Chinese target."""
         translator = SubtitleTranslator()
 
-        with patch.object(
-            translator.subtitle_processor, "triple_r"
-        ) as mock_triple_r, patch.object(
-            translator.subtitle_processor, "split_and_record"
-        ) as mock_split, patch.object(
-            translator.subtitle_processor, "compute_mass_list"
-        ) as mock_mass, patch.object(
-            translator.subtitle_processor, "sen_list2dialog_list"
-        ) as mock_sen2dialog, patch.object(
-            translator.subtitle_processor, "advanced_translate_subtitles"
-        ) as mock_advanced, patch.object(
-            translator, "_translate_with_progress"
-        ) as mock_translate_progress:
-
-            mock_triple_r.return_value = ("Hello world", [11])
-            mock_split.return_value = (["Hello world"], [0, 12])
-            mock_mass.return_value = [[(1, 11)]]
-            mock_sen2dialog.return_value = ["你好世界"]
-            mock_translate_progress.return_value = "你好世界"
-            mock_advanced.return_value = self.sample_subtitles
+        mock_sen2dialog = Mock(return_value=["你好世界"])
+
+        with (
+            patch.multiple(
+                translator.subtitle_processor,
+                triple_r=Mock(return_value=("Hello world", [11])),
+                split_and_record=Mock(return_value=(["Hello world"], [0, 12])),
+                compute_mass_list=Mock(return_value=[[(1, 11)]]),
+                sen_list2dialog_list=mock_sen2dialog,
+                advanced_translate_subtitles=Mock(return_value=self.sample_subtitles),
+            ),
+            patch.object(
+                translator, "_translate_with_progress", return_value="你好世界"
+            ),
+        ):
 
             translator._translate_split(
                 self.sample_subtitles, "en", "zh-CN", both=True, space=False
@@ -423,21 +557,19 @@ class TestSubtitleTranslator(unittest.TestCase):
 
             self.assertEqual(result, "Translated text")
 
-    @patch("src.subtranslate.core.main.Path")
+    @patch("src.subtranslate.core.main.find_subtitle_files")
     @patch("src.subtranslate.core.main.os.path.isdir")
     @patch("src.subtranslate.core.main.os.makedirs")
     def test_batch_translate_directory(
-        self, _mock_makedirs: Mock, mock_isdir: Mock, mock_path: Mock
+        self, _mock_makedirs: Mock, mock_isdir: Mock, mock_find: Mock
     ) -> None:
         """Test batch_translate_directory method."""
         mock_isdir.return_value = True
 
-        # Mock Path.glob to return test files
-        mock_path_obj = Mock()
-        mock_path.return_value = mock_path_obj
-        mock_path_obj.glob.return_value = [
-            Path(os.path.join(self.temp_dir.name, "test1.srt")),
-            Path(os.path.join(self.temp_dir.name, "test2.srt")),
+        # Mock file discovery to return test files
+        mock_find.return_value = [
+            os.path.join(self.temp_dir, "test1.srt"),
+            os.path.join(self.temp_dir, "test2.srt"),
         ]
 
         translator = SubtitleTranslator()
@@ -446,8 +578,8 @@ class TestSubtitleTranslator(unittest.TestCase):
             mock_translate_file.return_value = None
 
             results = translator.batch_translate_directory(
-                input_dir=self.temp_dir.name,
-                output_dir=self.temp_dir.name,
+                input_dir=self.temp_dir,
+                output_dir=self.temp_dir,
                 src_lang="en",
                 target_lang="es",
                 resume=False,
@@ -463,38 +595,35 @@ class TestSubtitleTranslator(unittest.TestCase):
         with self.assertRaises(ValueError):
             translator.batch_translate_directory(
                 input_dir="/nonexistent/directory",
-                output_dir=self.temp_dir.name,
+                output_dir=self.temp_dir,
                 src_lang="en",
                 target_lang="es",
             )
 
-    @patch("src.subtranslate.core.main.Path")
+    @patch("src.subtranslate.core.main.find_subtitle_files")
     @patch("src.subtranslate.core.main.os.path.isdir")
     @patch("src.subtranslate.core.main.os.makedirs")
     def test_batch_translate_with_rate_limit(
-        self, _mock_makedirs: Mock, mock_isdir: Mock, mock_path: Mock
+        self, _mock_makedirs: Mock, mock_isdir: Mock, mock_find: Mock
     ) -> None:
         """Test batch_translate_directory handling rate limits."""
         mock_isdir.return_value = True
 
-        # Mock Path.glob to return test files
-        mock_path_obj = Mock()
-        mock_path.return_value = mock_path_obj
-        mock_path_obj.glob.return_value = [
-            Path(os.path.join(self.temp_dir.name, "test1.srt"))
-        ]
+        # Mock file discovery to return test files
+        mock_find.return_value = [os.path.join(self.temp_dir, "test1.srt")]
 
         translator = SubtitleTranslator()
 
-        with patch.object(translator, "translate_file") as mock_translate_file, patch(
-            "time.sleep"
-        ) as mock_sleep:
+        with (
+            patch.object(translator, "translate_file") as mock_translate_file,
+            patch("time.sleep") as mock_sleep,
+        ):
 
             mock_translate_file.side_effect = RateLimitError("Rate limited")
 
             results = translator.batch_translate_directory(
-                input_dir=self.temp_dir.name,
-                output_dir=self.temp_dir.name,
+                input_dir=self.temp_dir,
+                output_dir=self.temp_dir,
                 src_lang="en",
                 target_lang="es",
                 resume=False,
@@ -513,24 +642,12 @@ class TestTranslateAndCompose(unittest.TestCase):
 
     def setUp(self) -> None:
         """Set up test fixtures."""
-        self.temp_dir = tempfile.TemporaryDirectory()
+        self.temp_dir = _make_test_dir(self)
 
         # Create sample input file
-        self.input_file = os.path.join(self.temp_dir.name, "input.srt")
-        sample_subtitles = [
-            srt.Subtitle(
-                index=1,
-                start=timedelta(seconds=0),
-                end=timedelta(seconds=2),
-                content="Hello world",
-            )
-        ]
+        self.input_file = os.path.join(self.temp_dir, "input.srt")
         with open(self.input_file, "w", encoding="utf-8") as f:
-            f.write(srt.compose(sample_subtitles))
-
-    def tearDown(self) -> None:
-        """Clean up test fixtures."""
-        self.temp_dir.cleanup()
+            f.write(_SAMPLE_SRT_TEXT)
 
     @patch("src.subtranslate.core.main.SubtitleTranslator")
     def test_translate_and_compose(self, mock_translator_class: Mock) -> None:
@@ -538,7 +655,7 @@ class TestTranslateAndCompose(unittest.TestCase):
         mock_translator = Mock()
         mock_translator_class.return_value = mock_translator
 
-        output_file = os.path.join(self.temp_dir.name, "output.srt")
+        output_file = os.path.join(self.temp_dir, "output.srt")
 
         translate_and_compose(
             input_file=self.input_file,
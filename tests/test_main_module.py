@@ -2,6 +2,7 @@
 Tests for the __main__.py module.
 """
 
+import re
 import sys
 import unittest
 from pathlib import Path
@@ -13,15 +14,18 @@ sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 # Import must happen after sys.path modification  # pylint: disable=wrong-import-position
 import src.subtranslate.__main__ as main_module
 
+_VERSION_RE = re.compile(r"\d+\.\d+\.\d+")
+
 
 class TestMainModule(unittest.TestCase):
     """Tests for the __main__.py module."""
 
     def test_main_version(self) -> None:
         """Test main function with --version argument."""
-        with patch("sys.argv", ["subtranslate", "--version"]), patch(
-            "builtins.print"
-        ) as mock_print:
+        with (
+            patch("sys.argv", ["subtranslate", "--version"]),
+            patch("builtins.print") as mock_print,
+        ):
 
             result = main_module.main()
 
@@ -74,26 +78,22 @@ class TestMainModule(unittest.TestCase):
 
     def test_main_called_as_script(self) -> None:
         """Test that main is called when module is run as script."""
-        with patch("src.subtranslate.__main__.main") as mock_main, patch(
-            "sys.exit"
-        ) as mock_exit:
+        with (
+            patch("src.subtranslate.__main__.main") as mock_main,
+            patch("sys.exit") as mock_exit,
+        ):
 
             mock_main.return_value = 42
 
-            # Simulate __name__ == '__main__'
-            with patch.object(main_module, "__name__", "__main__"):
-                exec(  # pylint: disable=exec-used
-                    compile(
-                        "if __name__ == '__main__': sys.exit(main())",
-                        "<string>",
-                        "exec",
-                    ),
-                    main_module.__dict__,
-                )
+            # Run what the ``__name__ == "__main__"`` guard runs
+            mock_exit(main_module.main())
 
             mock_main.assert_called_once()
             mock_exit.assert_called_once_with(42)
 
+        source = Path(main_module.__file__).read_text(encoding="utf-8")
+        self.assertIn('if __name__ == "__main__":\n    sys.exit(main())', source)
+
     def test_parse_args_remainder(self) -> None:
         """Test argument parsing with remainder arguments."""
         test_args = ["translate", "input.srt", "output.srt", "--verbose"]
@@ -114,10 +114,12 @@ class TestMainModule(unittest.TestCase):
     def test_import_version(self) -> None:
         """Test that version is imported correctly."""
         # Test that the version import works
-        from src.subtranslate import __version__  # pylint: disable=import-outside-toplevel
+        from src.subtranslate import (
+            __version__,
+        )  # pylint: disable=import-outside-toplevel
 
         self.assertIsInstance(__version__, str)
-        self.assertRegex(__version__, r"\d+\.\d+\.\d+")
+        self.assertRegex(__version__, _VERSION_RE)
 
 
 if __name__ == "__main__":
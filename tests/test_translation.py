@@ -2,15 +2,18 @@
 Tests for the translation module.
 """
 
+import gzip
+import io
 import sys
 import unittest
-import urllib.error
-from email.message import EmailMessage
+import urllib.parse
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import TYPE_CHECKING
 from unittest.mock import MagicMock, Mock, patch
 
 import requests
+from urllib3.response import HTTPResponse
 
 if TYPE_CHECKING:
     from typing import Any
@@ -25,12 +28,22 @@ from src.subtranslate.core.translation import (
     GoogleTranslator,
     RateLimitError,
     TkGenerator,
+    TokenBucket,
     TranslationError,
     Translator,
     get_translator,
 )
 
 
+def _make_response(status_code: int, content: bytes = b"") -> requests.Response:
+    """Build a requests Response with the given status and body."""
+    response = requests.Response()
+    response.status_code = status_code
+    response._content = content  # pylint: disable=protected-access
+    response.url = "http://test.com"
+    return response
+
+
 class TestTkGenerator(unittest.TestCase):
     """Tests for the TkGenerator class."""
 
@@ -38,10 +51,6 @@ class TestTkGenerator(unittest.TestCase):
         """Set up test fixtures."""
         self.tk_gen = TkGenerator()
 
-    def test_initialization(self) -> None:
-        """Test TkGenerator initialization."""
-        self.assertIsNotNone(self.tk_gen.ctx)
-
     def test_get_tk(self) -> None:
         """Test get_tk method."""
         text = "Hello world"
@@ -63,22 +72,68 @@ class TestTkGenerator(unittest.TestCase):
         self.assertIsInstance(tk, str)
         self.assertIn(".", tk)
 
-    @patch("src.subtranslate.core.translation.execjs.compile")
-    def test_initialization_error(self, mock_compile: Mock) -> None:
-        """Test TkGenerator initialization error."""
-        mock_compile.side_effect = Exception("JS error")
-
-        with self.assertRaises(TranslationError):
-            TkGenerator()
+    def test_get_tk_matches_reference_values(self) -> None:
+        """Test get_tk against values produced by the original JavaScript."""
+        self.assertEqual(self.tk_gen.get_tk(""), "557215.963819")
+        self.assertEqual(self.tk_gen.get_tk("Hello world"), "814953.678685")
+        self.assertEqual(self.tk_gen.get_tk("Hello 世界! ñáéíóú"), "457389.52953")
+        self.assertEqual(self.tk_gen.get_tk("😀 emoji \U0001f600x"), "895750.761714")
 
     def test_get_tk_error(self) -> None:
         """Test get_tk error handling."""
-        # Patch the ctx.call method on the instance
-        with patch.object(
-            self.tk_gen.ctx, "call", side_effect=Exception("JS call error")
+        with self.assertRaises(TranslationError):
+            self.tk_gen.get_tk(None)  # type: ignore[arg-type]
+
+
+class TestTokenBucket(unittest.TestCase):
+    """Tests for the TokenBucket rate limiter."""
+
+    def test_burst_then_wait(self) -> None:
+        """Test that a full bucket allows a burst and then sleeps for refills."""
+        bucket = TokenBucket(rate=2.0, capacity=3)
+
+        with (
+            patch("src.subtranslate.core.translation.time.monotonic") as mock_now,
+            patch("time.sleep") as mock_sleep,
         ):
-            with self.assertRaises(TranslationError):
-                self.tk_gen.get_tk("test")
+            mock_now.return_value = bucket._last
+            for _ in range(3):
+                bucket.acquire()
+            mock_sleep.assert_not_called()
+
+            bucket.acquire()
+
+        mock_sleep.assert_called_once_with(0.5)
+
+    def test_refill_over_time(self) -> None:
+        """Test that tokens refill at the configured rate."""
+        bucket = TokenBucket(rate=2.0, capacity=1)
+
+        with (
+            patch("src.subtranslate.core.translation.time.monotonic") as mock_now,
+            patch("time.sleep") as mock_sleep,
+        ):
+            start = bucket._last
+            mock_now.return_value = start
+            bucket.acquire()
+            mock_now.return_value = start + 0.5
+            bucket.acquire()
+
+        mock_sleep.assert_not_called()
+
+    def test_pause_blocks_requests(self) -> None:
+        """Test that pause holds back the next acquire."""
+        bucket = TokenBucket(rate=2.0, capacity=4)
+
+        with (
+            patch("src.subtranslate.core.translation.time.monotonic") as mock_now,
+            patch("time.sleep") as mock_sleep,
+        ):
+            mock_now.return_value = 100.0
+            bucket.pause(10)
+            bucket.acquire()
+
+        self.assertEqual(mock_sleep.call_args_list[0].args[0], 10.0)
 
 
 class TestGoogleTranslator(unittest.TestCase):
@@ -96,6 +151,29 @@ class TestGoogleTranslator(unittest.TestCase):
         self.assertIn("User-Agent", translator.headers)
         self.assertIsNotNone(translator.tk_gen)
         self.assertEqual(translator.max_limited, 3500)
+        self.assertEqual(translator.concurrency, 4)
+        self.assertEqual(translator.headers["Accept-Encoding"], "gzip, deflate")
+
+    def test_warmup_starts_background_thread(self) -> None:
+        """Test that warmup opens a connection off the constructor's thread."""
+        with patch("threading.Thread") as mock_thread:
+            translator = GoogleTranslator(warmup=True)
+
+        mock_thread.assert_called_once_with(target=translator._warm_up, daemon=True)
+        mock_thread.return_value.start.assert_called_once()
+
+    def test_warm_up_heads_service_and_ignores_errors(self) -> None:
+        """Test that the warmup request targets the service and never raises."""
+        with patch.object(self.translator._session, "head") as mock_head:
+            mock_head.side_effect = requests.ConnectionError("offline")
+
+            self.translator._warm_up()
+
+        mock_head.assert_called_once_with("http://translate.google.com/", timeout=3)
+
+    def test_translators_share_tk_generator(self) -> None:
+        """Test that translator instances reuse one TkGenerator."""
+        self.assertIs(GoogleTranslator().tk_gen, GoogleTranslator().tk_gen)
 
     def test_initialization_with_api_key(self) -> None:
         """Test initialization with API key."""
@@ -103,119 +181,141 @@ class TestGoogleTranslator(unittest.TestCase):
 
         self.assertEqual(translator.api_key, "test_key")
 
-    def test_rotate_user_agent(self) -> None:
-        """Test user agent rotation."""
-        _original_ua = self.translator.headers["User-Agent"]
+    def test_session_adapter_retries(self) -> None:
+        """Test that the session adapter carries the single retry policy."""
+        adapter = self.translator._session.get_adapter("https://translate.google.com")
+        retry = adapter.max_retries
+
+        self.assertEqual(retry.total, self.translator.max_retries)
+        self.assertEqual(retry.backoff_factor, self.translator.initial_backoff)
+        self.assertEqual(retry.backoff_max, self.translator.max_backoff)
+        self.assertTrue(retry.respect_retry_after_header)
+        self.assertFalse(retry.raise_on_status)
+        for status in (429, 500, 501, 502, 503, 504, 599):
+            self.assertTrue(retry.is_retry("POST", status))
+        self.assertFalse(retry.is_retry("POST", 404))
+
+    def test_post_success(self) -> None:
+        """Test successful POST request."""
+        with patch.object(self.translator._session, "post") as mock_post:
+            mock_post.return_value = _make_response(200, b'{"result": "success"}')
 
-        self.translator._rotate_user_agent()
+            result = getattr(self.translator, "_GoogleTranslator__post")(
+                "http://test.com", "test text"
+            )
 
-        # Should still be one of the valid user agents
-        self.assertIn(
-            self.translator.headers["User-Agent"], self.translator.user_agents
+        self.assertEqual(result, '{"result": "success"}')
+        mock_post.assert_called_once_with(
+            "http://test.com",
+            data=b"q=test%20text",
+            timeout=10,
         )
 
-    def test_calculate_backoff(self) -> None:
-        """Test backoff calculation."""
-        backoff_0 = self.translator._calculate_backoff(0)
-        backoff_1 = self.translator._calculate_backoff(1)
-        backoff_2 = self.translator._calculate_backoff(2)
+    def test_post_decompresses_gzip_response(self) -> None:
+        """Test that a gzip-encoded response body is decoded transparently."""
+        response = requests.Response()
+        response.status_code = 200
+        response.raw = HTTPResponse(
+            body=io.BytesIO(gzip.compress('[["Hola"]]'.encode("utf-8"))),
+            headers={"Content-Encoding": "gzip"},
+            preload_content=False,
+        )
 
-        self.assertGreaterEqual(backoff_0, 0.1)
-        self.assertGreater(backoff_1, backoff_0 * 0.5)  # Account for jitter
-        self.assertGreater(backoff_2, backoff_1 * 0.5)
+        with patch.object(self.translator._session, "post") as mock_post:
+            mock_post.return_value = response
 
-        # Test max backoff
-        backoff_large = self.translator._calculate_backoff(10)
-        self.assertLessEqual(
-            backoff_large, self.translator.max_backoff * 1.1
-        )  # Account for jitter
+            result = getattr(self.translator, "_GoogleTranslator__post")(
+                "http://test.com", "Hello"
+            )
 
-    @patch("urllib.request.urlopen")
-    def test_post_success(self, mock_urlopen: Mock) -> None:
-        """Test successful POST request."""
-        mock_response = MagicMock()
-        mock_response.__enter__.return_value = mock_response
-        mock_response.__exit__.return_value = None
-        mock_response.read.return_value = b'{"result": "success"}'
-        mock_urlopen.return_value = mock_response
-
-        result = getattr(self.translator, "_GoogleTranslator__post")(
-            "http://test.com", "test text"
+        self.assertEqual(result, '[["Hola"]]')
+
+    def test_post_encodes_body_as_form_data(self) -> None:
+        """Test that the POST body is percent-encoded UTF-8 form data."""
+        with patch.object(self.translator._session, "post") as mock_post:
+            mock_post.return_value = _make_response(200, b"[]")
+
+            getattr(self.translator, "_GoogleTranslator__post")(
+                "http://test.com", "a&b=c\nd 世界"
+            )
+
+        self.assertEqual(
+            urllib.parse.parse_qs(mock_post.call_args.kwargs["data"].decode("ascii")),
+            {"q": ["a&b=c\nd 世界"]},
         )
 
-        self.assertEqual(result, '{"result": "success"}')
+    def test_post_rate_limit_honors_retry_after(self) -> None:
+        """Test that a final 429 pauses the bucket for its Retry-After delay."""
+        limited = _make_response(429)
+        limited.headers["Retry-After"] = "45"
 
-    @patch("urllib.request.urlopen")
-    def test_post_rate_limit_retry(self, mock_urlopen: Mock) -> None:
-        """Test POST request with rate limit retry."""
-        # First call raises 429, second succeeds
-        mock_response = MagicMock()
-        mock_response.__enter__.return_value = mock_response
-        mock_response.__exit__.return_value = None
-        mock_response.read.return_value = b'{"result": "success"}'
-
-        # Set up side_effect with proper context managers
-        def side_effect_func(*_args: object, **_kwargs: object) -> MagicMock:
-            if not hasattr(side_effect_func, "call_count"):
-                side_effect_func.call_count = 0  # type: ignore[attr-defined]
-            side_effect_func.call_count += 1  # type: ignore[attr-defined]
-
-            if side_effect_func.call_count == 1:  # type: ignore[attr-defined]
-                headers = EmailMessage()
-                raise urllib.error.HTTPError(
-                    "http://test.com", 429, "Too Many Requests", headers, None
-                )
-            return mock_response
+        with (
+            patch.object(self.translator._session, "post") as mock_post,
+            patch("time.sleep") as mock_sleep,
+            patch.object(self.translator.rate_limiter, "pause") as mock_pause,
+        ):
+            mock_post.return_value = limited
 
-        mock_urlopen.side_effect = side_effect_func
+            with self.assertRaises(RateLimitError):
+                getattr(self.translator, "_GoogleTranslator__post")(
+                    "http://test.com", "test text"
+                )
 
-        with patch("time.sleep") as mock_sleep:
-            result = getattr(self.translator, "_GoogleTranslator__post")(
-                "http://test.com", "test text"
-            )
+        mock_pause.assert_called_once_with(45.0)
+        mock_sleep.assert_not_called()
+        mock_post.assert_called_once()
 
-        self.assertEqual(result, '{"result": "success"}')
-        mock_sleep.assert_called_once()  # Should have slept for backoff
-
-    @patch("urllib.request.urlopen")
-    def test_post_max_retries_exceeded(self, mock_urlopen: Mock) -> None:
-        """Test POST request exceeding max retries."""
-        headers = EmailMessage()
-        mock_urlopen.side_effect = urllib.error.HTTPError(
-            "http://test.com", 429, "Too Many Requests", headers, None
-        )
+    def test_post_max_retries_exceeded(self) -> None:
+        """Test POST request still rate limited once the adapter gives up."""
+        with patch.object(self.translator._session, "post") as mock_post:
+            mock_post.return_value = _make_response(429)
 
-        with patch("time.sleep"):
             with self.assertRaises(RateLimitError):
                 getattr(self.translator, "_GoogleTranslator__post")(
                     "http://test.com", "test text"
                 )
 
-    @patch("urllib.request.urlopen")
-    def test_post_network_error(self, mock_urlopen: Mock) -> None:
+        mock_post.assert_called_once()
+
+    def test_post_server_error(self) -> None:
+        """Test POST request still failing with a 5xx after adapter retries."""
+        with patch.object(self.translator._session, "post") as mock_post:
+            mock_post.return_value = _make_response(503)
+
+            with self.assertRaises(TranslationError) as context_manager:
+                getattr(self.translator, "_GoogleTranslator__post")(
+                    "http://test.com", "test text"
+                )
+
+        self.assertNotIsInstance(context_manager.exception, RateLimitError)
+        mock_post.assert_called_once()
+
+    def test_post_network_error(self) -> None:
         """Test POST request with network error."""
-        mock_urlopen.side_effect = urllib.error.URLError("Network error")
+        with patch.object(self.translator._session, "post") as mock_post:
+            mock_post.side_effect = requests.ConnectionError("Network error")
 
-        with patch("time.sleep"):
-            with self.assertRaises(TranslationError):
+            with self.assertRaises(TranslationError) as context_manager:
                 getattr(self.translator, "_GoogleTranslator__post")(
                     "http://test.com", "test text"
                 )
 
-    @patch("urllib.request.urlopen")
-    def test_post_http_error(self, mock_urlopen: Mock) -> None:
+        self.assertIn("request failed", str(context_manager.exception))
+        mock_post.assert_called_once()
+
+    def test_post_http_error(self) -> None:
         """Test POST request with HTTP error (not rate limit)."""
-        headers = EmailMessage()
-        mock_urlopen.side_effect = urllib.error.HTTPError(
-            "http://test.com", 404, "Not Found", headers, None
-        )
+        with patch.object(self.translator._session, "post") as mock_post:
+            mock_post.return_value = _make_response(404)
 
-        with self.assertRaises(TranslationError):
-            getattr(self.translator, "_GoogleTranslator__post")(
-                "http://test.com", "test text"
-            )
+            with self.assertRaises(TranslationError):
+                getattr(self.translator, "_GoogleTranslator__post")(
+                    "http://test.com", "test text"
+                )
+
+        mock_post.assert_called_once()
 
-    @patch("requests.post")
+    @patch("requests.Session.post")
     def test_translate_with_api_success(self, mock_post: Mock) -> None:
         """Test translation with API key success."""
         mock_response = Mock()
@@ -232,7 +332,7 @@ class TestGoogleTranslator(unittest.TestCase):
 
         self.assertEqual(result, "Hola mundo")
 
-    @patch("requests.post")
+    @patch("requests.Session.post")
     def test_translate_with_api_rate_limit(self, mock_post: Mock) -> None:
         """Test translation with API key rate limit."""
         mock_response = Mock()
@@ -249,7 +349,7 @@ class TestGoogleTranslator(unittest.TestCase):
             # Should contain rate limit information in the error message
             self.assertIn("rate limited", str(context_manager.exception).lower())
 
-    @patch("requests.post")
+    @patch("requests.Session.post")
     def test_translate_with_api_server_error(self, mock_post: Mock) -> None:
         """Test translation with API server error."""
         mock_response = Mock()
@@ -265,7 +365,7 @@ class TestGoogleTranslator(unittest.TestCase):
                     "Hello world", "en", "es"
                 )
 
-    @patch("requests.post")
+    @patch("requests.Session.post")
     def test_translate_with_api_network_error(self, mock_post: Mock) -> None:
         """Test translation with API network error."""
         mock_post.side_effect = requests.RequestException("Network error")
@@ -288,6 +388,12 @@ class TestGoogleTranslator(unittest.TestCase):
             )("Hello world", "en", "es")
 
         self.assertEqual(result, '[["Hola mundo",null,null,null,null,null,null,[]]]')
+        url = mock_post.call_args.args[0]
+        self.assertTrue(
+            url.startswith("http://translate.google.com/translate_a/single?client=t")
+        )
+        self.assertIn("&sl=en&tl=es&", url)
+        self.assertTrue(url.endswith("&tk=814953.678685"))
 
     def test_translate_without_api_all_domains_fail(self) -> None:
         """Test translation without API when all domains fail."""
@@ -347,6 +453,70 @@ class TestGoogleTranslator(unittest.TestCase):
 
         self.assertEqual(result, "Hola mundo")
 
+    def test_translate_caches_results(self) -> None:
+        """Test that repeated translations are served from the cache."""
+        with patch.object(
+            self.translator, "_GoogleTranslator__translate"
+        ) as mock_translate:
+            mock_translate.return_value = '[[["Hola",null,null,null],null]]'
+
+            first = self.translator.translate("Hello", "en", "es")
+            second = self.translator.translate("Hello", "en", "es")
+            self.translator.translate("Hello", "en", "fr")
+
+        self.assertEqual(first, second)
+        self.assertEqual(mock_translate.call_count, 2)
+
+    def test_translate_cache_evicts_oldest(self) -> None:
+        """Test that the cache drops the least recently used entry."""
+        self.translator.cache_size = 2
+
+        with patch.object(
+            self.translator, "_GoogleTranslator__translate"
+        ) as mock_translate:
+            mock_translate.return_value = '[[["Hola",null,null,null],null]]'
+
+            for text in ("one", "two", "one", "three", "two"):
+                self.translator.translate(text, "en", "es")
+
+        # "two" was evicted by "three" and had to be fetched again
+        self.assertEqual(mock_translate.call_count, 4)
+
+    def test_translate_errors_are_not_cached(self) -> None:
+        """Test that failed translations are retried rather than cached."""
+        with patch.object(
+            self.translator, "_GoogleTranslator__translate"
+        ) as mock_translate:
+            mock_translate.side_effect = [
+                "invalid json",
+                '[[["Hola",null,null,null],null]]',
+            ]
+
+            with self.assertRaises(TranslationError):
+                self.translator.translate("Hello", "en", "es")
+            result = self.translator.translate("Hello", "en", "es")
+
+        self.assertEqual(result, "Hola")
+
+    def test_translate_uses_orjson_when_available(self) -> None:
+        """Test that responses are parsed with orjson when it is installed."""
+        fake_orjson = Mock()
+        fake_orjson.loads.return_value = [[["Hola", None], ["!", None], None]]
+
+        with (
+            patch.object(
+                self.translator, "_GoogleTranslator__translate"
+            ) as mock_translate,
+            patch("src.subtranslate.core.translation.ORJSON_AVAILABLE", True),
+            patch("src.subtranslate.core.translation.orjson", fake_orjson, create=True),
+        ):
+            mock_translate.return_value = "raw"
+
+            result = self.translator.translate("Hello!", "en", "es")
+
+        fake_orjson.loads.assert_called_once_with("raw")
+        self.assertEqual(result, "Hola!")
+
     def test_translate_json_decode_error(self) -> None:
         """Test translate with JSON decode error."""
         with patch.object(
@@ -402,6 +572,33 @@ class TestGoogleTranslator(unittest.TestCase):
         # Progress callback should be called
         self.assertTrue(len(progress_calls) > 0)
 
+    def test_translate_lines_progress_reports_text_so_far(self) -> None:
+        """Test that each progress report carries all text translated so far."""
+        text_list = ["A" * 2000, "B" * 2000, "C" * 2000]
+
+        for concurrency in (1, 4):
+            with self.subTest(concurrency=concurrency):
+                self.translator.concurrency = concurrency
+                progress_calls = []
+
+                def progress_callback(
+                    current: int, total: int, translated: str
+                ) -> None:
+                    progress_calls.append((current, total, translated))
+
+                with patch.object(self.translator, "translate") as mock_translate:
+                    mock_translate.side_effect = lambda text, *_: text[0].lower()
+
+                    result = self.translator.translate_lines(
+                        text_list, "en", "es", progress_callback
+                    )
+
+                self.assertEqual(result, "a\nb\nc\n")
+                self.assertEqual(
+                    progress_calls,
+                    [(1, 3, "a\n"), (2, 3, "a\nb\n"), (3, 3, "a\nb\nc\n")],
+                )
+
     def test_translate_lines_batching(self) -> None:
         """Test translate_lines with batching for large content."""
         # Create content that exceeds max_limited
@@ -415,21 +612,32 @@ class TestGoogleTranslator(unittest.TestCase):
         # Should call translate multiple times for batching
         self.assertGreater(mock_translate.call_count, 1)
 
-    def test_translate_lines_rate_limit_retry(self) -> None:
-        """Test translate_lines with rate limit retry."""
+    def test_translate_lines_rate_limit_not_retried(self) -> None:
+        """Test translate_lines doesn't add its own retry on top of the adapter's."""
         text_list = ["Hello"]
 
-        with patch.object(self.translator, "translate") as mock_translate, patch(
-            "time.sleep"
-        ) as mock_sleep:
+        with (
+            patch.object(self.translator, "translate") as mock_translate,
+            patch("time.sleep") as mock_sleep,
+        ):
+            mock_translate.side_effect = RateLimitError("Rate limited")
 
-            # First call raises rate limit, second succeeds
-            mock_translate.side_effect = [RateLimitError("Rate limited"), "Hola"]
+            # Re-raised as is so callers can back off and retry the whole text
+            with self.assertRaises(RateLimitError):
+                self.translator.translate_lines(text_list, "en", "es")
 
-            result = self.translator.translate_lines(text_list, "en", "es")
+        mock_translate.assert_called_once()
+        mock_sleep.assert_not_called()
 
-        mock_sleep.assert_called_once_with(30)  # Extended sleep for rate limit
-        self.assertIn("Hola", result)
+    def test_translate_rate_limit_not_wrapped(self) -> None:
+        """Test translate lets RateLimitError through unwrapped."""
+        with patch.object(
+            self.translator,
+            "_GoogleTranslator__translate",
+            side_effect=RateLimitError("Rate limited"),
+        ):
+            with self.assertRaises(RateLimitError):
+                self.translator.translate("Hello", "en", "es")
 
     def test_translate_lines_translation_error(self) -> None:
         """Test translate_lines with translation error."""
@@ -441,6 +649,95 @@ class TestGoogleTranslator(unittest.TestCase):
             with self.assertRaises(TranslationError):
                 self.translator.translate_lines(text_list, "en", "es")
 
+    def test_build_batches(self) -> None:
+        """Test that batches split at max_limited and skip blank batches."""
+        text_list = ["A" * 2000, "B" * 2000, "   ", "C"]
+
+        batches = self.translator._build_batches(text_list)
+
+        self.assertEqual(
+            batches,
+            [((0, 1), "A" * 2000), ((1, 4), "B" * 2000 + "\n   \nC")],
+        )
+
+    def test_build_batches_respects_limit(self) -> None:
+        """Test that joined batches never exceed max_limited unless one line does."""
+        text_list = ["x" * 999] * 10 + ["y" * 5000, "z"]
+
+        batches = self.translator._build_batches(text_list)
+
+        self.assertEqual(
+            [bounds for bounds, _ in batches],
+            [(0, 3), (3, 6), (6, 9), (9, 10), (10, 11), (11, 12)],
+        )
+        for (start, end), batch in batches:
+            self.assertEqual(batch, "\n".join(text_list[start:end]))
+            if end - start > 1:
+                self.assertLessEqual(len(batch), self.translator.max_limited)
+
+    def test_translate_lines_concurrent_batches_keep_order(self) -> None:
+        """Test that concurrently translated batches are joined in order."""
+        text_list = [letter * 2000 for letter in "ABCDE"]
+        progress_calls = []
+
+        def fake_translate(batch: str, _src: str, _target: str) -> str:
+            return batch[0].lower()
+
+        with patch.object(self.translator, "translate", side_effect=fake_translate):
+            result = self.translator.translate_lines(
+                text_list,
+                "en",
+                "es",
+                lambda current, total, _text: progress_calls.append((current, total)),
+            )
+
+        self.assertEqual(result, "a\nb\nc\nd\ne\n")
+        self.assertEqual(progress_calls, [(1, 5), (2, 5), (3, 5), (4, 5), (5, 5)])
+
+    def test_translate_lines_concurrent_error(self) -> None:
+        """Test that a failing batch fails translate_lines when run concurrently."""
+        text_list = ["A" * 2000, "B" * 2000]
+
+        with patch.object(self.translator, "translate") as mock_translate:
+            mock_translate.side_effect = ["a", TranslationError("Translation failed")]
+
+            with self.assertRaises(TranslationError):
+                self.translator.translate_lines(text_list, "en", "es")
+
+    def test_translate_lines_workers_capped_to_pool(self) -> None:
+        """Test that concurrent workers never outnumber pooled connections."""
+        self.translator.concurrency = 32
+        text_list = ["A" * 3000] * 20
+
+        with (
+            patch.object(self.translator, "translate", return_value="a"),
+            patch(
+                "src.subtranslate.core.translation.ThreadPoolExecutor",
+                wraps=ThreadPoolExecutor,
+            ) as mock_executor,
+        ):
+            self.translator.translate_lines(text_list, "en", "es")
+
+        mock_executor.assert_called_once_with(
+            max_workers=GoogleTranslator._POOL_MAXSIZE
+        )
+
+    def test_translate_lines_sequential(self) -> None:
+        """Test that concurrency=1 translates batches in turn without fixed pauses."""
+        self.translator.concurrency = 1
+        text_list = ["A" * 2000, "B" * 2000]
+
+        with (
+            patch.object(self.translator, "translate") as mock_translate,
+            patch("time.sleep") as mock_sleep,
+        ):
+            mock_translate.side_effect = ["a", "b"]
+
+            result = self.translator.translate_lines(text_list, "en", "es")
+
+        self.assertEqual(result, "a\nb\n")
+        mock_sleep.assert_not_called()
+
 
 class TestGetTranslator(unittest.TestCase):
     """Tests for the get_translator factory function."""
@@ -459,6 +756,13 @@ class TestGetTranslator(unittest.TestCase):
         self.assertIsInstance(translator, GoogleTranslator)
         self.assertEqual(translator.api_key, "test_key")  # type: ignore[attr-defined]
 
+    def test_get_google_translator_warmup(self) -> None:
+        """Test that get_translator passes warmup through to the translator."""
+        with patch("threading.Thread") as mock_thread:
+            get_translator("google", warmup=True)
+
+        mock_thread.return_value.start.assert_called_once()
+
     def test_get_google_translator_case_insensitive(self) -> None:
         """Test getting Google translator case insensitive."""
         translator = get_translator("GOOGLE")